@@ -0,0 +1,267 @@
+"""Tarama ve silme hızı için tekrarlanabilir ölçüm düzeneği.
+
+Geçici bir klasörde temp / tarayıcı önbelleği benzeri yapay ağaçlar üretir
+ve her senaryo için şu aşamaları ayrı bir süreçte ölçer:
+
+    scan           silmeden tarama (kuru çalıştırma planı)
+    analyze_cold   boş boyut diziniyle disk analizi
+    analyze_warm   dolu boyut diziniyle tekrar analiz
+    clean          tüm kategorilerle tam temizlik
+    snapshot_clean analizin tarama sonucuyla (ScanSnapshot) temizlik
+
+Temizlik aşamalarının süresine, değiştirilip arka planda silinen önbellek
+klasörlerinin (mezar taşları) silinmesi de dahildir.
+
+Windows yolları ortam değişkenleriyle (TEMP, TMP, USERPROFILE, SystemRoot,
+LOCALAPPDATA) geçici klasöre yönlendirilir; Linux'ta da çalışır. Sonuçlar
+JSON olarak yazılır; --compare ile önceki bir çalıştırmayla karşılaştırılır.
+
+Sistem çağrıları os.* düzeyinde sayılır (scandir, stat, lstat, unlink,
+rmdir, ...). Linux'ta DirEntry.stat() da bir çağrıdır ama sayılamaz;
+Windows'ta bu bilgi scandir'den önbellekli gelir.
+
+Kullanım:
+    python benchmarks/harness.py --scale 1 --output sonuc.json
+    python benchmarks/harness.py --scenario firefox_cache2 --compare sonuc.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+PHASES = ['scan', 'analyze_cold', 'analyze_warm', 'clean', 'snapshot_clean']
+COUNTED_CALLS = ['scandir', 'listdir', 'stat', 'lstat', 'unlink', 'remove', 'rmdir', 'rename', 'mkdir']
+
+def fake_environment(root):
+    """Windows klasörlerinin root altındaki karşılıkları"""
+    profile = os.path.join(root, 'Users', 'bench')
+    temp = os.path.join(profile, 'AppData', 'Local', 'Temp')
+    return {
+        'SystemRoot': os.path.join(root, 'Windows'),
+        'USERPROFILE': profile,
+        'TEMP': temp,
+        'TMP': temp,
+        'LOCALAPPDATA': os.path.join(root, 'state'),
+    }
+
+def write_files(folder, count, size, prefix='f'):
+    os.makedirs(folder, exist_ok=True)
+    payload = b'x' * size
+    for i in range(count):
+        with open(os.path.join(folder, f'{prefix}{i:06d}'), 'wb') as f:
+            f.write(payload)
+    return count, count * size
+
+def build_tiny_files(env, scale):
+    """Çok sayıda küçük dosya: kullanıcı temp klasörü"""
+    files = total = 0
+    for d in range(40 * scale):
+        count, size = write_files(os.path.join(env['TEMP'], f'setup{d:04d}'), 500, 1024)
+        files += count
+        total += size
+    return files, total
+
+def build_deep_nesting(env, scale):
+    """Derin iç içe klasörler: sistem temp klasörü"""
+    files = total = 0
+    for chain in range(20 * scale):
+        folder = os.path.join(env['SystemRoot'], 'Temp', f'chain{chain:03d}')
+        for depth in range(40):
+            folder = os.path.join(folder, f'd{depth:02d}')
+            count, size = write_files(folder, 5, 256)
+            files += count
+            total += size
+    return files, total
+
+def build_huge_files(env, scale):
+    """Birkaç büyük (seyrek) dosya: Windows Update indirmeleri"""
+    folder = os.path.join(env['SystemRoot'], 'SoftwareDistribution', 'Download')
+    os.makedirs(folder, exist_ok=True)
+    size = 512 * 1024 * 1024
+    for i in range(4 * scale):
+        with open(os.path.join(folder, f'update{i:02d}.cab'), 'wb') as f:
+            f.truncate(size)
+    prefetch_dir = os.path.join(env['SystemRoot'], 'Prefetch')
+    os.makedirs(prefetch_dir, exist_ok=True)
+    prefetch = 0
+    for i in range(200 * scale):
+        with open(os.path.join(prefetch_dir, f'APP{i:04d}.EXE-1234ABCD.pf'), 'wb') as f:
+            f.write(b'p' * 4096)
+        prefetch += 4096
+    return 4 * scale + 200 * scale, 4 * scale * size + prefetch
+
+def build_firefox_cache2(env, scale):
+    """Firefox Profiles/*/cache2 ve Chrome Default/Cache düzeni"""
+    local = os.path.join(env['USERPROFILE'], 'AppData', 'Local')
+    files = total = 0
+    for profile in range(3):
+        cache2 = os.path.join(local, 'Mozilla', 'Firefox', 'Profiles', f'abc{profile}.default', 'cache2')
+        count, size = write_files(os.path.join(cache2, 'entries'), 3000 * scale, 8 * 1024, prefix='')
+        files += count
+        total += size
+        count, size = write_files(os.path.join(cache2, 'doomed'), 50, 1024)
+        files += count
+        total += size
+    chrome = os.path.join(local, 'Google', 'Chrome', 'User Data', 'Default', 'Cache', 'Cache_Data')
+    count, size = write_files(chrome, 5000 * scale, 4 * 1024, prefix='data_')
+    return files + count, total + size
+
+BUILDERS = {
+    'tiny_files': [build_tiny_files],
+    'deep_nesting': [build_deep_nesting],
+    'huge_files': [build_huge_files],
+    'firefox_cache2': [build_firefox_cache2],
+    'mixed': [build_tiny_files, build_deep_nesting, build_huge_files, build_firefox_cache2],
+}
+
+def build_scenario(scenario, root, scale):
+    env = fake_environment(root)
+    os.makedirs(env['LOCALAPPDATA'], exist_ok=True)
+    os.makedirs(env['TEMP'], exist_ok=True)
+    files = total = 0
+    for builder in BUILDERS[scenario]:
+        count, size = builder(env, scale)
+        files += count
+        total += size
+    return env, files, total
+
+def count_calls():
+    """os.* dosya sistemi çağrılarını sayan sarmalayıcılar kur"""
+    counter = {'calls': 0}
+
+    def wrap(func):
+        def counted(*args, **kwargs):
+            counter['calls'] += 1
+            return func(*args, **kwargs)
+        return counted
+
+    for name in COUNTED_CALLS:
+        setattr(os, name, wrap(getattr(os, name)))
+    return counter
+
+def peak_rss_kb():
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == 'darwin' else peak
+    except ImportError:
+        import psutil
+        return psutil.Process().memory_info().peak_wset // 1024
+
+def run_phase(phase):
+    """Alt süreçte tek bir aşamayı çalıştır (ortam zaten yönlendirilmiş)"""
+    from fastertale import Cleaner, DiskAnalyzer, SizeIndex
+
+    options = {'temp_files': True, 'prefetch': True, 'browser_cache': True,
+               'software_distribution': True}
+    index = SizeIndex()
+    analyzer = DiskAnalyzer(size_index=index, keep_snapshot=phase == 'snapshot_clean')
+    if phase in ('analyze_warm', 'snapshot_clean'):
+        for _, path in analyzer.analysis_locations():
+            analyzer.get_folder_size(path)
+
+    counter = count_calls()
+    start = time.perf_counter()
+    if phase == 'scan':
+        summary = Cleaner(options, retention_rules={}).build_plan().summary()['total']
+        files, size = summary['count'], summary['freed']
+    elif phase in ('analyze_cold', 'analyze_warm'):
+        files = size = 0
+        for _, path in analyzer.analysis_locations():
+            folder_size, folder_files = analyzer.get_folder_size(path)
+            files += folder_files
+            size += folder_size
+    else:
+        cleaner = Cleaner(options, retention_rules={}, snapshot=analyzer.snapshot)
+        results = cleaner.perform_cleaning()
+        if cleaner.purge_thread is not None:
+            # Değiştirilen önbellek klasörlerinin silinmesi de ölçüme dahil
+            cleaner.purge_thread.join()
+            cleaner.merge_purged(results)
+        files, size = results['total']['count'], results['total']['freed']
+    seconds = time.perf_counter() - start
+
+    return {'seconds': seconds, 'files': files, 'bytes': size, 'syscalls': counter['calls'],
+            'peak_rss_kb': peak_rss_kb()}
+
+def measure(scenario, phase, scale):
+    root = tempfile.mkdtemp(prefix='fastertale-bench-')
+    try:
+        env, expected_files, expected_bytes = build_scenario(scenario, root, scale)
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--run-phase', phase],
+                                env=dict(os.environ, **env), capture_output=True, text=True, check=True)
+        result = json.loads(output.stdout)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    seconds = max(result['seconds'], 1e-9)
+    result.update({
+        'scenario': scenario,
+        'phase': phase,
+        'expected_files': expected_files,
+        'expected_bytes': expected_bytes,
+        'files_per_s': result['files'] / seconds,
+        'mb_per_s': result['bytes'] / seconds / (1024 * 1024),
+    })
+    return result
+
+def compare(current, previous):
+    """Aynı senaryo/aşama için süre oranlarını yaz (<1 = hızlandı)"""
+    old = {(r['scenario'], r['phase']): r for r in previous['results']}
+    for result in current['results']:
+        before = old.get((result['scenario'], result['phase']))
+        if before:
+            ratio = result['seconds'] / max(before['seconds'], 1e-9)
+            print(f"{result['scenario']:15} {result['phase']:14} {before['seconds']:8.3f} s -> "
+                  f"{result['seconds']:8.3f} s  x{ratio:.2f}", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenario', choices=sorted(BUILDERS), action='append',
+                        help="Sadece bu senaryo(lar) (varsayılan: hepsi)")
+    parser.add_argument('--phase', choices=PHASES, action='append', help="Sadece bu aşama(lar)")
+    parser.add_argument('--scale', type=int, default=1, help="Dosya sayısı çarpanı")
+    parser.add_argument('--output', metavar='DOSYA', help="JSON sonucunu dosyaya yaz (varsayılan: stdout)")
+    parser.add_argument('--compare', metavar='DOSYA', help="Önceki JSON sonucuyla karşılaştır")
+    parser.add_argument('--run-phase', choices=PHASES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_phase:
+        print(json.dumps(run_phase(args.run_phase)))
+        return
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scale': args.scale,
+        'results': [],
+    }
+    for scenario in args.scenario or sorted(BUILDERS):
+        for phase in args.phase or PHASES:
+            result = measure(scenario, phase, args.scale)
+            report['results'].append(result)
+            print(f"{scenario:15} {phase:14} {result['seconds']:8.3f} s  {result['files_per_s']:10.0f} dosya/s  "
+                  f"{result['mb_per_s']:10.1f} MB/s  {result['syscalls']:8d} çağrı  "
+                  f"{result['peak_rss_kb']:7d} KB", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(report, json.load(f))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""ScanSnapshot envanterinin dosya başına bellek kullanımı ve toplama süreleri.
+
+Diske dokunmadan gerçekçi adlarla (Firefox cache2 karma adları, Chrome
+önbellek dosyaları, temp dosyaları) yapay bir envanter doldurur; tracemalloc
+ile ölçülen bellek dosya başına --budget baytı aşarsa 1 ile çıkar.
+
+Kullanım:
+    python benchmarks/inventory_memory.py --files 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastertale.snapshot import ScanSnapshot, _numpy
+
+def fill(snapshot, files, files_per_dir=200):
+    """Üç tür önbellek düzenini sırayla ekle"""
+    rng = random.Random(42)
+    now = time.time()
+    root = snapshot.add_dir(os.path.abspath('bench-root'), -1, 0)
+    snapshot.end_dir()
+    added = 0
+    kinds = ('cache2', 'Cache_Data', 'Temp')
+    while added < files:
+        kind = kinds[(added // files_per_dir) % len(kinds)]
+        folder = snapshot.add_dir(kind, root, 0)
+        for i in range(min(files_per_dir, files - added)):
+            if kind == 'cache2':
+                name = '%040X' % rng.getrandbits(160)
+            elif kind == 'Cache_Data':
+                name = 'f_%06x' % (added + i)
+            else:
+                name = '~DF%04X.tmp' % rng.getrandbits(16)
+            snapshot.add_file(folder, name, rng.randrange(1, 1 << 20), now - rng.randrange(0, 400 * 86400))
+        snapshot.end_dir()
+        added += files_per_dir
+    return snapshot
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=1_000_000)
+    parser.add_argument('--budget', type=float, default=60.0, help="Dosya başına bayt sınırı")
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    snapshot = fill(ScanSnapshot(), args.files)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_file = current / len(snapshot)
+    print(f"Dosya: {len(snapshot)}  klasör: {snapshot.dir_count()}")
+    print(f"Bellek: {current / 1024 / 1024:.1f} MB ({per_file:.1f} B/dosya), "
+          f"tepe {peak / 1024 / 1024:.1f} MB, sütunlar {snapshot.nbytes() / len(snapshot):.1f} B/dosya")
+    print(f"NumPy: {'var' if _numpy() else 'yok (saf Python)'}")
+    print(f"Klasör toplamları: {timed(snapshot.dir_totals):.1f} ms")
+    print(f"En büyük 100 dosya: {timed(snapshot.largest_files, 100):.1f} ms")
+    print(f"Yaş dağılımı:       {timed(snapshot.age_histogram):.1f} ms")
+
+    if per_file > args.budget:
+        print(f"Sınır aşıldı: {per_file:.1f} > {args.budget} B/dosya", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Paralel silme motoru için hız ölçümü.
+
+Geçici bir klasörde çok sayıda küçük dosyadan oluşan yapay bir ağaç üretir ve
+ParallelDeleter ile farklı iş parçacığı sayılarında siler. Her çalıştırmada
+silinen bayt ve dosya sayısının beklenenle aynı olduğu da doğrulanır.
+
+Kullanım:
+    python benchmarks/parallel_delete.py --files 500000 --workers 1 4 8 16
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastertale.engine import ParallelDeleter
+
+
+def build_tree(root, file_count, files_per_dir=1000, file_size=512):
+    """root altında file_count adet küçük dosya oluştur, toplam boyutu döndür"""
+    payload = b'x' * file_size
+    created = 0
+    dir_index = 0
+    while created < file_count:
+        # İki seviyeli iç içe yapı: gerçek temp/cache klasörlerine benzer
+        folder = os.path.join(root, f'd{dir_index // 32:04d}', f'{dir_index % 32:02d}')
+        os.makedirs(folder, exist_ok=True)
+        for i in range(min(files_per_dir, file_count - created)):
+            with open(os.path.join(folder, f'f{i:05d}.tmp'), 'wb') as f:
+                f.write(payload)
+        created += min(files_per_dir, file_count - created)
+        dir_index += 1
+    return created * file_size
+
+
+def run(file_count, workers):
+    with tempfile.TemporaryDirectory(prefix='fastertale-bench-') as root:
+        expected_bytes = build_tree(root, file_count)
+
+        deleter = ParallelDeleter(workers)
+        start = time.perf_counter()
+        deleter.add_tree('bench', root)
+        deleter.wait()
+        elapsed = time.perf_counter() - start
+        deleter.shutdown()
+
+        result = deleter.results['bench']
+        # Atlanan dosya olmamalı (skipped / skipped_bytes da sonuçta yer alır)
+        ok = (result['freed'] == expected_bytes and result['count'] == file_count
+              and result['skipped'] == 0 and not os.listdir(root))
+        return elapsed, ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=500000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    baseline = None
+    for workers in args.workers:
+        elapsed, ok = run(args.files, workers)
+        baseline = baseline or elapsed
+        print(f"workers={workers:<3} {elapsed:8.2f} s  {args.files / elapsed:10.0f} dosya/s  "
+              f"hızlanma x{baseline / elapsed:.2f}  {'OK' if ok else 'HATALI SONUÇ'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Açılışta içe aktarılan modüllerin süresi (python -X importtime).
+
+fastertale paketini ve (PyQt5 kuruluysa) vesaire arayüzünü ayrı bir
+Python sürecinde içe aktarır, en pahalı modülleri listeler. Toplam süre
+--budget milisaniyeyi aşarsa ya da açılışta yüklenmemesi gereken ağır bir
+modül (psutil, multiprocessing, NumPy...) içe aktarılmışsa 1 ile çıkar.
+
+Kullanım:
+    python benchmarks/startup_imports.py --budget 150
+"""
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Sadece ilgili işlem başlayınca yüklenmesi gereken modüller
+FORBIDDEN = ('psutil', 'multiprocessing', 'concurrent.futures.process', 'logging.handlers', 'numpy', 'sqlite3')
+
+def import_times(module):
+    """{modül: kümülatif mikrosaniye} - temiz bir süreçte tek içe aktarma"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        try:
+            times[parts[2].strip()] = int(parts[1])
+        except (IndexError, ValueError):
+            # Başlık satırı
+            continue
+    return times
+
+def measure(module, repeat):
+    """En hızlı tekrarın süreleri; ilk çalıştırmanın disk önbelleği etkisi elenir"""
+    runs = [import_times(module) for _ in range(repeat)]
+    return min(runs, key=lambda times: times.get(module, 0))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget', type=float, default=150.0, help="Modül başına ms sınırı")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    modules = ['fastertale']
+    if importlib.util.find_spec('PyQt5') is not None:
+        modules.append('vesaire')
+    else:
+        print("PyQt5 kurulu değil; vesaire ölçülmedi")
+
+    failed = False
+    for module in modules:
+        times = measure(module, args.repeat)
+        total = times.get(module, 0) / 1000
+        print(f"{module}: {total:.1f} ms")
+        for name, elapsed in sorted(times.items(), key=lambda item: item[1], reverse=True)[1:args.top + 1]:
+            print(f"  {elapsed / 1000:8.1f} ms  {name}")
+        heavy = [name for name in FORBIDDEN if name in times]
+        if heavy:
+            print(f"Açılışta yüklenmemeli: {', '.join(heavy)}", file=sys.stderr)
+            failed = True
+        if total > args.budget:
+            print(f"Sınır aşıldı: {module} {total:.1f} > {args.budget} ms", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
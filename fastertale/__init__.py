@@ -0,0 +1,16 @@
+"""FasterTale temizlik çekirdeği.
+
+PyQt5 gerektirmez; arayüz (vesaire.py) ve komut satırı (python -m fastertale)
+aynı çekirdeği kullanır.
+"""
+from .analyzer import DiskAnalyzer
+from .cleaner import Cleaner
+from .engine import (DEFAULT_DELETE_WORKERS, CleaningControl, ParallelDeleter, delete_entry,
+                     delete_path, purge_directory)
+from .index import SizeIndex
+from .metrics import MetricsRecorder, default_metrics_path
+from .plan import DeletionPlan
+from .recycle import FolderRecycleBin, ShellRecycleBin
+from .snapshot import ScanSnapshot
+from .targets import CATEGORIES, TARGETS, Target, default_roots
+from .utils import format_size, is_admin
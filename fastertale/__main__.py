@@ -0,0 +1,7 @@
+import sys
+
+from .cli import main
+
+# Süreç havuzu (yinelenen dosya özetleri) Windows'ta bu modülü yeniden yükler
+if __name__ == '__main__':
+    sys.exit(main())
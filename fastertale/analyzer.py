@@ -0,0 +1,313 @@
+"""Disk alanı analizi"""
+import heapq
+import os
+import time
+
+from .duplicates import DEFAULT_MIN_SIZE, find_duplicates
+from .engine import _is_real_dir
+from .progress import Message
+from .recycle import ShellRecycleBin
+from .snapshot import ScanSnapshot
+from .targets import TARGETS, default_roots, resolve_targets
+from .utils import format_size
+
+# En büyük klasörlerde, boyutunun bu kadarı tek bir alt klasörde olan klasör
+# listelenmez; yer kaplayan o alt klasördür (ör. C:\Users -> profil)
+DOMINANT_CHILD_SHARE = 0.9
+
+class DiskAnalyzer:
+    """Disk kullanım analizi - Qt'ye bağımlı değildir.
+
+    Temizlikle aynı hedef kayıt defterini kullanır; roots ve targets
+    verilmezse targets.default_roots() ve targets.TARGETS kullanılır.
+    keep_snapshot=True ise tarama sonucu self.snapshot'ta (ScanSnapshot)
+    saklanır ve Cleaner'a verilebilir. Bunun bedeli her klasörün tam
+    taranmasıdır: boyut dizini sadece klasör toplamlarını tuttuğu için
+    değişmemiş alt ağaçlar atlanamaz. Sadece boyut gerekiyorsa
+    keep_snapshot=False ile boyut dizininin artımlı taraması kullanılır;
+    anlık görüntü, dosya listesi ya da hemen ardından gelecek bir temizlik
+    için build_snapshot() ile ayrıca çıkarılır. Geri dönüşüm kutusunun klasörleri
+    okunamazsa boyutu recycle_bin'den (varsayılan kabuk API'si) sorgulanır.
+    """
+
+    def __init__(self, progress_callback=None, size_index=None, roots=None, targets=None,
+                 keep_snapshot=False, recycle_bin=None):
+        self.progress_callback = progress_callback
+        self.size_index = size_index
+        self.roots = default_roots() if roots is None else roots
+        self.targets = TARGETS if targets is None else targets
+        # keep_snapshot: klasörler tam taranır ve sonuç temizlikte yeniden kullanılır
+        self.snapshot = ScanSnapshot() if keep_snapshot else None
+        self.recycle_bin = recycle_bin or ShellRecycleBin()
+
+    def report(self, value, message):
+        """İlerlemeyi (varsa) geri çağırma işlevine ilet"""
+        if self.progress_callback is not None:
+            self.progress_callback(value, message)
+
+    def analysis_locations(self):
+        """Analiz edilen (ad, yol) çiftleri; bir hedefin birden çok klasörü olabilir"""
+        return [(target.name, folder) for target, folder in resolve_targets(self.targets, self.roots)]
+
+    def analyze_disk_space(self):
+        """Disk kullanımını analiz et"""
+        analysis = {}
+        
+        # Hedef klasörlerin analizi (hedef başına toplanır)
+        locations = self.analysis_locations()
+        folders = {}
+        
+        for i, (name, path) in enumerate(locations):
+            size, count = self.get_folder_size(path)
+            data = analysis.setdefault(name, {'size': 0, 'count': 0})
+            data['size'] += size
+            data['count'] += count
+            folders.setdefault(name, []).append(path)
+            progress = 100 * (i + 1) // len(locations)
+            self.report(progress, Message("{} analiz ediliyor...", name))
+
+        self.query_recycle_bin(analysis, folders)
+
+        for name, data in analysis.items():
+            data['size_str'] = format_size(data['size'])
+            try:
+                data['path'] = os.path.commonpath(folders[name])
+            except ValueError:
+                # Farklı sürücülerdeki klasörler
+                data['path'] = folders[name][0]
+        
+        # Disk bilgileri (psutil sadece burada gerekir, başlangıcı yavaşlatmasın)
+        import psutil
+
+        disk_info = {}
+        for partition in psutil.disk_partitions():
+            try:
+                usage = psutil.disk_usage(partition.mountpoint)
+                disk_info[partition.device] = {
+                    'total': usage.total,
+                    'used': usage.used,
+                    'free': usage.free,
+                    'percent': usage.percent
+                }
+            except PermissionError:
+                continue
+        
+        analysis['disk_info'] = disk_info
+        return analysis
+
+    def query_recycle_bin(self, analysis, folders):
+        """Kutunun klasörleri taranamadıysa boyutunu kabuk API'sinden ekle"""
+        for target in self.targets:
+            if target.category != 'recycle_bin' or target.name in analysis:
+                continue
+            queried = self.recycle_bin.query()
+            if queried is not None:
+                analysis[target.name] = {'size': queried[0], 'count': queried[1]}
+                folders[target.name] = ['shell:RecycleBinFolder']
+            return
+
+    def largest_roots(self):
+        """En büyükler taraması için kökler: kullanıcı profili ve disk bölümleri"""
+        import psutil
+
+        roots = []
+        profile = self.roots.get('profile')
+        if profile and os.path.isdir(profile):
+            roots.append(profile)
+        for partition in psutil.disk_partitions():
+            if os.path.isdir(partition.mountpoint):
+                roots.append(partition.mountpoint)
+
+        # Başka bir kökün içinde kalan kök (ör. C:\ içindeki profil) iki kez taranmaz
+        unique = []
+        keys = []
+        for root in sorted((os.path.abspath(root) for root in roots), key=len):
+            key = os.path.normcase(root)
+            if not any(key == parent or key.startswith(os.path.join(parent, '')) for parent in keys):
+                keys.append(key)
+                unique.append(root)
+        return unique
+
+    def find_largest(self, roots=None, count=50):
+        """En büyük dosya ve klasörleri tek geçişte bul.
+
+        Klasörler derinlik öncelikli gezilir; bir klasörün toplamı alt ağacı
+        bittiğinde kesinleşir ve ebeveynine eklenir. En büyükler count
+        boyutlu yığınlarda tutulur, bu yüzden bellek ağacın boyutuna değil
+        derinliğine bağlıdır. Bir kökün altındaki başka dosya sistemlerine
+        (POSIX bağlama noktaları) girilmez; Windows'ta junction'lar zaten atlanır.
+
+        Taranan kökler ve boyutunun çoğu tek bir alt klasörden gelen klasörler
+        (DOMINANT_CHILD_SHARE) klasör listesine alınmaz; böylece liste büyük
+        bir klasörün üst klasör zinciriyle dolmaz, en alttaki asıl klasör kalır.
+
+        {'files': [(boyut, yol)], 'dirs': [(boyut, dosya sayısı, yol)]} döndürür.
+        """
+        roots = self.largest_roots() if roots is None else roots
+        files = []
+        dirs = []
+        expected = self._used_bytes(roots)
+        seen_bytes = 0
+        last_report = 0.0
+
+        for root in roots:
+            try:
+                root_dev = os.stat(root).st_dev
+            except OSError:
+                continue
+            # Yığın çerçevesi: [yol, boyut, dosya sayısı, taranacak alt klasörler, en büyük alt klasör]
+            stack = [[root, 0, 0, None, 0]]
+            while stack:
+                frame = stack[-1]
+                if frame[3] is None:
+                    frame[3] = []
+                    frame_bytes = self._scan_largest(frame, files, count, root_dev)
+                    seen_bytes += frame_bytes
+                    now = time.monotonic()
+                    if now - last_report >= 0.2:
+                        last_report = now
+                        progress = min(99, seen_bytes * 100 // expected) if expected else 0
+                        self.report(progress, Message("Taranıyor: {}", frame[0]))
+                if frame[3]:
+                    stack.append([frame[3].pop(), 0, 0, None, 0])
+                    continue
+
+                # Alt ağaç bitti: klasörün toplamı kesin
+                stack.pop()
+                if not stack:
+                    # Kök klasör listelenmez
+                    continue
+                if frame[4] < DOMINANT_CHILD_SHARE * frame[1]:
+                    self._push_largest(dirs, count, (frame[1], frame[2], frame[0]))
+                parent = stack[-1]
+                parent[1] += frame[1]
+                parent[2] += frame[2]
+                parent[4] = max(parent[4], frame[1])
+
+        self.report(100, "En büyük dosya ve klasörler bulundu")
+        return {'files': sorted(files, reverse=True), 'dirs': sorted(dirs, reverse=True)}
+
+    @staticmethod
+    def _used_bytes(roots):
+        """İlerleme yüzdesi için köklerin bulunduğu disklerdeki kullanılan alan"""
+        import psutil
+
+        used = {}
+        for root in roots:
+            try:
+                usage = psutil.disk_usage(root)
+            except OSError:
+                continue
+            # Aynı diskteki kökler bir kez sayılır
+            used[(usage.total, usage.used)] = usage.used
+        return sum(used.values())
+
+    @staticmethod
+    def _push_largest(heap, count, item):
+        if len(heap) < count:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    def _scan_largest(self, frame, files, count, root_dev):
+        """Çerçevenin klasörünü listele; dosyaları say, alt klasörleri çerçeveye ekle"""
+        folder_bytes = 0
+        try:
+            with os.scandir(frame[0]) as entries:
+                for entry in entries:
+                    try:
+                        if _is_real_dir(entry):
+                            if os.name == 'nt' or entry.stat(follow_symlinks=False).st_dev == root_dev:
+                                frame[3].append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            size = entry.stat(follow_symlinks=False).st_size
+                            folder_bytes += size
+                            frame[2] += 1
+                            if len(files) < count or size > files[0][0]:
+                                self._push_largest(files, count, (size, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        frame[1] += folder_bytes
+        return folder_bytes
+
+    def find_duplicates(self, roots=None, min_size=DEFAULT_MIN_SIZE, max_workers=None):
+        """Köklerdeki (varsayılan: kullanıcı profili) yinelenen dosya grupları.
+
+        Kökler önce sütunlu bir envantere taranır, ardından duplicates
+        modülündeki boyut / kısmi özet / tam özet aşamaları uygulanır.
+        """
+        if roots is None:
+            profile = self.roots.get('profile')
+            roots = [profile] if profile else []
+        snapshot = ScanSnapshot()
+        for root in roots:
+            self.report(0, Message("Taranıyor: {}", root))
+            snapshot.add_root(root)
+        return find_duplicates(snapshot, min_size, max_workers, self.progress_callback)
+
+    def folder_children(self, folder_path):
+        """Klasörün doğrudan içeriği (ağaç görünümünde tembel açılım için).
+
+        [{'name', 'path', 'is_dir', 'size', 'count'}] döndürür; alt klasörlerin
+        boyutu measure_folder ile (varsa boyut diziniyle) hesaplanır.
+        """
+        children = []
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    try:
+                        if _is_real_dir(entry):
+                            size, count = self.measure_folder(entry.path)
+                            children.append({'name': entry.name, 'path': entry.path, 'is_dir': True,
+                                             'size': size, 'count': count})
+                        elif entry.is_file(follow_symlinks=False):
+                            children.append({'name': entry.name, 'path': entry.path, 'is_dir': False,
+                                             'size': entry.stat(follow_symlinks=False).st_size, 'count': 1})
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        children.sort(key=lambda child: child['size'], reverse=True)
+        return children
+
+    def build_snapshot(self):
+        """Analiz konumlarını tam tarayıp self.snapshot'a ekle (keep_snapshot=True gerekir)"""
+        locations = self.analysis_locations()
+        for i, (name, path) in enumerate(locations):
+            self.report(100 * i // len(locations), Message("Taranıyor: {}", path))
+            self.get_folder_size(path)
+        self.report(100, "Dosya listesi hazır")
+        return self.snapshot
+
+    def get_folder_size(self, folder_path):
+        """Klasör boyutunu ve dosya sayısını hesapla"""
+        if self.snapshot is not None:
+            size, count = self.snapshot.add_root(folder_path)
+            if self.size_index is not None and self.snapshot.root_range(folder_path) is not None:
+                # Tam tarama zaten yapıldı; boyut dizini de güncel kalsın
+                self.size_index.store(folder_path, self.snapshot.dir_rows(folder_path))
+            return size, count
+        return self.measure_folder(folder_path)
+
+    def measure_folder(self, folder_path):
+        """Anlık görüntüye eklemeden klasörün (boyut, dosya sayısı)"""
+        if self.size_index is not None:
+            return self.size_index.folder_size(folder_path)
+
+        total_size = 0
+        file_count = 0
+        try:
+            for dirpath, dirnames, filenames in os.walk(folder_path):
+                for filename in filenames:
+                    filepath = os.path.join(dirpath, filename)
+                    try:
+                        if os.path.isfile(filepath):
+                            total_size += os.path.getsize(filepath)
+                            file_count += 1
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return total_size, file_count
@@ -0,0 +1,115 @@
+"""Tarayıcı profillerinin önbellek klasörlerini bulur.
+
+Chromium tabanlı tarayıcılar (Chrome, Edge, Brave, Vivaldi, Opera) profil
+listesini 'User Data\\Local State' dosyasında (profile.info_cache) tutar;
+Firefox ise profiles.ini'de. Bu dosyalar bir kez okunur ve bulunan önbellek
+klasörleri süreç içinde saklanır. Yapılandırma dosyasının ya da profil
+klasörünün mtime'ı değişince (yeni profil, tarayıcı yeniden başladı) liste
+yeniden oluşturulur.
+
+Her önbellek klasörü ayrı bir hedef klasörüdür; silme motoru onları ayrı
+kökler olarak paralel işler.
+"""
+import configparser
+import glob
+import json
+import os
+import threading
+
+CHROMIUM_CACHE_DIRS = ('Cache', 'Code Cache', 'GPUCache', 'Service Worker/CacheStorage')
+FIREFOX_CACHE_DIRS = ('cache2', 'cache', 'thumbnails')
+
+_cache = {}
+_lock = threading.Lock()
+
+def _stamp(paths):
+    stamp = []
+    for path in paths:
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+def _cached(key, stamp_paths, compute):
+    """compute() sonucunu stamp_paths'in mtime'ları değişene kadar sakla"""
+    stamp = _stamp(stamp_paths)
+    with _lock:
+        hit = _cache.get(key)
+        if hit is not None and hit[0] == stamp:
+            return list(hit[1])
+    folders = compute()
+    with _lock:
+        _cache[key] = (stamp, folders)
+    return list(folders)
+
+def _existing(base, subdirs):
+    folders = [os.path.join(base, *subdir.split('/')) for subdir in subdirs]
+    return [folder for folder in folders if os.path.isdir(folder)]
+
+def chromium_profiles(user_data):
+    """Local State'teki profil klasörlerinin adları (Default, Profile 1, ...)"""
+    try:
+        with open(os.path.join(user_data, 'Local State'), 'r', encoding='utf-8') as f:
+            names = list(json.load(f)['profile']['info_cache'])
+    except (OSError, ValueError, KeyError, TypeError):
+        names = []
+    return names or ['Default']
+
+def chromium_cache_dirs(user_data, single_profile=False):
+    """Tüm profillerin önbellek klasörleri; single_profile ise (Opera) user_data profilin kendisidir"""
+    def compute():
+        profiles = [''] if single_profile else chromium_profiles(user_data)
+        return [folder for profile in profiles
+                for folder in _existing(os.path.join(user_data, profile), CHROMIUM_CACHE_DIRS)]
+
+    return _cached(('chromium', os.path.normcase(user_data), single_profile),
+                   [os.path.join(user_data, 'Local State'), user_data], compute)
+
+def firefox_profiles(roaming_dir):
+    """profiles.ini'deki (göreli mi, yol) çiftleri"""
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        with open(os.path.join(roaming_dir, 'profiles.ini'), 'r', encoding='utf-8') as f:
+            parser.read_file(f)
+    except (OSError, configparser.Error, UnicodeDecodeError):
+        return []
+    profiles = []
+    for section in parser.sections():
+        if section.startswith('Profile') and parser.has_option(section, 'Path'):
+            relative = parser.get(section, 'IsRelative', fallback='1') != '0'
+            profiles.append((relative, parser.get(section, 'Path')))
+    return profiles
+
+def firefox_cache_dirs(roaming_dir, local_dir):
+    """Firefox profillerinin önbellek klasörleri (önbellek Local altındaki eşinde durur)"""
+    def compute():
+        profiles = firefox_profiles(roaming_dir)
+        if profiles:
+            bases = [os.path.join(local_dir, *path.split('/')) if relative else path
+                     for relative, path in profiles]
+        else:
+            # profiles.ini yoksa ya da okunamıyorsa Profiles altındaki her klasör
+            bases = sorted(glob.glob(os.path.join(glob.escape(local_dir), 'Profiles', '*')))
+        return [folder for base in bases for folder in _existing(base, FIREFOX_CACHE_DIRS)]
+
+    return _cached(('firefox', os.path.normcase(roaming_dir), os.path.normcase(local_dir)),
+                   [os.path.join(roaming_dir, 'profiles.ini'), os.path.join(local_dir, 'Profiles')], compute)
+
+def chromium_discovery(root, user_data, single_profile=False):
+    """Target(discover=...) için: roots[root] altındaki user_data'nın profil önbellekleri"""
+    def discover(roots):
+        base = roots.get(root)
+        if not base:
+            return []
+        return chromium_cache_dirs(os.path.join(base, *user_data.split('/')), single_profile)
+
+    return discover
+
+def firefox_discovery(roots):
+    """Target(discover=...) için: Roaming'deki profiles.ini, Local'deki önbellekler"""
+    roaming = roots.get('appdata')
+    local = roots.get('local_appdata')
+    if not roaming or not local:
+        return []
+    return firefox_cache_dirs(os.path.join(roaming, 'Mozilla', 'Firefox'), os.path.join(local, 'Mozilla', 'Firefox'))
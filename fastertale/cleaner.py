@@ -0,0 +1,514 @@
+"""Temizleme kategorileri ve temizleme akışı"""
+import os
+import time
+
+from .engine import CleaningControl, ParallelDeleter, delete_path
+from .metrics import MetricsRecorder
+from .plan import PlanBuilder
+from .progress import Message, ProgressTracker
+from .recycle import ShellRecycleBin
+from .rules import DEFAULT_RULES, build_rules
+from .snapshot import LINK_MTIME, SnapshotEntry, SnapshotStat
+from .targets import CATEGORIES, TARGETS, default_roots, resolve_targets
+from .tombstone import find_tombstones, purge_later, swap_out
+from .utils import format_size, is_admin
+
+class Cleaner:
+    """Temizleme işlemleri - Qt'ye bağımlı değildir.
+
+    progress_callback(yüzde, mesaj) verilirse ilerleme ona bildirilir.
+    retention_rules verilmezse rules.DEFAULT_RULES kullanılır. roots ve targets
+    verilmezse targets.default_roots() ve targets.TARGETS kullanılır.
+    snapshot (DiskAnalyzer'ın ScanSnapshot'ı) verilirse kapsadığı kökler
+    yeniden listelenmeden temizlenir. duplicates (find_duplicates sonucu)
+    'duplicates' kategorisinde silinecek kopyaları belirler. metrics
+    (MetricsRecorder) aşama süreleri ve kategori ölçümlerini alır.
+    recycle_bin, kutunun klasörlerine erişilemediğinde kullanılan kabuk
+    API'sidir (varsayılan recycle.ShellRecycleBin).
+
+    swap=True hedefler (tarayıcı önbellekleri, Windows Update indirmeleri)
+    gerçek temizlikte mezar taşına taşınıp boş olarak yeniden açılır. Mezar
+    taşları temizlik bittikten sonra düşük öncelikli bir arka plan iş
+    parçacığında (self.purge_thread) silinir; sonuçta 'freed' yerine
+    'pending' altında, boyut dizininden ya da anlık görüntüden bilinen
+    boyutlarıyla raporlanır. Silme bitince gerçek boyut ve sayı 'purge'
+    ölçüm kaydı olarak yazılır, self.purged'e eklenir ve (varsa)
+    purge_callback(self.purged) çağrılır; merge_purged() bunları sonuca
+    katar. Önceki çalışmalardan kalan mezar taşları da aynı iş parçacığında
+    silinir ama sonuçlara eklenmez.
+
+    inspector (processes.ProcessInspector) verilirse sahibi uygulama çalışan
+    hedefler atlanır; self.deferred'e eklenir ve sonuçta
+    results['total']['deferred'] altında adlarıyla bildirilir.
+
+    low_priority=True ise silme iş parçacıkları arka plan önceliğinde
+    çalışır (otomatik temizlik); süreç ve arayüz önceliği değişmez.
+    """
+
+    def __init__(self, cleaning_options, max_workers=None, progress_callback=None, size_index=None,
+                 retention_rules=None, roots=None, targets=None, snapshot=None, duplicates=None,
+                 metrics=None, recycle_bin=None, inspector=None):
+        self.cleaning_options = cleaning_options
+        self.max_workers = max_workers
+        self.progress_callback = progress_callback
+        self.size_index = size_index
+        self.retention_rules = DEFAULT_RULES if retention_rules is None else retention_rules
+        self.rules = {}
+        self.roots = default_roots() if roots is None else roots
+        self.targets = TARGETS if targets is None else targets
+        self.snapshot = snapshot
+        self.duplicates = duplicates or []
+        self.snapshot_roots = []
+        self.listed_bytes = 0
+        self.listed_files = 0
+        self.prune_dirs = []
+        self.control = CleaningControl()
+        self.deleter = None
+        self.metrics = metrics or MetricsRecorder()
+        self.recycle_bin = recycle_bin or ShellRecycleBin()
+        self.recycle_folders = []
+        self.swapping = False
+        self.swapped = []
+        self.tombstones = []
+        self.pending = {}
+        self.purged = {}
+        self.purge_thread = None
+        self.purge_callback = None
+        self.inspector = inspector
+        self.deferred = []
+        self.low_priority = False
+
+    def report(self, value, message):
+        """İlerlemeyi (varsa) geri çağırma işlevine ilet"""
+        if self.progress_callback is not None:
+            self.progress_callback(value, message)
+
+    def cancel(self):
+        """Temizliği durdur; o ana kadar silinenler sonuçlarda raporlanır"""
+        self.control.cancel()
+
+    def pause(self):
+        self.control.pause()
+
+    def resume(self):
+        self.control.resume()
+
+    def safe_delete(self, path):
+        """Güvenli silme işlemi - boyut ve sayı silinirken toplanır"""
+        return delete_path(path)
+
+    def clean_category(self, category, snapshot=None):
+        """Kategorinin kayıt defterindeki hedeflerini silme kuyruğuna ekle"""
+        for target, folder in resolve_targets(self.targets, self.roots, category):
+            if not self.control.checkpoint():
+                return
+            if self.inspector is not None:
+                processes = self.inspector.running(target, folder)
+                if processes:
+                    self.deferred.append((category, target, folder, processes))
+                    self.report(0, Message("Ertelendi (uygulama açık): {}", folder))
+                    continue
+            self.report(0, Message("Taranıyor: {}", folder))
+            entry_filter = target.entry_filter()
+            rule = self.rules.get(category)
+            if self.swapping and target.swap and target.recreate and entry_filter is None and rule is None:
+                tombstone = swap_out(folder)
+                if tombstone is not None:
+                    self.swapped.append(folder)
+                    self.tombstones.append((category, tombstone))
+                    # Silme arka planda; beklenen boyut önceki analizden bilinir (bilinmiyorsa 0),
+                    # gerçeği silme bitince record_purge() ile gelir
+                    size, count = self.known_size(folder, snapshot)
+                    pending = self.pending.setdefault(category, [0, 0])
+                    pending[0] += size
+                    pending[1] += count
+                    continue
+            if snapshot is not None and snapshot.root_range(folder) is not None:
+                self.schedule_snapshot(snapshot, category, folder, target.recreate, entry_filter, rule)
+            else:
+                self.deleter.add_tree(category, folder, keep_root=target.recreate,
+                                      entry_filter=entry_filter, rule=rule)
+
+    def known_size(self, folder, snapshot=None):
+        """Klasörün diske dokunmadan bilinen (boyut, sayı) değeri; anlık görüntü, yoksa boyut dizini"""
+        bounds = snapshot.root_range(folder) if snapshot is not None else None
+        if bounds is not None:
+            first_file = snapshot.dir_first_file[bounds[0]]
+            end_file = snapshot.dir_first_file[bounds[1]]
+            return sum(snapshot.file_size[first_file:end_file]), end_file - first_file
+        cached = self.size_index.cached_size(folder) if self.size_index is not None else None
+        return cached if cached is not None else (0, 0)
+
+    def schedule_snapshot(self, snapshot, category, folder, keep_root, entry_filter, rule):
+        """Anlık görüntüdeki ağacı yeniden listelemeden silme kuyruğuna ekle.
+
+        Her klasörün sadece mtime'ı kontrol edilir; değişmiş klasörler alt
+        ağaçlarıyla birlikte normal şekilde yeniden taranır. Boşalan klasörler
+        silme bittikten sonra prune_snapshot_dirs() ile kaldırılır.
+        """
+        first_dir, end_dir = snapshot.root_range(folder)
+        # Atlanan ya da yeniden taranan klasörler; altları anlık görüntüden alınmaz
+        skipped = set()
+        batch = []
+        self.snapshot_roots.append(folder)
+        for index in range(first_dir, end_dir):
+            if not self.control.checkpoint():
+                return
+            parent = snapshot.dir_parent[index]
+            if parent in skipped:
+                skipped.add(index)
+                continue
+            path = snapshot.dir_path(index)
+            mtime_ns = snapshot.dir_mtime[index]
+            if index != first_dir:
+                name = os.path.basename(path)
+                if parent == first_dir and entry_filter is not None \
+                        and not entry_filter(SnapshotEntry(name, path)):
+                    skipped.add(index)
+                    continue
+                if mtime_ns == LINK_MTIME:
+                    # Klasör bağlantısı: hedefe dokunmadan sadece bağlantı kaldırılır
+                    self.prune_dirs.append(path)
+                    continue
+                if rule is not None and not rule.allows_dir(name):
+                    skipped.add(index)
+                    continue
+
+            try:
+                changed = os.stat(path).st_mtime_ns != mtime_ns
+            except OSError:
+                # Klasör analizden sonra silinmiş
+                skipped.add(index)
+                continue
+            if changed:
+                skipped.add(index)
+                if index == first_dir:
+                    self.deleter.add_tree(category, folder, keep_root=keep_root,
+                                          entry_filter=entry_filter, rule=rule)
+                    return
+                self.deleter.add_tree(category, path, rule=rule)
+                self.prune_dirs.append(path)
+                continue
+
+            if index != first_dir or not keep_root:
+                self.prune_dirs.append(path)
+            for file_index in snapshot.dir_files(index):
+                name = snapshot.file_name(file_index)
+                file_path = os.path.join(path, name)
+                size = snapshot.file_size[file_index]
+                if index == first_dir and entry_filter is not None \
+                        and not entry_filter(SnapshotEntry(name, file_path)):
+                    continue
+                if rule is not None and not rule.allows_file(name, SnapshotStat(size, snapshot.file_mtime[file_index])):
+                    continue
+                batch.append((file_path, size))
+                self.listed_bytes += size
+                self.listed_files += 1
+                if len(batch) >= self.deleter.batch_size:
+                    self.deleter.add_files(category, batch)
+                    batch = []
+        if batch:
+            self.deleter.add_files(category, batch)
+
+    def prune_snapshot_dirs(self):
+        """Anlık görüntüden silinen klasörleri en derindekinden başlayarak kaldır"""
+        for folder_path in reversed(self.prune_dirs):
+            if self.control.cancelled:
+                break
+            try:
+                os.rmdir(folder_path)
+            except OSError:
+                pass
+
+    def clean_duplicates(self):
+        """Yinelenen dosyaların kopyalarını (korunan hariç) silme kuyruğuna ekle.
+
+        Bulunduklarından beri değişen kopyalar ve korunan dosyası artık
+        olmayan gruplar atlanır; aksi halde içeriğin tek kopyası silinebilir.
+        """
+        rule = self.rules.get('duplicates')
+        batch = []
+        for group in self.duplicates:
+            if not self.control.checkpoint():
+                return
+            try:
+                if os.stat(group.keep).st_size != group.size:
+                    continue
+            except OSError:
+                continue
+            for path, mtime in group.removable:
+                try:
+                    file_stat = os.stat(path)
+                except OSError:
+                    continue
+                if file_stat.st_size != group.size or int(file_stat.st_mtime) != mtime:
+                    continue
+                if rule is not None and not rule.allows_file(os.path.basename(path), file_stat):
+                    continue
+                batch.append((path, group.size))
+                self.listed_bytes += group.size
+                self.listed_files += 1
+                if len(batch) >= self.deleter.batch_size:
+                    self.deleter.add_files('duplicates', batch)
+                    batch = []
+        if batch:
+            self.deleter.add_files('duplicates', batch)
+
+    def clean_recycle_bin(self, snapshot=None):
+        """Geri dönüşüm kutusunu temizle.
+
+        Kutunun klasörleri okunabiliyorsa diğer hedefler gibi paralel motorla
+        silinir ve boyutu sonuçlara yansır; okunamıyorsa kabuk API'siyle
+        boşaltılır (boyut ve öğe sayısı boşaltmadan önce sorgulanır).
+        """
+        self.recycle_folders = [folder for _, folder in resolve_targets(self.targets, self.roots, 'recycle_bin')]
+        if self.recycle_folders:
+            self.clean_category('recycle_bin', snapshot)
+        else:
+            self.deleter.add_call('recycle_bin', self.empty_recycle_bin)
+
+    def empty_recycle_bin(self):
+        """Kutuyu kabuk API'siyle boşalt - (boyut, öğe sayısı) döndür"""
+        try:
+            return self.recycle_bin.empty()
+        except Exception as e:
+            self.metrics.error('recycle_bin', e)
+            return 0, 0
+
+    def estimate_totals(self):
+        """Kuyruktaki köklerin boyut dizinindeki ve listeden eklenen dosyaların (boyut, sayı) toplamı"""
+        estimate_bytes = self.listed_bytes
+        estimate_files = self.listed_files
+        if self.size_index is None:
+            return estimate_bytes, estimate_files
+        for root in self.deleter.roots:
+            cached = self.size_index.cached_size(root)
+            if cached is not None:
+                estimate_bytes += cached[0]
+                estimate_files += cached[1]
+        return estimate_bytes, estimate_files
+
+    def deferred_options(self):
+        """Ertelenen hedeflerin kategorileri, yeniden temizlik için seçenek sözlüğü olarak"""
+        return {category: True for category, _, _, _ in self.deferred}
+
+    def deferred_processes(self):
+        """Ertelenen hedefleri kullanan (tekrarsız) süreçler"""
+        processes = []
+        for _, _, _, running in self.deferred:
+            processes.extend(process for process in running if process not in processes)
+        return processes
+
+    def leftover_tombstones(self):
+        """Seçili kategorilerde önceki bir çalışmadan kalan mezar taşlarının yolları"""
+        folders = []
+        for category, _ in CATEGORIES:
+            if self.cleaning_options.get(category, False):
+                folders.extend(folder for target, folder in resolve_targets(self.targets, self.roots, category)
+                               if target.swap)
+        return find_tombstones(folders)
+
+    def schedule_categories(self, snapshot=None):
+        """Seçili kategorileri self.deleter'a (silme motoru ya da plan) ekle"""
+        # Yaş sınırları temizliğin başladığı ana göre hesaplanır
+        self.rules = build_rules(self.retention_rules)
+
+        for category, label in CATEGORIES:
+            if not self.cleaning_options.get(category, False) or not self.control.checkpoint():
+                continue
+            self.report(5, f"{label} temizleniyor...")
+            # Kuyruğa alma süresi; silme aynı anda havuzda başlamış olabilir
+            with self.metrics.phase('schedule', category=category, snapshot=snapshot is not None):
+                self.deleter.add_category(category)
+                if category == 'recycle_bin':
+                    self.clean_recycle_bin(snapshot)
+                elif category == 'duplicates':
+                    self.clean_duplicates()
+                else:
+                    self.clean_category(category, snapshot)
+
+    def perform_cleaning(self):
+        """Temizleme işlemini gerçekleştir"""
+        # Yönetici kontrolü
+        if not is_admin():
+            self.report(0, "Yönetici yetkisi yok - bazı işlemler atlanacak...")
+
+        # Eski anlık görüntüdeki dosya mtime'ları saklama kuralları için güvenilmez
+        snapshot = self.snapshot if self.snapshot is not None and self.snapshot.is_fresh() else None
+
+        self.metrics.start_run()
+        started = time.perf_counter()
+        self.deleter = ParallelDeleter(self.max_workers, control=self.control, low_priority=self.low_priority)
+        # Bu çalışmanın mezar taşlarıyla karışmamaları için kuyruğa almadan önce aranır
+        leftovers = self.leftover_tombstones()
+        self.swapping = True
+        try:
+            # Tüm kategoriler aynı havuza eklenir ve birlikte silinir
+            self.schedule_categories(snapshot)
+
+            # Toplam iş: boyut dizinindeki son analiz ya da taramada o ana kadar bulunan
+            estimate_bytes, estimate_files = self.estimate_totals()
+            tracker = ProgressTracker(self.report, start=5, end=95)
+            with self.metrics.phase('delete', workers=self.deleter.max_workers):
+                while not self.deleter.wait(tracker.interval):
+                    if self.control.paused:
+                        continue
+                    freed, count = self.deleter.totals()
+                    found_bytes, found_files = self.deleter.discovered()
+                    # Listeden (anlık görüntü, yinelenenler) kuyruğa alınan dosyalar taramada bulunmaz
+                    found_bytes += self.listed_bytes
+                    found_files += self.listed_files
+                    tracker.update(freed, count,
+                                   max(estimate_bytes, found_bytes), max(estimate_files, found_files))
+        finally:
+            self.swapping = False
+            self.deleter.shutdown()
+            with self.metrics.phase('prune', dirs=len(self.prune_dirs)):
+                self.prune_snapshot_dirs()
+            if self.recycle_folders:
+                # Klasörler doğrudan silindi; kabuk kutunun boşaldığını görsün
+                self.recycle_bin.refresh()
+            # Silinen ağaçların boyut dizinindeki kayıtları ve anlık görüntü artık geçersiz
+            self.snapshot = None
+            if self.size_index is not None:
+                with self.metrics.phase('index'):
+                    self.size_index.invalidate(self.deleter.roots + self.snapshot_roots + self.swapped)
+
+        try:
+            return self.finish_run(started)
+        finally:
+            if self.tombstones or leftovers:
+                # Mezar taşları sonuçları beklemeden, düşük öncelikle silinir; 'purge' ölçümleri
+                # temizliğin kayıtlarından sonra gelir. Temizlik hatayla biterse sonraki çalışmada silinir.
+                self.purge_thread = purge_later(self.tombstones + [(None, path) for path in leftovers],
+                                                self.record_purge)
+
+    def build_plan(self):
+        """Kuru çalıştırma: diske dokunmadan silinecekleri DeletionPlan olarak döndür"""
+        self.metrics.start_run()
+        self.deleter = PlanBuilder(self.control)
+        self.schedule_categories()
+        return self.deleter.plan
+
+    def execute_plan(self, plan):
+        """build_plan ile hazırlanmış planı yeniden taramadan aynen uygula"""
+        self.metrics.start_run()
+        started = time.perf_counter()
+        self.deleter = ParallelDeleter(self.max_workers, control=self.control, low_priority=self.low_priority)
+        try:
+            for category in plan.categories:
+                self.deleter.add_category(category)
+
+            batch = []
+            batch_category = None
+            for category, path, size in plan.iter_files():
+                if self.control.cancelled:
+                    break
+                if category != batch_category or len(batch) >= self.deleter.batch_size:
+                    if batch:
+                        self.deleter.add_files(batch_category, batch)
+                    batch = []
+                    batch_category = category
+                batch.append((path, size))
+            if batch:
+                self.deleter.add_files(batch_category, batch)
+
+            # Planın toplamı kesin olarak bilinir
+            total_bytes = sum(plan.file_size)
+            tracker = ProgressTracker(self.report, start=5, end=95)
+            with self.metrics.phase('delete', workers=self.deleter.max_workers, plan=True):
+                while not self.deleter.wait(tracker.interval):
+                    if self.control.paused:
+                        continue
+                    freed, count = self.deleter.totals()
+                    tracker.update(freed, count, total_bytes, len(plan))
+        finally:
+            self.deleter.shutdown()
+
+        with self.metrics.phase('prune'):
+            for folder_path in plan.iter_prune_dirs():
+                if self.control.cancelled:
+                    break
+                try:
+                    os.rmdir(folder_path)
+                except OSError:
+                    pass
+
+        if self.size_index is not None:
+            with self.metrics.phase('index'):
+                self.size_index.invalidate([root for _, root in plan.roots])
+
+        return self.finish_run(started)
+
+    def record_purge(self, totals):
+        """purge_later sonucu (mezar taşı iş parçacığında çağrılır): ölçümlere ve self.purged'e yaz"""
+        for category, (freed, count, seconds) in totals.items():
+            if category is None:
+                # Önceki çalışmalardan kalanlar bu temizliğin sonucu değildir
+                continue
+            self.purged[category] = (freed, count)
+            self.metrics.emit({'event': 'purge', 'category': category, 'freed': freed, 'count': count,
+                               'seconds': round(seconds, 4)})
+        if self.purge_callback is not None:
+            self.purge_callback(dict(self.purged))
+
+    def merge_purged(self, results, purged=None):
+        """Biten mezar taşı silmelerini ({kategori: (boyut, sayı)}, varsayılan self.purged) sonuca kat.
+
+        Her kategori bir kez katılmalıdır: 'pending' yerine 'freed' / 'count'.
+        """
+        total = results['total']
+        for category, (freed, count) in (self.purged if purged is None else purged).items():
+            data = results[category]
+            data['freed'] += freed
+            data['count'] += count
+            total['freed'] += freed
+            total['count'] += count
+            total['pending'] = total.get('pending', 0) - data.pop('pending', 0)
+            data.pop('pending_count', None)
+        if not total.get('pending'):
+            total.pop('pending', None)
+        return results
+
+    def finish_run(self, started):
+        """Sonuçları topla; kategori ve toplam ölçümlerini kaydet"""
+        results = self.collect_results()
+        for category, stats in self.deleter.stats.items():
+            data = results[category]
+            self.metrics.emit({'event': 'category', 'category': category, 'freed': data['freed'],
+                               'count': data['count'], 'skipped': data['skipped'],
+                               'skipped_bytes': data['skipped_bytes'], 'pending': data.get('pending', 0),
+                               'visited': stats['visited'],
+                               'errors': stats['errors'], 'locked_dirs': stats['locked_dirs'],
+                               'seconds': round(stats['seconds'], 4)})
+        total = results['total']
+        self.metrics.emit({'event': 'run', 'seconds': round(time.perf_counter() - started, 4),
+                           'freed': total['freed'], 'count': total['count'], 'skipped': total['skipped'],
+                           'cancelled': bool(total.get('cancelled'))})
+        return results
+
+    def collect_results(self):
+        """Kategori sonuçlarını toplamla birlikte döndür"""
+        results = {}
+        total = {'freed': 0, 'count': 0, 'skipped': 0, 'skipped_bytes': 0}
+        for category, data in self.deleter.results.items():
+            results[category] = dict(data)
+            for key in total:
+                total[key] += data[key]
+
+        results['total'] = total
+        if self.pending:
+            # Arka planda silinmeyi bekleyen mezar taşları; 'freed' toplamına girmez
+            for category, (size, count) in self.pending.items():
+                results[category]['pending'] = size
+                results[category]['pending_count'] = count
+            total['pending'] = sum(size for size, _ in self.pending.values())
+        if self.deferred:
+            total['deferred'] = sorted({target.name for _, target, _, _ in self.deferred})
+        if self.control.cancelled:
+            # Kısmi sonuç: kategoriler o ana kadar silinenleri gösterir
+            results['total']['cancelled'] = True
+            self.report(100, f"İptal edildi: {format_size(total['freed'])} temizlendi")
+        else:
+            self.report(100, f"Temizlendi: {format_size(total['freed'])}")
+        return results
@@ -0,0 +1,392 @@
+"""Arayüzsüz komut satırı: python -m fastertale clean --temp --prefetch --json"""
+import argparse
+import json
+import signal
+import sys
+import threading
+import time
+
+from .analyzer import DiskAnalyzer
+from .cleaner import Cleaner
+from .duplicates import DEFAULT_MIN_SIZE
+from .index import SizeIndex
+from .metrics import MetricsRecorder, default_metrics_path
+from .plan import DeletionPlan
+from .utils import format_size
+
+CATEGORY_FLAGS = [
+    ('temp', 'temp_files', "Geçici dosyalar (Temp, %Temp%)"),
+    ('prefetch', 'prefetch', "Prefetch önbelleği"),
+    ('browser', 'browser_cache', "Tarayıcı önbellekleri (Chrome, Edge, Brave, Vivaldi, Opera, Firefox; tüm profiller)"),
+    ('app-cache', 'app_cache', "Uygulama önbellekleri (Teams, Discord, VS Code, npm, pip)"),
+    ('recycle-bin', 'recycle_bin', "Geri dönüşüm kutusu"),
+    ('software-distribution', 'software_distribution', "Windows Update artıkları (SoftwareDistribution)"),
+]
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='fastertale', description="FasterTale - arayüzsüz temizlik")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    clean = commands.add_parser('clean', help="Seçilen kategorileri temizle")
+    for flag, category, label in CATEGORY_FLAGS:
+        clean.add_argument(f'--{flag}', dest=category, action='store_true', help=label.replace('%', '%%'))
+    clean.add_argument('--all', action='store_true', help="Tüm kategoriler")
+    clean.add_argument('--workers', type=int, default=None, help="Paralel silme iş parçacığı sayısı")
+    clean.add_argument('--json', action='store_true', help="Sonucu JSON olarak yaz")
+    clean.add_argument('--no-index', action='store_true', help="Boyut dizinini güncelleme")
+    clean.add_argument('--metrics-log', metavar='DOSYA', default=None,
+                       help="Aşama ölçümlerinin JSONL günlüğü (varsayılan: %%LOCALAPPDATA%%\\FasterTale)")
+    clean.add_argument('--no-metrics', action='store_true', help="Ölçüm günlüğü yazma")
+    clean.add_argument('--settings', metavar='DOSYA',
+                       help="Saklama kurallarını bu cleaner_settings.json dosyasından al")
+    clean.add_argument('--dry-run', action='store_true', help="Silmeden, silinecekleri listele")
+    clean.add_argument('--ignore-running', action='store_true',
+                       help="Uygulaması açık olan önbellekleri de temizle (varsayılan: ertele)")
+    clean.add_argument('--wait-running', action='store_true',
+                       help="Ertelenen önbellekleri uygulamaları kapanınca temizle")
+    clean.add_argument('--plan', metavar='DOSYA', help="Kuru çalıştırma planını JSONL olarak yaz ('-' = stdout)")
+    clean.add_argument('-v', '--verbose', action='store_true', help="İlerlemeyi stderr'e yaz")
+
+    execute = commands.add_parser('execute-plan', help="Kaydedilmiş planı yeniden taramadan uygula")
+    execute.add_argument('plan', metavar='DOSYA', help="clean --dry-run --plan ile yazılmış JSONL")
+    execute.add_argument('--workers', type=int, default=None, help="Paralel silme iş parçacığı sayısı")
+    execute.add_argument('--json', action='store_true', help="Sonucu JSON olarak yaz")
+    execute.add_argument('--no-index', action='store_true', help="Boyut dizinini güncelleme")
+    execute.add_argument('--metrics-log', metavar='DOSYA', default=None,
+                         help="Aşama ölçümlerinin JSONL günlüğü (varsayılan: %%LOCALAPPDATA%%\\FasterTale)")
+    execute.add_argument('--no-metrics', action='store_true', help="Ölçüm günlüğü yazma")
+    execute.add_argument('-v', '--verbose', action='store_true', help="İlerlemeyi stderr'e yaz")
+
+    analyze = commands.add_parser('analyze', help="Disk kullanımını analiz et")
+    analyze.add_argument('--json', action='store_true', help="Sonucu JSON olarak yaz")
+    analyze.add_argument('--no-index', action='store_true', help="Boyut dizinini kullanmadan tam tara")
+    analyze.add_argument('--largest', type=int, metavar='N', default=0,
+                         help="Profil ve disk bölümlerindeki en büyük N dosya ve klasörü de listele")
+    analyze.add_argument('-v', '--verbose', action='store_true', help="İlerlemeyi stderr'e yaz")
+
+    duplicates = commands.add_parser('duplicates', help="Yinelenen dosyaları bul (ve kopyalarını sil)")
+    duplicates.add_argument('folders', metavar='KLASÖR', nargs='*', help="Varsayılan: kullanıcı profili")
+    duplicates.add_argument('--min-size', type=int, metavar='KB', default=DEFAULT_MIN_SIZE // 1024,
+                            help="Bundan küçük dosyaları atla")
+    duplicates.add_argument('--workers', type=int, default=None, help="Özet hesaplayan süreç sayısı")
+    duplicates.add_argument('--delete', action='store_true',
+                            help="Her gruptan en eski dosyayı koru, diğerlerini sil")
+    duplicates.add_argument('--json', action='store_true', help="Sonucu JSON olarak yaz")
+    duplicates.add_argument('-v', '--verbose', action='store_true', help="İlerlemeyi stderr'e yaz")
+
+    schedule = commands.add_parser('schedule', help="Aralık dolduğunda ve sistem boştayken otomatik temizlik yap")
+    schedule.add_argument('--settings', metavar='DOSYA',
+                          help="auto_clean_interval ve saklama kurallarını bu cleaner_settings.json dosyasından al")
+    schedule.add_argument('--interval', type=float, metavar='GÜN', default=None,
+                          help="İki temizlik arasındaki gün (varsayılan: ayarlardaki auto_clean_interval ya da 7)")
+    schedule.add_argument('--once', action='store_true', help="Zamanı geldiyse bir kez temizle ve çık")
+    schedule.add_argument('--workers', type=int, default=None, help="Paralel silme iş parçacığı sayısı")
+    schedule.add_argument('--json', action='store_true', help="Sonucu JSON olarak yaz")
+    schedule.add_argument('--no-index', action='store_true', help="Boyut dizinini güncelleme")
+    schedule.add_argument('--metrics-log', metavar='DOSYA', default=None,
+                          help="Aşama ölçümlerinin JSONL günlüğü (varsayılan: %%LOCALAPPDATA%%\\FasterTale)")
+    schedule.add_argument('--no-metrics', action='store_true', help="Ölçüm günlüğü yazma")
+    schedule.add_argument('-v', '--verbose', action='store_true', help="İlerlemeyi stderr'e yaz")
+
+    watch = commands.add_parser('watch', help="Boş alan azalınca sadece gerektiği kadar temizlik yap")
+    watch.add_argument('--low', type=float, metavar='YÜZDE', default=None,
+                       help="Boş alan bu yüzdenin altına inince temizle (varsayılan: 10)")
+    watch.add_argument('--high', type=float, metavar='YÜZDE', default=None,
+                       help="Boş alanı bu yüzdeye çıkaracak kadar kategori seç (varsayılan: 15)")
+    watch.add_argument('--poll', type=float, metavar='SN', default=30, help="Boş alan yoklama aralığı")
+    watch.add_argument('--once', action='store_true', help="Bir kez kontrol et ve çık")
+    watch.add_argument('--settings', metavar='DOSYA',
+                       help="Eşikleri ve saklama kurallarını bu cleaner_settings.json dosyasından al")
+    watch.add_argument('--workers', type=int, default=None, help="Paralel silme iş parçacığı sayısı")
+    watch.add_argument('--json', action='store_true', help="Sonucu JSON olarak yaz")
+    watch.add_argument('--no-index', action='store_true', help="Boyut dizinini kullanma")
+    watch.add_argument('--metrics-log', metavar='DOSYA', default=None,
+                       help="Kategori geçmişinin okunduğu ve ölçümlerin yazıldığı JSONL günlüğü")
+    watch.add_argument('--no-metrics', action='store_true', help="Ölçüm günlüğü yazma")
+    watch.add_argument('-v', '--verbose', action='store_true', help="İlerlemeyi stderr'e yaz")
+    return parser
+
+def open_size_index(args):
+    if args.no_index:
+        return None
+    import sqlite3
+    try:
+        return SizeIndex()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Boyut dizini açılamadı: {e}", file=sys.stderr)
+        return None
+
+def open_metrics(args):
+    if args.no_metrics:
+        return None
+    try:
+        return MetricsRecorder(args.metrics_log or default_metrics_path())
+    except OSError as e:
+        print(f"Ölçüm günlüğü açılamadı: {e}", file=sys.stderr)
+        return None
+
+def cancel_on_interrupt(cleaner):
+    """Ctrl+C temizliği yarıda kessin ama kısmi sonuç yine de yazılsın"""
+    signal.signal(signal.SIGINT, lambda signum, frame: cleaner.cancel())
+
+def wait_for_purge(cleaner, results):
+    """Mezar taşlarının silinmesini bekle ve silineni sonuca kat.
+
+    Süreç kapanınca arka plan iş parçacığı yarıda kalırdı. Ctrl+C beklemeyi
+    bırakır; kalan mezar taşları sonraki temizlikte silinir ve sonuçta
+    'pending' olarak kalır.
+    """
+    thread = cleaner.purge_thread
+    if thread is not None and thread.is_alive():
+        print("Değiştirilen önbellek klasörleri arka planda siliniyor...", file=sys.stderr)
+        while thread.is_alive() and not cleaner.control.cancelled:
+            thread.join(1)
+    return cleaner.merge_purged(results)
+
+def print_progress(value, message):
+    print(f"[{value:3d}%] {message}", file=sys.stderr)
+
+def run_clean(args):
+    options = {category: args.all or getattr(args, category) for _, category, _ in CATEGORY_FLAGS}
+    if not any(options.values()):
+        print("Lütfen en az bir temizleme seçeneği seçin (örn. --temp veya --all)", file=sys.stderr)
+        return 2
+
+    retention_rules = None
+    if args.settings:
+        with open(args.settings, 'r', encoding='utf-8') as f:
+            retention_rules = json.load(f).get('retention_rules')
+
+    def make_cleaner(options):
+        inspector = None
+        if not args.ignore_running:
+            # psutil sadece süreç denetiminde gerekir
+            from .processes import ProcessInspector
+            inspector = ProcessInspector()
+        return Cleaner(options, args.workers, print_progress if args.verbose else None, open_size_index(args),
+                       retention_rules, metrics=open_metrics(args), inspector=inspector)
+
+    cleaner = make_cleaner(options)
+    cancel_on_interrupt(cleaner)
+    if args.dry_run or args.plan:
+        plan = cleaner.build_plan()
+        if args.plan == '-':
+            plan.write_jsonl(sys.stdout)
+            return 0
+        if args.plan:
+            with open(args.plan, 'w', encoding='utf-8') as f:
+                plan.write_jsonl(f)
+        print_results(plan.summary(), args.json)
+        return 0
+
+    results = cleaner.perform_cleaning()
+    print_results(wait_for_purge(cleaner, results), args.json)
+    while args.wait_running and cleaner.deferred and not results['total'].get('cancelled'):
+        from .processes import wait_for_exit
+
+        names = sorted({process.info['name'] for process in cleaner.deferred_processes()})
+        print(f"Kapanmaları bekleniyor: {', '.join(names)}", file=sys.stderr)
+        stop = threading.Event()
+        signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+        done = threading.Event()
+        wait_for_exit(cleaner.deferred_processes(), done.set, stop)
+        # Windows'ta süresiz bekleme Ctrl+C'yi geciktirir; ana iş parçacığı kısa dilimlerle bekler
+        while not done.wait(1) and not stop.is_set():
+            pass
+        if stop.is_set():
+            return 130
+        cleaner = make_cleaner(cleaner.deferred_options())
+        cancel_on_interrupt(cleaner)
+        results = cleaner.perform_cleaning()
+        print_results(wait_for_purge(cleaner, results), args.json)
+    return 130 if results['total'].get('cancelled') else 0
+
+def run_execute_plan(args):
+    with open(args.plan, 'r', encoding='utf-8') as f:
+        plan = DeletionPlan.read_jsonl(f)
+
+    cleaner = Cleaner({}, args.workers, print_progress if args.verbose else None, open_size_index(args),
+                      metrics=open_metrics(args))
+    cancel_on_interrupt(cleaner)
+    results = cleaner.execute_plan(plan)
+    print_results(results, args.json)
+    return 130 if results['total'].get('cancelled') else 0
+
+def print_results(results, as_json):
+    if as_json:
+        print(json.dumps(results, ensure_ascii=False))
+        return
+
+    if results['total'].get('cancelled'):
+        print("Temizlik iptal edildi - kısmi sonuç:")
+    print(f"Toplam Kazanılan Alan: {format_size(results['total']['freed'])}")
+    print(f"Silinen Öğe Sayısı: {results['total']['count']}")
+    if results['total'].get('pending'):
+        print(f"Arka planda silinecek: {format_size(results['total']['pending'])}")
+    if results['total'].get('deferred'):
+        print(f"Uygulaması açık olduğu için ertelendi: {', '.join(results['total']['deferred'])}")
+    for category, data in results.items():
+        if category != 'total':
+            category_name = category.replace('_', ' ').title()
+            line = f"  {category_name}: {format_size(data['freed'])} ({data['count']} öğe)"
+            if data.get('skipped'):
+                line += f" - {data['skipped']} kullanımda/atlandı ({format_size(data['skipped_bytes'])})"
+            print(line)
+
+def run_analyze(args):
+    analyzer = DiskAnalyzer(print_progress if args.verbose else None, open_size_index(args))
+    results = analyzer.analyze_disk_space()
+    if args.largest > 0:
+        largest = analyzer.find_largest(count=args.largest)
+        results['largest'] = {'files': [{'size': size, 'path': path} for size, path in largest['files']],
+                              'dirs': [{'size': size, 'count': count, 'path': path}
+                                       for size, count, path in largest['dirs']]}
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False))
+        return 0
+
+    for name, data in results.items():
+        if name not in ('disk_info', 'largest'):
+            print(f"{name}: {data['size_str']} ({data['count']} dosya) - {data['path']}")
+    for disk, info in results['disk_info'].items():
+        print(f"{disk}: {format_size(info['free'])} boş / {format_size(info['total'])} ({info['percent']}%)")
+    if 'largest' in results:
+        print("En büyük klasörler:")
+        for data in results['largest']['dirs']:
+            print(f"  {format_size(data['size']):>12}  {data['count']:>9} dosya  {data['path']}")
+        print("En büyük dosyalar:")
+        for data in results['largest']['files']:
+            print(f"  {format_size(data['size']):>12}  {data['path']}")
+    return 0
+
+def run_duplicates(args):
+    progress = print_progress if args.verbose else None
+    groups = DiskAnalyzer(progress).find_duplicates(args.folders or None, args.min_size * 1024, args.workers)
+
+    if args.json:
+        print(json.dumps([group.to_dict() for group in groups], ensure_ascii=False))
+    else:
+        for group in groups:
+            print(f"{format_size(group.size)} x {len(group.files)} - korunan: {group.keep}")
+            for path, _ in group.removable:
+                print(f"    {path}")
+        print(f"Boşa giden alan: {format_size(sum(group.wasted for group in groups))}", file=sys.stderr)
+
+    if not args.delete:
+        return 0
+    cleaner = Cleaner({'duplicates': True}, progress_callback=progress, duplicates=groups)
+    cancel_on_interrupt(cleaner)
+    results = cleaner.perform_cleaning()
+    # JSON modunda stdout'ta sadece grup listesi kalsın
+    if not args.json:
+        print_results(results, False)
+    return 130 if results['total'].get('cancelled') else 0
+
+def run_schedule(args):
+    # psutil sadece zamanlayıcıda gerekir; diğer komutların açılışını yavaşlatmasın
+    from .processes import ProcessInspector
+    from .scheduler import AUTO_CLEAN_OPTIONS, AutoCleanScheduler
+
+    settings = {}
+    if args.settings:
+        with open(args.settings, 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+    interval = args.interval if args.interval is not None else settings.get('auto_clean_interval', 7)
+    scheduler = AutoCleanScheduler(interval)
+    size_index = open_size_index(args)
+    metrics = open_metrics(args)
+    current = []
+
+    def make_cleaner():
+        cleaner = Cleaner(AUTO_CLEAN_OPTIONS, args.workers, print_progress if args.verbose else None, size_index,
+                          settings.get('retention_rules'), metrics=metrics, inspector=ProcessInspector())
+        current[:] = [cleaner]
+        return cleaner
+
+    stop = threading.Event()
+
+    def interrupt(signum, frame):
+        # Ctrl+C: süren temizlik kısmi sonuçla biter, döngü durur
+        stop.set()
+        for cleaner in current:
+            cleaner.cancel()
+
+    signal.signal(signal.SIGINT, interrupt)
+
+    if args.once:
+        # Yük iki ölçüm arasındaki farktan hesaplanır
+        scheduler.probe.sample()
+        time.sleep(2)
+        if not scheduler.should_run():
+            wait = scheduler.backoff or scheduler.seconds_until_due()
+            print(f"Temizlik zamanı değil ya da sistem meşgul; ~{wait / 60:.0f} dk sonra yeniden deneyin",
+                  file=sys.stderr)
+            return 0
+        cleaner = make_cleaner()
+        results = scheduler.run(cleaner)
+        print_results(wait_for_purge(cleaner, results), args.json)
+        return 130 if results['total'].get('cancelled') else 0
+
+    if args.verbose:
+        print(f"Zamanlayıcı çalışıyor: {interval:g} günde bir", file=sys.stderr)
+    scheduler.loop(make_cleaner, stop, report=lambda results: print_results(results, args.json))
+    return 0
+
+def run_watch(args):
+    from .pressure import DEFAULT_HIGH_PERCENT, DEFAULT_LOW_PERCENT, PressureWatcher
+    from .processes import ProcessInspector
+
+    settings = {}
+    if args.settings:
+        with open(args.settings, 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+    low = args.low if args.low is not None else settings.get('pressure_low_percent', DEFAULT_LOW_PERCENT)
+    high = args.high if args.high is not None else settings.get('pressure_high_percent', DEFAULT_HIGH_PERCENT)
+    size_index = open_size_index(args)
+    metrics = open_metrics(args)
+    current = []
+
+    def make_cleaner(options):
+        cleaner = Cleaner(options, args.workers, print_progress if args.verbose else None, size_index,
+                          settings.get('retention_rules'), metrics=metrics, inspector=ProcessInspector())
+        current[:] = [cleaner]
+        return cleaner
+
+    def report(mountpoint, categories, results):
+        if not args.json:
+            print(f"{mountpoint}: boş alan azaldı - {', '.join(categories)} temizlendi")
+        print_results(results, args.json)
+
+    watcher = PressureWatcher(make_cleaner, low, high, size_index=size_index,
+                              log_path=args.metrics_log or default_metrics_path())
+    if args.once:
+        watcher.run_once(report)
+        return 0
+
+    stop = threading.Event()
+
+    def interrupt(signum, frame):
+        stop.set()
+        for cleaner in current:
+            cleaner.cancel()
+
+    signal.signal(signal.SIGINT, interrupt)
+    if args.verbose:
+        print(f"Boş alan izleniyor: %{low:g} altında temizlik, hedef %{high:g}", file=sys.stderr)
+    watcher.loop(stop, args.poll, report=report)
+    return 0
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == 'clean':
+        return run_clean(args)
+    if args.command == 'execute-plan':
+        return run_execute_plan(args)
+    if args.command == 'duplicates':
+        return run_duplicates(args)
+    if args.command == 'schedule':
+        return run_schedule(args)
+    if args.command == 'watch':
+        return run_watch(args)
+    return run_analyze(args)
@@ -0,0 +1,161 @@
+"""Yinelenen dosya bulucu.
+
+Analiz envanteri (ScanSnapshot) üç aşamada daraltılır, böylece her dosyanın
+tamamı okunmaz:
+
+    1. boyut   - aynı boyutta başka dosyası olmayanlar elenir (diske dokunmadan)
+    2. kısmi   - ilk ve son 64 KB'ın özeti; çoğu aday burada ayrılır
+    3. tam     - sadece hâlâ eşleşen ve 128 KB'tan büyük dosyaların tamamı
+
+Dosyalar mmap ile okunur ve özetler bir süreç havuzunda hesaplanır. Aynı
+dosyaya işaret eden sabit bağlantılar (hard link) yinelenen sayılmaz.
+"""
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .snapshot import _numpy
+
+PARTIAL_BYTES = 64 * 1024
+# Bundan küçük dosyalar aday sayılmaz (boş dosyalar ve küçük ayar dosyaları)
+DEFAULT_MIN_SIZE = 64 * 1024
+
+def _digest(mapped, size):
+    """Kısmi özet; dosya 2 * PARTIAL_BYTES'tan küçükse tüm içeriğin özetidir"""
+    digest = hashlib.blake2b(digest_size=16)
+    if size <= 2 * PARTIAL_BYTES:
+        digest.update(mapped)
+    else:
+        digest.update(mapped[:PARTIAL_BYTES])
+        digest.update(mapped[-PARTIAL_BYTES:])
+    return digest.digest()
+
+def _hash_file(path, size, full):
+    """(özet, (aygıt, inode)) döndür; dosya okunamaz ya da boyutu değişmişse None.
+
+    Süreç havuzunda çalıştığı için modül düzeyindedir (pickle edilebilir).
+    """
+    try:
+        with open(path, 'rb') as f:
+            file_stat = os.fstat(f.fileno())
+            if file_stat.st_size != size:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if full:
+                    digest = hashlib.blake2b(mapped, digest_size=32).digest()
+                else:
+                    digest = _digest(mapped, size)
+        return digest, (file_stat.st_dev, file_stat.st_ino)
+    except (OSError, ValueError):
+        return None
+
+def _hash_partial(job):
+    return _hash_file(job[0], job[1], False)
+
+def _hash_full(job):
+    return _hash_file(job[0], job[1], True)
+
+class DuplicateGroup:
+    """Aynı içerikteki dosyalar; keep korunur, diğerleri silinebilir.
+
+    Korunan dosya en eski değiştirilme tarihine sahip olandır (genelde asıl
+    indirme; kopyalar sonradan oluşur).
+    """
+
+    def __init__(self, size, digest, files):
+        self.size = size
+        self.digest = digest
+        # files: [(yol, mtime)] - en eskisi başta
+        self.files = sorted(files, key=lambda item: (item[1], item[0]))
+
+    @property
+    def keep(self):
+        return self.files[0][0]
+
+    @property
+    def removable(self):
+        return self.files[1:]
+
+    @property
+    def wasted(self):
+        return self.size * (len(self.files) - 1)
+
+    def to_dict(self):
+        return {'size': self.size, 'hash': self.digest.hex(), 'keep': self.keep,
+                'duplicates': [path for path, _ in self.removable], 'wasted': self.wasted}
+
+def size_groups(snapshot, min_size=DEFAULT_MIN_SIZE):
+    """1. aşama: aynı boyuttaki dosya indekslerinin listeleri"""
+    np = _numpy()
+    if np is not None:
+        sizes = np.frombuffer(snapshot.file_size, dtype=snapshot.file_size.typecode)
+        candidates = np.nonzero(sizes >= max(min_size, 1))[0]
+        order = candidates[np.argsort(sizes[candidates], kind='stable')]
+        ordered = sizes[order]
+        # Boyutun değiştiği noktalar grupları ayırır
+        bounds = np.concatenate(([0], np.nonzero(np.diff(ordered))[0] + 1, [len(ordered)]))
+        lengths = np.diff(bounds)
+        return [order[bounds[i]:bounds[i + 1]].tolist() for i in np.nonzero(lengths > 1)[0].tolist()]
+
+    groups = {}
+    for index, size in enumerate(snapshot.file_size):
+        if size >= max(min_size, 1):
+            groups.setdefault(size, []).append(index)
+    return [indexes for indexes in groups.values() if len(indexes) > 1]
+
+def _refine(groups, hasher, executor, chunksize):
+    """Her grubu özete göre böl; tek kalan ve aynı inode'a sahip girdiler elenir"""
+    jobs = [(path, size) for group in groups for path, size, _ in group]
+    results = executor.map(hasher, jobs, chunksize=chunksize)
+    refined = []
+    for group in groups:
+        by_digest = {}
+        for item in group:
+            result = next(results)
+            if result is None:
+                continue
+            digest, inode = result
+            members = by_digest.setdefault(digest, {})
+            # Sabit bağlantılar aynı veriyi paylaşır; silmek yer kazandırmaz
+            members.setdefault(inode, item)
+        refined.extend((digest, list(members.values())) for digest, members in by_digest.items()
+                       if len(members) > 1)
+    return refined
+
+def find_duplicates(snapshot, min_size=DEFAULT_MIN_SIZE, max_workers=None, progress_callback=None,
+                    use_processes=True):
+    """Envanterdeki yinelenen dosya grupları, boşa giden alana göre büyükten küçüğe"""
+    def report(value, message):
+        if progress_callback is not None:
+            progress_callback(value, message)
+
+    report(0, "Aynı boyuttaki dosyalar gruplanıyor...")
+    groups = [[(snapshot.file_path(index), snapshot.file_size[index], snapshot.file_mtime[index])
+               for index in indexes] for indexes in size_groups(snapshot, min_size)]
+    candidates = sum(len(group) for group in groups)
+    if not candidates:
+        report(100, "Yinelenen dosya bulunamadı")
+        return []
+
+    if use_processes:
+        # multiprocessing sadece burada gerekir; paketi içe aktarmayı yavaşlatmasın
+        from concurrent.futures import ProcessPoolExecutor as pool
+    else:
+        pool = ThreadPoolExecutor
+    chunksize = max(1, min(256, candidates // ((max_workers or os.cpu_count() or 1) * 4)))
+    with pool(max_workers=max_workers) as executor:
+        report(10, f"{candidates} aday dosyanın baş ve sonu okunuyor...")
+        partial = _refine(groups, _hash_partial, executor, chunksize)
+
+        # Kısmi özet küçük dosyaların tüm içeriğidir; sadece büyükler tam okunur
+        complete = [(digest, members) for digest, members in partial if members[0][1] <= 2 * PARTIAL_BYTES]
+        large = [members for _, members in partial if members[0][1] > 2 * PARTIAL_BYTES]
+        report(50, f"{sum(len(members) for members in large)} dosyanın tamamı okunuyor...")
+        complete.extend(_refine(large, _hash_full, executor, chunksize))
+
+    duplicates = [DuplicateGroup(members[0][1], digest, [(path, mtime) for path, _, mtime in members])
+                  for digest, members in complete]
+    duplicates.sort(key=lambda group: group.wasted, reverse=True)
+    report(100, f"{len(duplicates)} yinelenen dosya grubu bulundu")
+    return duplicates
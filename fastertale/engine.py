@@ -0,0 +1,464 @@
+"""Tek geçişte tarayıp silen, iş parçacığı havuzlu silme motoru"""
+import errno
+import os
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .metrics import error_code
+from .utils import enter_background
+
+# ERROR_ACCESS_DENIED, ERROR_SHARING_VIOLATION, ERROR_LOCK_VIOLATION
+_LOCK_WINERRORS = (5, 32, 33)
+_LOCK_ERRNOS = (errno.EACCES, errno.EPERM, errno.EBUSY)
+
+def _is_lock_error(error):
+    """Hata, dosyanın başka bir işlem tarafından kullanıldığını mı gösteriyor?"""
+    winerror = getattr(error, 'winerror', None)
+    if winerror is not None:
+        return winerror in _LOCK_WINERRORS
+    return error.errno in _LOCK_ERRNOS
+
+def _is_real_dir(entry):
+    """DirEntry gerçek bir klasör mü? (symlink / junction değil)"""
+    if not entry.is_dir(follow_symlinks=False):
+        return False
+    if os.name == 'nt':
+        # Junction'lar is_symlink() ile yakalanmaz; öznitelikler scandir'den önbellekli gelir
+        attributes = entry.stat(follow_symlinks=False).st_file_attributes
+        return not attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT
+    return True
+
+def delete_entry(entry):
+    """Tek bir DirEntry'yi sil - (boyut, dosya sayısı) döndür"""
+    try:
+        if _is_real_dir(entry):
+            freed, count = purge_directory(entry.path)
+            try:
+                os.rmdir(entry.path)
+            except OSError:
+                pass
+            return freed, count
+        if entry.is_dir(follow_symlinks=False):
+            # Klasör bağlantısı: hedefe dokunmadan sadece bağlantıyı kaldır
+            os.rmdir(entry.path)
+            return 0, 0
+        size = entry.stat(follow_symlinks=False).st_size
+        os.unlink(entry.path)
+        return size, 1
+    except OSError:
+        return 0, 0
+
+def purge_directory(folder_path):
+    """Klasörün içeriğini tek geçişte sil, klasörün kendisini bırak.
+
+    os.scandir ile gezilir; boyutlar DirEntry'nin önbellekli stat bilgisinden
+    alınır, böylece her dosya için ayrıca isfile/getsize çağrısı yapılmaz.
+    Sadece gerçekten silinen dosyalar sayılır.
+    """
+    freed = 0
+    count = 0
+    pending = [folder_path]
+    subdirs = []
+    while pending:
+        current = pending.pop()
+        try:
+            iterator = os.scandir(current)
+        except OSError:
+            continue
+        with iterator:
+            for entry in iterator:
+                try:
+                    if _is_real_dir(entry):
+                        pending.append(entry.path)
+                        subdirs.append(entry.path)
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        os.rmdir(entry.path)
+                        continue
+                    size = entry.stat(follow_symlinks=False).st_size
+                    os.unlink(entry.path)
+                except OSError:
+                    continue
+                freed += size
+                count += 1
+    # Alt klasörler ebeveynlerinden sonra listelendi; tersten giderek boşalanları kaldır
+    for subdir in reversed(subdirs):
+        try:
+            os.rmdir(subdir)
+        except OSError:
+            pass
+    return freed, count
+
+def delete_path(path):
+    """Yol bir dosyaysa sil, klasörse içeriğiyle birlikte sil"""
+    try:
+        path_stat = os.lstat(path)
+        if stat.S_ISDIR(path_stat.st_mode):
+            if getattr(path_stat, 'st_file_attributes', 0) & stat.FILE_ATTRIBUTE_REPARSE_POINT:
+                os.rmdir(path)
+                return 0, 0
+            freed, count = purge_directory(path)
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
+            return freed, count
+        os.unlink(path)
+        return path_stat.st_size, 1
+    except OSError:
+        return 0, 0
+
+DEFAULT_DELETE_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+class CleaningControl:
+    """İşbirlikçi iptal ve duraklatma bayrakları.
+
+    Silme döngüleri her girdi arasında checkpoint() çağırır: duraklatılmışsa
+    devam edilene kadar bekler, iptal edilmişse False döndürür.
+    """
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._resumed = threading.Event()
+        self._resumed.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self):
+        return not self._resumed.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+        self._resumed.set()  # duraklatılmış işler de uyanıp çıksın
+
+    def pause(self):
+        if not self._cancelled.is_set():
+            self._resumed.clear()
+
+    def resume(self):
+        self._resumed.set()
+
+    def checkpoint(self):
+        """Duraklatılmışsa bekle; iş sürmeliyse True döndür"""
+        if not self._resumed.is_set():
+            self._resumed.wait()
+        return not self._cancelled.is_set()
+
+class _DirNode:
+    """Paralel silmede bir klasörün bekleyen alt işlerini izler"""
+    __slots__ = ('path', 'parent', 'category', 'remove', 'entry_filter', 'rule', 'pending',
+                 'locked', 'lock_failures', 'has_deleted')
+
+    def __init__(self, path, parent, category, remove, entry_filter=None, rule=None):
+        self.path = path
+        self.parent = parent
+        self.category = category
+        self.remove = remove
+        self.entry_filter = entry_filter
+        self.rule = rule
+        self.pending = 1  # klasörün kendi taraması
+        self.locked = False
+        self.lock_failures = 0
+        self.has_deleted = False
+
+class ParallelDeleter:
+    """Bağımsız kökleri ve alt ağaçları sınırlı bir iş parçacığı havuzuna dağıtır.
+
+    Her klasör ayrı bir tarama işi olarak kuyruğa girer; dosyalar gruplar halinde
+    silinir, alt klasörler yeni işler olarak eklenir. Bir klasör, tüm alt işleri
+    bittiğinde kaldırılır. Sonuçlar kategori bazında kilit altında toplanır, bu
+    yüzden iş parçacığı sayısı sonucu değiştirmez.
+
+    control (CleaningControl) iptal edildiğinde kuyruktaki işler atlanır,
+    çalışan işler bir sonraki girdide durur; o ana kadarki sonuçlar kalır.
+
+    Kullanımdaki dosyalar hata basılmadan 'skipped' / 'skipped_bytes'
+    sayaçlarına yazılır. Bir klasörde hiçbir dosya silinemeden art arda
+    lock_threshold kilit hatası alınırsa klasör kilitli sayılır; kalan
+    dosyaları ve alt klasörleri denenmeden atlanır. Atlanan alt klasörler
+    yine de listelenir, dosyaları 'skipped' sayaçlarına eklenir.
+
+    self.stats ölçüm içindir: kategori başına gezilen dosya ('visited'),
+    hata kodlarına göre silinemeyenler ve beklenmeyen iş hataları (hata
+    sınıfının adıyla, 'errors'), kilitli bulunan klasörler
+    ('locked_dirs') ve iş parçacıklarının kategoride harcadığı süre
+    ('seconds', paralel işlerin toplamı).
+
+    low_priority=True ise havuzun iş parçacıkları arka plan önceliğinde
+    çalışır (utils.enter_background); süreç ve çağıran iş parçacığı etkilenmez.
+    """
+
+    def __init__(self, max_workers=None, batch_size=256, control=None, lock_threshold=16, low_priority=False):
+        self.max_workers = max_workers or DEFAULT_DELETE_WORKERS
+        self.batch_size = batch_size
+        self.lock_threshold = lock_threshold
+        self.control = control or CleaningControl()
+        self.results = {}
+        self.stats = {}
+        self.roots = []
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._submitted = 0
+        self._completed = 0
+        self._found_bytes = 0
+        self._found_files = 0
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix='FasterTaleDelete',
+                                            initializer=enter_background if low_priority else None)
+
+    def add_category(self, category):
+        """Kategoriyi sonuçlara ekle (hiç silme olmasa da raporlanır)"""
+        with self._lock:
+            self.results.setdefault(category, {'freed': 0, 'count': 0, 'skipped': 0, 'skipped_bytes': 0})
+            self.stats.setdefault(category, {'visited': 0, 'errors': {}, 'locked_dirs': 0, 'seconds': 0.0})
+
+    def add_tree(self, category, folder_path, keep_root=True, entry_filter=None, rule=None):
+        """Klasörü (ve içeriğini) silme kuyruğuna ekle.
+
+        entry_filter sadece kökün doğrudan içeriğine uygulanır; rule
+        (RetentionRule) tüm ağaçtaki dosya ve klasörlere uygulanır. Kuralın
+        koruduğu dosyaları içeren klasörler boş olmadıkları için kalır.
+        """
+        self.add_category(category)
+        self.roots.append(folder_path)
+        node = _DirNode(folder_path, None, category, not keep_root, entry_filter, rule)
+        self._submit(category, self._scan, node)
+
+    def add_files(self, category, files):
+        """Önceden listelenmiş (yol, boyut) çiftlerini tarama yapmadan sil"""
+        self.add_category(category)
+        for i in range(0, len(files), self.batch_size):
+            self._submit(category, self._unlink_files, category, files[i:i + self.batch_size])
+
+    def add_call(self, category, func):
+        """(boyut, sayı) döndüren bir işlevi havuzda çalıştır"""
+        self.add_category(category)
+        self._submit(category, self._call, category, func)
+
+    def progress(self):
+        """(tamamlanan iş, kuyruğa alınan iş) sayısını döndür"""
+        with self._lock:
+            return self._completed, self._submitted
+
+    def totals(self):
+        """Şu ana kadar silinen toplam (boyut, sayı)"""
+        with self._lock:
+            freed = sum(data['freed'] for data in self.results.values())
+            count = sum(data['count'] for data in self.results.values())
+        return freed, count
+
+    def discovered(self):
+        """Taramada şu ana kadar bulunan silinecek (boyut, dosya sayısı)"""
+        with self._lock:
+            return self._found_bytes, self._found_files
+
+    def wait(self, timeout=None):
+        """Tüm işler bitene kadar bekle; zaman aşımında False döndür"""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._completed == self._submitted, timeout)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+    def _submit(self, category, func, *args):
+        with self._lock:
+            self._submitted += 1
+        self._executor.submit(self._run, category, func, args)
+
+    def _run(self, category, func, args):
+        started = time.perf_counter()
+        try:
+            if self.control.checkpoint():
+                func(*args)
+        except Exception as e:
+            # Havuz işin sonucunu kimseye vermez; hata kaybolmasın, kategori ölçümüne yazılsın
+            code = error_code(e) if isinstance(e, OSError) else type(e).__name__
+            self._record_errors(category, errors={code: 1})
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._idle:
+                self.stats[category]['seconds'] += elapsed
+                self._completed += 1
+                if self._completed == self._submitted:
+                    self._idle.notify_all()
+
+    def _record(self, category, freed, count, skipped=0, skipped_bytes=0):
+        with self._lock:
+            data = self.results[category]
+            data['freed'] += freed
+            data['count'] += count
+            data['skipped'] += skipped
+            data['skipped_bytes'] += skipped_bytes
+
+    def _record_errors(self, category, visited=0, errors=None, locked_dirs=0):
+        with self._lock:
+            stats = self.stats[category]
+            stats['visited'] += visited
+            stats['locked_dirs'] += locked_dirs
+            for code, count in (errors or {}).items():
+                stats['errors'][code] = stats['errors'].get(code, 0) + count
+
+    def _call(self, category, func):
+        freed, count = func()
+        self._record(category, freed, count)
+
+    @staticmethod
+    def _abandoned(node):
+        """Klasör ya da üst klasörlerinden biri kilitli bulundu mu?"""
+        while node is not None:
+            if node.locked:
+                return True
+            node = node.parent
+        return False
+
+    def _scan(self, node):
+        if self._abandoned(node):
+            # Kilitli ağacın alt klasörü: silmeyi denemeden atla
+            self._skip_tree(node)
+            self._finish(node)
+            return
+
+        files = []
+        children = []
+        visited = 0
+        cancelled = False
+        try:
+            with os.scandir(node.path) as entries:
+                for entry in entries:
+                    if not self.control.checkpoint():
+                        cancelled = True
+                        break
+                    visited += 1
+                    if node.entry_filter is not None and not node.entry_filter(entry):
+                        continue
+                    try:
+                        if _is_real_dir(entry):
+                            if node.rule is None or node.rule.allows_dir(entry.name):
+                                children.append(_DirNode(entry.path, node, node.category, True,
+                                                         rule=node.rule))
+                        elif entry.is_dir(follow_symlinks=False):
+                            # Klasör bağlantısı: hedefe dokunmadan sadece bağlantıyı kaldır
+                            os.rmdir(entry.path)
+                        else:
+                            # Kural, boyut için zaten alınan stat bilgisiyle değerlendirilir
+                            entry_stat = entry.stat(follow_symlinks=False)
+                            if node.rule is None or node.rule.allows_file(entry.name, entry_stat):
+                                files.append((entry.path, entry_stat.st_size))
+                    except OSError:
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self._record_errors(node.category, errors={error_code(e): 1})
+        self._record_errors(node.category, visited)
+        if cancelled:
+            # İptal: silme yok, ama sayaçlar tutarlı kalsın ve üst klasörler bitsin
+            self._finish(node)
+            return
+
+        batches = [files[i:i + self.batch_size] for i in range(0, len(files), self.batch_size)]
+        with self._lock:
+            node.pending += len(batches) + len(children)
+            self._found_bytes += sum(size for _, size in files)
+            self._found_files += len(files)
+        for child in children:
+            self._submit(node.category, self._scan, child)
+        # Kuyruk FIFO olduğundan ilk grup burada silinir; aksi halde tüm ağaç
+        # taranmadan hiçbir dosya silinmez
+        for batch in batches[1:]:
+            self._submit(node.category, self._unlink_batch, node, batch)
+        if batches:
+            self._unlink_batch(node, batches[0])
+        self._finish(node)
+
+    def _skip_tree(self, node):
+        """Atlanan alt ağaçtaki dosyaları 'skipped' say; sadece listelenir, silinmez"""
+        skipped = 0
+        skipped_bytes = 0
+        visited = 0
+        pending = [node.path]
+        while pending and self.control.checkpoint():
+            try:
+                iterator = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with iterator:
+                for entry in iterator:
+                    visited += 1
+                    try:
+                        if _is_real_dir(entry):
+                            if node.rule is None or node.rule.allows_dir(entry.name):
+                                pending.append(entry.path)
+                        elif not entry.is_dir(follow_symlinks=False):
+                            entry_stat = entry.stat(follow_symlinks=False)
+                            if node.rule is None or node.rule.allows_file(entry.name, entry_stat):
+                                skipped += 1
+                                skipped_bytes += entry_stat.st_size
+                    except OSError:
+                        continue
+        self._record(node.category, 0, 0, skipped, skipped_bytes)
+        self._record_errors(node.category, visited)
+
+    def _unlink_batch(self, node, batch):
+        if self._abandoned(node):
+            node.locked = True
+        self._unlink_files(node.category, batch, node)
+        self._finish(node)
+
+    def _unlink_files(self, category, batch, node=None):
+        freed = 0
+        count = 0
+        skipped = 0
+        skipped_bytes = 0
+        errors = {}
+        locked_dirs = 0
+        for index, (path, size) in enumerate(batch):
+            if not self.control.checkpoint():
+                break
+            if node is not None and node.locked:
+                # Klasör kilitli: kalan dosyaları denemeden atla
+                rest = batch[index:]
+                skipped += len(rest)
+                skipped_bytes += sum(rest_size for _, rest_size in rest)
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                skipped += 1
+                skipped_bytes += size
+                code = error_code(e)
+                errors[code] = errors.get(code, 0) + 1
+                if node is not None and _is_lock_error(e):
+                    node.lock_failures += 1
+                    if not node.has_deleted and not node.locked and node.lock_failures >= self.lock_threshold:
+                        node.locked = True
+                        locked_dirs += 1
+                continue
+            freed += size
+            count += 1
+            if node is not None and not node.has_deleted:
+                node.has_deleted = True
+        self._record(category, freed, count, skipped, skipped_bytes)
+        # add_files ile gelen dosyalar taranmadığı için burada gezilmiş sayılır
+        self._record_errors(category, len(batch) if node is None else 0, errors, locked_dirs)
+
+    def _finish(self, node):
+        """Bir alt iş bitti; klasör tamamen boşaldıysa kaldır ve ebeveyne bildir"""
+        while node is not None:
+            with self._lock:
+                node.pending -= 1
+                if node.pending:
+                    return
+            if node.remove:
+                try:
+                    os.rmdir(node.path)
+                except OSError:
+                    pass
+            node = node.parent
@@ -0,0 +1,44 @@
+"""İş parçacıklarından arayüze toplu olay aktarımı.
+
+Her ilerleme bildirimi için bir Qt sinyali yaymak, olayı arayüz iş
+parçacığının kuyruğuna ayrı ayrı taşır. EventBus'ta işçiler olayları
+kilitsiz bir yapıya bırakır, arayüz bunları bir zamanlayıcıyla toplu alır:
+
+- İlerleme (yüzde, mesaj) tek elemanlı bir deque'dir; arada gelen
+  bildirimler birbirinin üstüne yazılır, arayüz sadece sonuncuyu gösterir.
+- Diğer olaylar (ör. ölçüm kayıtları) kaybolmamalıdır; deque'de sırayla
+  bekler. deque.append / popleft GIL altında atomiktir.
+
+Mesajlar çoğunlukla progress.Message'dır; metne çevirme arayüz tarafında,
+sadece gösterilen mesaj için yapılır.
+"""
+from collections import deque
+
+class EventBus:
+    """İşçi iş parçacıklarından tek bir tüketiciye (arayüz) olay kanalı"""
+
+    def __init__(self):
+        self._progress = deque(maxlen=1)
+        self._events = deque()
+
+    def progress(self, value, message):
+        """progress_callback olarak verilebilir; son bildirim öncekini ezer"""
+        self._progress.append((value, message))
+
+    def push(self, kind, payload):
+        """Sırası korunacak bir olay ekle"""
+        self._events.append((kind, payload))
+
+    def drain(self):
+        """(son ilerleme ya da None, [(tür, veri)]) - bekleyen her şeyi al"""
+        try:
+            progress = self._progress.pop()
+        except IndexError:
+            progress = None
+        events = []
+        while True:
+            try:
+                events.append(self._events.popleft())
+            except IndexError:
+                break
+        return progress, events
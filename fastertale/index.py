@@ -0,0 +1,162 @@
+"""Kalıcı, artımlı klasör boyutu dizini (SQLite).
+
+Her klasör için sadece doğrudan içindeki dosyaların toplam boyutu, dosya
+sayısı ve klasörün mtime değeri saklanır. Bir klasöre dosya eklenip
+silindiğinde mtime değişir; mtime aynı kalan klasörler yeniden listelenmez,
+sadece alt klasörlerinin mtime'ı kontrol edilir. Temizlik sonrası etkilenen
+kökler invalidate() ile dizinden düşürülür.
+
+Not: Var olan bir dosya yerinde büyürse klasörün mtime'ı değişmez; bu tür
+değişiklikler klasör başka bir nedenle yeniden taranana kadar yansımaz.
+"""
+import os
+from contextlib import closing
+
+from .engine import _is_real_dir
+
+def default_index_path():
+    """Dizin dosyasının varsayılan konumu (%LOCALAPPDATA%\\FasterTale)"""
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'FasterTale', 'size_index.db')
+
+class SizeIndex:
+    """Klasör başına boyut/sayı/mtime saklayan artımlı tarama dizini.
+
+    Her işlem kendi bağlantısını açar, böylece analiz ve temizlik farklı
+    iş parçacıklarından aynı dizini güvenle kullanabilir.
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or default_index_path()
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        with closing(self._connect()) as db, db:
+            db.execute("CREATE TABLE IF NOT EXISTS dirs ("
+                       "path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER, "
+                       "size INTEGER, files INTEGER)")
+            db.execute("CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent)")
+
+    def _connect(self):
+        # sqlite3 dizin ilk açıldığında yüklenir; paketi içe aktarmayı yavaşlatmasın
+        import sqlite3
+        db = sqlite3.connect(self.db_path, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    @staticmethod
+    def _subtree_bounds(path):
+        """path altındaki tüm yolları kapsayan [alt, üst) anahtar aralığı"""
+        prefix = os.path.join(path, '')
+        return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+    def _load(self, db, root):
+        low, high = self._subtree_bounds(root)
+        rows = db.execute("SELECT path, parent, mtime_ns, size, files FROM dirs "
+                          "WHERE path = ? OR (path >= ? AND path < ?)", (root, low, high))
+        cached = {}
+        children = {}
+        for path, parent, mtime_ns, size, files in rows:
+            cached[path] = (mtime_ns, size, files)
+            children.setdefault(parent, []).append(path)
+        return cached, children
+
+    def cached_size(self, folder_path):
+        """Diske dokunmadan dizindeki son bilinen (boyut, sayı); kayıt yoksa None"""
+        root = os.path.abspath(folder_path)
+        low, high = self._subtree_bounds(root)
+        with closing(self._connect()) as db:
+            if db.execute("SELECT 1 FROM dirs WHERE path = ?", (root,)).fetchone() is None:
+                return None
+            size, files = db.execute("SELECT TOTAL(size), TOTAL(files) FROM dirs "
+                                     "WHERE path = ? OR (path >= ? AND path < ?)",
+                                     (root, low, high)).fetchone()
+        return int(size), int(files)
+
+    def folder_size(self, folder_path):
+        """Klasörün toplam boyutu ve dosya sayısı; sadece değişen klasörler taranır"""
+        root = os.path.abspath(folder_path)
+        total_size = 0
+        file_count = 0
+        updates = []
+        visited = set()
+
+        with closing(self._connect()) as db, db:
+            cached, children = self._load(db, root)
+
+            pending = [(root, None)]
+            while pending:
+                path, mtime_ns = pending.pop()
+                try:
+                    if mtime_ns is None:
+                        mtime_ns = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                visited.add(path)
+
+                row = cached.get(path)
+                if row is not None and row[0] == mtime_ns:
+                    # Değişmemiş klasör: listelemeden önbellekteki değerleri kullan
+                    total_size += row[1]
+                    file_count += row[2]
+                    pending.extend((child, None) for child in children.get(path, ()))
+                    continue
+
+                size, files = self._scan_dir(path, pending)
+                updates.append((path, os.path.dirname(path), mtime_ns, size, files))
+                total_size += size
+                file_count += files
+
+            db.executemany("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?)", updates)
+            stale = [(path,) for path in cached if path not in visited]
+            db.executemany("DELETE FROM dirs WHERE path = ?", stale)
+
+        return total_size, file_count
+
+    def store(self, folder_path, rows):
+        """Başka bir taramanın (ör. ScanSnapshot.dir_rows) sonucunu kökün kaydı yap"""
+        root = os.path.abspath(folder_path)
+        low, high = self._subtree_bounds(root)
+        with closing(self._connect()) as db, db:
+            db.execute("DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", (root, low, high))
+            db.executemany("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?)", rows)
+
+    @staticmethod
+    def _scan_dir(path, pending):
+        """Klasörü listele; doğrudan dosyaları topla, alt klasörleri kuyruğa ekle"""
+        size = 0
+        files = 0
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if _is_real_dir(entry):
+                            pending.append((entry.path, entry.stat(follow_symlinks=False).st_mtime_ns))
+                        elif entry.is_file(follow_symlinks=False):
+                            size += entry.stat(follow_symlinks=False).st_size
+                            files += 1
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return size, files
+
+    def invalidate(self, paths):
+        """Verilen klasörleri ve altlarını dizinden düşür (temizlik sonrası).
+
+        Üst klasörlerin kaydı da eskimiş sayılır; aksi halde bir sonraki
+        taramada düşürülen klasör çocuk listesinde görünmez.
+        """
+        with closing(self._connect()) as db, db:
+            for path in paths:
+                root = os.path.abspath(path)
+                low, high = self._subtree_bounds(root)
+                db.execute("DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)",
+                           (root, low, high))
+
+                ancestors = []
+                parent = os.path.dirname(root)
+                while parent not in ancestors:
+                    ancestors.append(parent)
+                    parent = os.path.dirname(parent)
+                db.executemany("UPDATE dirs SET mtime_ns = -1 WHERE path = ?",
+                               [(ancestor,) for ancestor in ancestors])
@@ -0,0 +1,102 @@
+"""Temizlik aşamalarının yapılandırılmış ölçümleri.
+
+Her kayıt tek satırlık bir JSON nesnesidir ve 'event' alanıyla ayrılır:
+
+    phase     - bir aşamanın duvar saati süresi (schedule, delete, prune, index)
+    category  - kategori başına silinen/atlanan, gezilen dosya, hata kodları
+                ve iş parçacıklarının kategoride harcadığı toplam süre
+    error     - aşama dışı beklenmeyen hatalar
+    run       - temizliğin toplam süresi ve sonucu
+    purge     - arka planda silinen mezar taşlarının kategori başına gerçek
+                boyutu, dosya sayısı ve süresi (temizlik bittikten sonra)
+
+Kayıtlar dönen (rotating) bir günlük dosyasına yazılır ve subscribe() ile
+eklenen geri çağırma işlevlerine iletilir. Aynı temizliğin kayıtları ortak
+bir 'run' kimliği taşır, böylece farklı makinelerden gelen günlükler
+birleştirilip yavaş kategoriler bulunabilir.
+"""
+import errno
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+def default_metrics_path():
+    """Ölçüm günlüğünün varsayılan konumu (%LOCALAPPDATA%\\FasterTale)"""
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'FasterTale', 'metrics.jsonl')
+
+def error_code(error):
+    """OSError için kısa hata kodu: 'WinError 32', 'EACCES' ya da sınıf adı"""
+    winerror = getattr(error, 'winerror', None)
+    if winerror is not None:
+        return f"WinError {winerror}"
+    if error.errno is not None:
+        return errno.errorcode.get(error.errno, str(error.errno))
+    return type(error).__name__
+
+class MetricsRecorder:
+    """Ölçüm kayıtlarını JSON satırı olarak yazar ve dinleyicilere iletir.
+
+    log_path verilmezse dosyaya yazılmaz, sadece dinleyiciler çağrılır.
+    Dinleyiciler kaydı üreten iş parçacığında çağrılır (çoğunlukla temizlik
+    iş parçacığı); arayüz bunları kendi olay döngüsüne aktarmalıdır.
+    """
+
+    def __init__(self, log_path=None, callbacks=(), max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT):
+        self.callbacks = list(callbacks)
+        self.run_id = None
+        self._lock = threading.Lock()
+        self._handler = None
+        if log_path:
+            # logging.handlers socket ve pickle'ı da yükler; sadece dosyaya yazılacaksa gerekir
+            from logging.handlers import RotatingFileHandler
+            os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+            # Günlükçü kaydı yok: her temizlikte yeni bir Logger global yöneticide birikirdi
+            self._handler = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backup_count,
+                                                encoding='utf-8', delay=True)
+            self._handler.setFormatter(logging.Formatter('%(message)s'))
+
+    def subscribe(self, callback):
+        """callback(kayıt) her yeni ölçüm kaydında çağrılır"""
+        self.callbacks.append(callback)
+
+    def start_run(self):
+        """Yeni bir temizlik başlat; sonraki kayıtlar bu kimliği taşır"""
+        self.run_id = uuid.uuid4().hex[:12]
+        return self.run_id
+
+    def emit(self, record):
+        record = dict(record, run=self.run_id, time=time.strftime('%Y-%m-%dT%H:%M:%S'))
+        with self._lock:
+            if self._handler is not None:
+                self._handler.handle(logging.makeLogRecord({'msg': json.dumps(record, ensure_ascii=False),
+                                                            'levelno': logging.INFO, 'levelname': 'INFO'}))
+        for callback in self.callbacks:
+            callback(record)
+
+    @contextmanager
+    def phase(self, name, **fields):
+        """Bloğun süresini ölç; blok kayda ek alanlar yazabilir"""
+        record = dict(fields, event='phase', phase=name)
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = round(time.perf_counter() - started, 4)
+            self.emit(record)
+
+    def error(self, category, error):
+        self.emit({'event': 'error', 'category': category, 'error': str(error),
+                   'code': error_code(error) if isinstance(error, OSError) else type(error).__name__})
+
+    def close(self):
+        if self._handler is not None:
+            self._handler.close()
+            self._handler = None
@@ -0,0 +1,175 @@
+"""Kuru çalıştırma (önizleme) için silme planı.
+
+Plan, dosya başına bir sözlük yerine sütunlar halinde tutulur: klasör yolları
+bir tabloda bir kez saklanır, dosya adları tek bir bayt dizisinde art arda
+durur; boyut, klasör ve kategori numaraları array sütunlarındadır. Böylece
+milyonlarca girdilik bir plan bile küçük kalır. Plan JSONL olarak akıtılabilir
+ve daha sonra yeniden taramadan aynen uygulanabilir.
+"""
+import json
+import os
+from array import array
+
+from .engine import CleaningControl, _is_real_dir
+
+PLAN_FORMAT = 1
+
+class DeletionPlan:
+    """Silinecek dosyalar ve kaldırılacak klasörlerin sütunlu listesi"""
+
+    def __init__(self):
+        self.categories = []
+        self.roots = []
+        self.dirs = []
+        self._category_ids = {}
+        self._dir_ids = {}
+        self.file_dir = array('I')
+        self.file_category = array('B')
+        self.file_size = array('q')
+        self.name_offsets = array('Q', [0])
+        self.names = bytearray()
+        # Dosyalar silindikten sonra kaldırılacak klasörler, en derin olan önce
+        self.prune_dir = array('I')
+
+    def __len__(self):
+        return len(self.file_size)
+
+    def category_id(self, category):
+        if category not in self._category_ids:
+            self._category_ids[category] = len(self.categories)
+            self.categories.append(category)
+        return self._category_ids[category]
+
+    def dir_id(self, path):
+        if path not in self._dir_ids:
+            self._dir_ids[path] = len(self.dirs)
+            self.dirs.append(path)
+        return self._dir_ids[path]
+
+    def add_file(self, category_id, dir_id, name, size):
+        self.file_dir.append(dir_id)
+        self.file_category.append(category_id)
+        self.file_size.append(size)
+        self.names += name.encode('utf-8', 'surrogatepass')
+        self.name_offsets.append(len(self.names))
+
+    def file_path(self, index):
+        name = self.names[self.name_offsets[index]:self.name_offsets[index + 1]]
+        return os.path.join(self.dirs[self.file_dir[index]], name.decode('utf-8', 'surrogatepass'))
+
+    def iter_files(self):
+        """(kategori, yol, boyut) üçlülerini sırayla üret"""
+        for index in range(len(self.file_size)):
+            yield self.categories[self.file_category[index]], self.file_path(index), self.file_size[index]
+
+    def iter_prune_dirs(self):
+        for dir_id in self.prune_dir:
+            yield self.dirs[dir_id]
+
+    def summary(self):
+        """Kategori başına {'freed', 'count'} - temizlik sonucuyla aynı biçim"""
+        summary = {category: {'freed': 0, 'count': 0} for category in self.categories}
+        for category_id, size in zip(self.file_category, self.file_size):
+            data = summary[self.categories[category_id]]
+            data['freed'] += size
+            data['count'] += 1
+        summary['total'] = {'freed': sum(self.file_size), 'count': len(self.file_size)}
+        return summary
+
+    def nbytes(self):
+        """Sütunların ve tabloların yaklaşık bellek kullanımı"""
+        columns = (self.file_dir, self.file_category, self.file_size, self.name_offsets, self.prune_dir)
+        return (sum(column.itemsize * len(column) for column in columns) + len(self.names)
+                + sum(len(path) for path in self.dirs))
+
+    def write_jsonl(self, fp):
+        """Planı JSONL olarak yaz: başlık, dosyalar, ardından kaldırılacak klasörler"""
+        header = {'format': PLAN_FORMAT, 'categories': self.categories, 'roots': self.roots,
+                  'files': len(self), 'bytes': sum(self.file_size)}
+        fp.write(json.dumps(header) + '\n')
+        for category, path, size in self.iter_files():
+            fp.write(json.dumps({'category': category, 'path': path, 'size': size}) + '\n')
+        for path in self.iter_prune_dirs():
+            fp.write(json.dumps({'dir': path}) + '\n')
+
+    @classmethod
+    def read_jsonl(cls, fp):
+        """write_jsonl ile yazılmış planı geri yükle"""
+        plan = cls()
+        header = json.loads(fp.readline())
+        if header.get('format') != PLAN_FORMAT:
+            raise ValueError(f"Desteklenmeyen plan biçimi: {header.get('format')}")
+        for category in header['categories']:
+            plan.category_id(category)
+        plan.roots = [tuple(root) for root in header['roots']]
+        for line in fp:
+            record = json.loads(line)
+            if 'dir' in record:
+                plan.prune_dir.append(plan.dir_id(record['dir']))
+            else:
+                folder, name = os.path.split(record['path'])
+                plan.add_file(plan.category_id(record['category']), plan.dir_id(folder),
+                              name, record['size'])
+        return plan
+
+class PlanBuilder:
+    """ParallelDeleter ile aynı arayüz; silmek yerine planı doldurur.
+
+    Kök filtreleri, bağlantılar ve klasör kaldırma kuralları silme motoruyla
+    aynıdır, böylece plan gerçek temizliğin sileceklerini birebir gösterir.
+    """
+
+    def __init__(self, control=None):
+        self.plan = DeletionPlan()
+        self.roots = []
+        self.control = control or CleaningControl()
+
+    def add_category(self, category):
+        self.plan.category_id(category)
+
+    def add_tree(self, category, folder_path, keep_root=True, entry_filter=None, rule=None):
+        category_id = self.plan.category_id(category)
+        self.roots.append(folder_path)
+        self.plan.roots.append((category, folder_path))
+
+        subdirs = [] if keep_root else [folder_path]
+        pending = [(folder_path, entry_filter)]
+        while pending:
+            current, current_filter = pending.pop()
+            dir_id = self.plan.dir_id(current)
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if not self.control.checkpoint():
+                            return
+                        if current_filter is not None and not current_filter(entry):
+                            continue
+                        try:
+                            if _is_real_dir(entry):
+                                if rule is None or rule.allows_dir(entry.name):
+                                    pending.append((entry.path, None))
+                                    subdirs.append(entry.path)
+                            elif entry.is_dir(follow_symlinks=False):
+                                # Klasör bağlantısı: sadece bağlantının kendisi kaldırılır
+                                subdirs.append(entry.path)
+                            else:
+                                entry_stat = entry.stat(follow_symlinks=False)
+                                if rule is None or rule.allows_file(entry.name, entry_stat):
+                                    self.plan.add_file(category_id, dir_id, entry.name, entry_stat.st_size)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+        for subdir in reversed(subdirs):
+            self.plan.prune_dir.append(self.plan.dir_id(subdir))
+
+    def add_files(self, category, files):
+        category_id = self.plan.category_id(category)
+        for path, size in files:
+            folder, name = os.path.split(path)
+            self.plan.add_file(category_id, self.plan.dir_id(folder), name, size)
+
+    def add_call(self, category, func):
+        # Geri dönüşüm kutusu gibi işlemler önceden listelenemez; sadece kategori görünür
+        self.add_category(category)
@@ -0,0 +1,260 @@
+"""Disk doluluğuna göre tetiklenen temizlik.
+
+Bölümlerin boş alanı ucuz bir sorguyla (psutil.disk_usage: tek bir
+statvfs / GetDiskFreeSpaceEx çağrısı) izlenir. Windows'ta bekleme, sürücü
+kökündeki boyut değişikliği bildirimiyle (FindFirstChangeNotificationW)
+erkenden uyanır; diğer sistemlerde düz bir yoklama aralığı kullanılır.
+
+Boş alan düşük eşiğin (low_percent) altına indiğinde, yüksek eşiğe
+(high_percent) dönmeye yetecek en küçük kategori kümesi seçilir:
+kategoriler ölçüm günlüğündeki geçmiş temizliklerin saniye başına
+kazandırdığı bayta göre sıralanır ve tahmini kazanç yetene kadar eklenir.
+Tahmin boyut dizinindeki son analizden, yoksa geçmiş temizliklerin
+ortalamasından alınır.
+"""
+import ctypes
+import json
+import os
+import threading
+import time
+
+from .metrics import LOG_BACKUP_COUNT, default_metrics_path
+from .targets import TARGETS, default_roots, resolve_targets
+
+# Disk dolduğunda kullanıcıya sorulmadan temizlenecek kategoriler (kullanıcı
+# verisi olan geri dönüşüm kutusu ve yinelenen dosyalar hariç)
+PRESSURE_CATEGORIES = ('temp_files', 'prefetch', 'browser_cache', 'app_cache', 'software_distribution')
+
+DEFAULT_LOW_PERCENT = 10.0
+DEFAULT_HIGH_PERCENT = 15.0
+# Temizlik eşiğin üstüne çıkaramadıysa aynı bölüm bu süre boyunca yeniden denenmez
+COOLDOWN = 30 * 60
+
+# FILE_NOTIFY_CHANGE_SIZE; INVALID_HANDLE_VALUE; WAIT_OBJECT_0
+_NOTIFY_CHANGE_SIZE = 0x0008
+_INVALID_HANDLE = ctypes.c_void_p(-1).value
+_WAIT_OBJECT_0 = 0
+
+def category_history(log_path=None):
+    """Ölçüm günlüğünden kategori başına {'freed': ortalama bayt, 'rate': bayt/s}.
+
+    Aynı temizliğin 'category' kaydı ile arka planda silinen mezar taşlarının
+    'purge' kaydı ('run' kimliğiyle) tek bir çalışma olarak toplanır.
+    """
+    log_path = log_path or default_metrics_path()
+    per_run = {}
+    for path in [log_path] + [f"{log_path}.{i}" for i in range(1, LOG_BACKUP_COUNT + 1)]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            continue
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('event') not in ('category', 'purge'):
+                continue
+            data = per_run.setdefault((record.get('run'), record['category']), [0, 0.0, 0])
+            data[0] += record.get('freed', 0)
+            data[1] += record.get('seconds', 0.0)
+            data[2] += record.get('count', 0)
+    totals = {}
+    for (_, category), (freed, seconds, count) in per_run.items():
+        if not count:
+            continue
+        data = totals.setdefault(category, [0, 0.0, 0])
+        data[0] += freed
+        data[1] += seconds
+        data[2] += 1
+    return {category: {'freed': freed / runs, 'rate': freed / max(seconds, 1e-3)}
+            for category, (freed, seconds, runs) in totals.items()}
+
+def partition_of(path, mountpoints):
+    """Yolun bulunduğu bölümün bağlama noktası (en uzun eşleşen); bulunamazsa None"""
+    key = os.path.normcase(os.path.abspath(path))
+    best = None
+    for mountpoint in mountpoints:
+        prefix = os.path.normcase(mountpoint)
+        if key == prefix.rstrip(os.sep) or key.startswith(os.path.join(prefix, '')):
+            if best is None or len(mountpoint) > len(best):
+                best = mountpoint
+    return best
+
+class _ChangeWaiter:
+    """Sürücü köklerindeki boyut değişikliklerini bekler (sadece Windows)"""
+
+    def __init__(self, mountpoints):
+        self.handles = []
+        try:
+            self.kernel32 = ctypes.windll.kernel32
+        except AttributeError:
+            return
+        self.kernel32.FindFirstChangeNotificationW.restype = ctypes.c_void_p
+        for mountpoint in mountpoints:
+            handle = self.kernel32.FindFirstChangeNotificationW(mountpoint, True, _NOTIFY_CHANGE_SIZE)
+            if handle and handle != _INVALID_HANDLE:
+                self.handles.append(handle)
+
+    def wait(self, stop, timeout):
+        """Değişiklik, stop ya da zaman aşımına kadar bekle"""
+        if not self.handles:
+            stop.wait(timeout)
+            return
+        deadline = time.monotonic() + timeout
+        handles = (ctypes.c_void_p * len(self.handles))(*self.handles)
+        while not stop.is_set() and time.monotonic() < deadline:
+            # stop'u kaçırmamak için kısa dilimlerle beklenir
+            result = self.kernel32.WaitForMultipleObjects(len(self.handles), handles, False, 1000)
+            if _WAIT_OBJECT_0 <= result < _WAIT_OBJECT_0 + len(self.handles):
+                self.kernel32.FindNextChangeNotification(ctypes.c_void_p(self.handles[result]))
+                return
+
+    def close(self):
+        for handle in self.handles:
+            self.kernel32.FindCloseChangeNotification(ctypes.c_void_p(handle))
+        self.handles = []
+
+class PressureWatcher:
+    """Boş alanı düşük eşiğin altına inen bölümlerde gerektiği kadar temizlik yapar.
+
+    make_cleaner(options) bir Cleaner döndürmelidir. roots, targets ve
+    size_index tahmin için kullanılır (Cleaner'a verilenlerle aynı olmalı).
+    """
+
+    def __init__(self, make_cleaner=None, low_percent=DEFAULT_LOW_PERCENT, high_percent=DEFAULT_HIGH_PERCENT,
+                 categories=PRESSURE_CATEGORIES, roots=None, targets=None, size_index=None, log_path=None,
+                 cooldown=COOLDOWN):
+        self.make_cleaner = make_cleaner
+        self.low_percent = low_percent
+        self.high_percent = max(high_percent, low_percent)
+        self.categories = categories
+        self.roots = default_roots() if roots is None else roots
+        self.targets = TARGETS if targets is None else targets
+        self.size_index = size_index
+        self.log_path = log_path
+        self.cooldown = cooldown
+        self.cooling = {}
+
+    @staticmethod
+    def mountpoints():
+        # psutil sadece izlemede gerekir; eşik sabitlerini alanları yavaşlatmasın
+        import psutil
+        return [partition.mountpoint for partition in psutil.disk_partitions()]
+
+    def pressured(self, now=None):
+        """Boş alanı düşük eşiğin altındaki (bağlama noktası, disk_usage) çiftleri"""
+        import psutil
+        now = time.monotonic() if now is None else now
+        low = []
+        for mountpoint in self.mountpoints():
+            if self.cooling.get(mountpoint, 0) > now:
+                continue
+            try:
+                usage = psutil.disk_usage(mountpoint)
+            except OSError:
+                continue
+            if usage.total and 100.0 * usage.free / usage.total < self.low_percent:
+                low.append((mountpoint, usage))
+        return low
+
+    def estimates(self, mountpoint, history):
+        """Kategori başına bu bölümde kazanılması beklenen bayt"""
+        mountpoints = self.mountpoints()
+        estimates = {}
+        for category in self.categories:
+            folders = [folder for _, folder in resolve_targets(self.targets, self.roots, category)
+                       if partition_of(folder, mountpoints) == mountpoint]
+            if not folders:
+                continue
+            total = 0
+            known = False
+            for folder in folders:
+                cached = self.size_index.cached_size(folder) if self.size_index is not None else None
+                if cached is not None:
+                    total += cached[0]
+                    known = True
+            if not known:
+                total = history.get(category, {}).get('freed', 0)
+            estimates[category] = total
+        return estimates
+
+    def choose(self, mountpoint, usage, history=None):
+        """Yüksek eşiğe dönmek için seçilen kategoriler, en hızlı kazandıran önce.
+
+        Geçmişi olmayan kategoriler sona eklenir. Tahminler yetmezse
+        bölümdeki tüm kategoriler seçilir (elden gelen yapılır).
+        """
+        history = category_history(self.log_path) if history is None else history
+        needed = usage.total * self.high_percent / 100.0 - usage.free
+        estimates = self.estimates(mountpoint, history)
+        ordered = sorted(estimates, key=lambda category: history.get(category, {}).get('rate', 0.0),
+                         reverse=True)
+        chosen = []
+        expected = 0
+        for category in ordered:
+            if expected >= needed:
+                break
+            chosen.append(category)
+            expected += estimates[category]
+        return chosen
+
+    def plan(self):
+        """Baskı altındaki bölümler ve seçilen kategoriler: [(bölüm, kategoriler)].
+
+        Seçilen bölüm cooldown süresince yeniden seçilmez; temizlik eşiğin
+        üstüne çıkaramasa da sürekli tekrarlanmaz.
+        """
+        plans = []
+        history = None
+        for mountpoint, usage in self.pressured():
+            if history is None:
+                history = category_history(self.log_path)
+            categories = self.choose(mountpoint, usage, history)
+            self.cooling[mountpoint] = time.monotonic() + self.cooldown
+            if categories:
+                plans.append((mountpoint, categories))
+        return plans
+
+    def run_once(self, report=None):
+        """Planlanan temizlikleri düşük öncelikle yap; [(bölüm, kategoriler, sonuç)]"""
+        import psutil
+        runs = []
+        for mountpoint, categories in self.plan():
+            cleaner = self.make_cleaner({category: True for category in categories})
+            # Sadece silme iş parçacıkları düşük öncelikte çalışır
+            cleaner.low_priority = True
+            results = cleaner.perform_cleaning()
+            if cleaner.purge_thread is not None:
+                # Boş alan ancak mezar taşları silinince artar
+                cleaner.purge_thread.join()
+                cleaner.merge_purged(results)
+            try:
+                usage = psutil.disk_usage(mountpoint)
+                if 100.0 * usage.free / usage.total >= self.high_percent:
+                    # Eşiğin üstüne çıkıldı; bölüm hemen yeniden izlenebilir
+                    self.cooling.pop(mountpoint, None)
+            except OSError:
+                pass
+            runs.append((mountpoint, categories, results))
+            if report is not None:
+                report(mountpoint, categories, results)
+        return runs
+
+    def loop(self, stop=None, poll=30, min_interval=5, report=None):
+        """Arayüzsüz kip: stop kurulana kadar bölümleri izle.
+
+        Yoğun yazılan bir sürücüde bildirimler sürekli gelebilir; iki kontrol
+        arasında en az min_interval saniye beklenir.
+        """
+        stop = stop or threading.Event()
+        waiter = _ChangeWaiter(self.mountpoints())
+        try:
+            while not stop.is_set():
+                checked = time.monotonic()
+                self.run_once(report)
+                waiter.wait(stop, poll)
+                stop.wait(max(0.0, checked + min_interval - time.monotonic()))
+        finally:
+            waiter.close()
@@ -0,0 +1,90 @@
+"""Çalışan uygulamalara göre temizliği erteleme.
+
+Tarayıcı açıkken önbelleğini silmek binlerce kilitli dosyada zaman kaybettirir
+ve önbelleği bozabilir. ProcessInspector çalışan süreçlerin tek bir anlık
+görüntüsünü alır (process_iter, istenirse izin verilen süreçlerin açık
+dosyaları) ve bunları kayıt defterindeki hedeflerin processes adlarıyla
+eşleştirir. Cleaner bu hedefleri atlar ve sonuçta ertelenmiş olarak bildirir.
+
+wait_for_exit() ertelenen hedeflerin süreçleri kapanınca bir işlevi çağırır.
+Bekleme yoklama değildir: psutil.Process.wait Windows'ta süreç tanıtıcısında
+WaitForSingleObject, Linux'ta pidfd ile bekler; stop'u görebilmek için
+uzun dilimler halinde beklenir.
+"""
+import os
+import threading
+
+import psutil
+
+def process_key(name):
+    """Süreç adının karşılaştırma anahtarı: küçük harf, '.exe' olmadan"""
+    name = name.lower()
+    return name[:-4] if name.endswith('.exe') else name
+
+class ProcessInspector:
+    """Çalışan süreçlerin anlık görüntüsü ve hedeflerle eşleşmesi.
+
+    open_files=True ise processes adı tanımlı hedeflerin klasörlerinde
+    dosya açık tutan süreçler de (ör. farklı adla çalışan taşınabilir bir
+    tarayıcı) eşleşir. Bu her süreç için ayrı bir sorgudur ve başka
+    kullanıcıların süreçlerinde izin verilmez; varsayılan olarak kapalıdır.
+    """
+
+    def __init__(self, open_files=False):
+        self.open_files = open_files
+        self.processes = {}
+        self.files = []
+        self.refresh()
+
+    def refresh(self):
+        """Anlık görüntüyü yeniden al"""
+        self.processes = {}
+        self.files = []
+        for process in psutil.process_iter(['name']):
+            name = process.info.get('name')
+            if not name:
+                continue
+            self.processes.setdefault(process_key(name), []).append(process)
+            if self.open_files:
+                try:
+                    self.files.extend((os.path.normcase(f.path), process) for f in process.open_files())
+                except psutil.Error:
+                    continue
+
+    def running(self, target, folder=None):
+        """Hedefin klasörünü kullanan süreçler (boşsa hedef serbest)"""
+        if not target.processes:
+            return []
+        found = []
+        for name in target.processes:
+            found.extend(self.processes.get(process_key(name), []))
+        if folder is not None and self.files:
+            prefix = os.path.join(os.path.normcase(folder), '')
+            found.extend(process for path, process in self.files
+                         if path.startswith(prefix) and process not in found)
+        return found
+
+def wait_for_exit(processes, callback, stop=None, slice_seconds=30):
+    """Süreçlerin hepsi kapanınca callback() çağıran bir iş parçacığı başlat.
+
+    stop (threading.Event) kurulursa callback çağrılmadan çıkılır.
+    Başlatılan iş parçacığını döndürür.
+    """
+    stop = stop or threading.Event()
+
+    def run():
+        for process in processes:
+            while not stop.is_set():
+                try:
+                    process.wait(slice_seconds)
+                    break
+                except psutil.TimeoutExpired:
+                    continue
+                except psutil.Error:
+                    break
+        if not stop.is_set():
+            callback()
+
+    thread = threading.Thread(target=run, name='FasterTaleExitWait', daemon=True)
+    thread.start()
+    return thread
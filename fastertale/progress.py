@@ -0,0 +1,93 @@
+"""Silinen bayt ve dosya sayısına dayalı ilerleme, hız ve kalan süre hesabı.
+
+İlerleme mesajları Message nesneleridir: şablon ve ham değerler iş
+parçacığında sadece bir demete konur, metin str() çağrıldığında (arayüzde,
+sadece gösterilen mesaj için) üretilir. progress_callback'e str yerine
+Message gelebilir; mesajı yazan taraf str() ile çevirmelidir.
+"""
+import time
+
+from .utils import format_size
+
+def format_duration(seconds):
+    """Saniyeyi kısa okunabilir süreye çevir"""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds} sn"
+    if seconds < 3600:
+        return f"{seconds // 60} dk {seconds % 60} sn"
+    return f"{seconds // 3600} sa {seconds % 3600 // 60} dk"
+
+class Bytes(int):
+    """Biçimlendirilince okunabilir boyut olarak yazılan bayt sayısı"""
+    __slots__ = ()
+
+    def __format__(self, spec):
+        return format(format_size(self), spec)
+
+class Duration(float):
+    """Biçimlendirilince kısa süre olarak yazılan saniye"""
+    __slots__ = ()
+
+    def __format__(self, spec):
+        return format(format_duration(self), spec)
+
+class Message:
+    """Tembel ilerleme mesajı: str() çağrılana kadar template.format(*args) yapılmaz"""
+    __slots__ = ('template', 'args')
+
+    def __init__(self, template, *args):
+        self.template = template
+        self.args = args
+
+    def __str__(self):
+        return self.template.format(*self.args)
+
+    def __repr__(self):
+        return f"Message({self.template!r}, *{self.args!r})"
+
+class ProgressTracker:
+    """İşlenen bayt/dosyayı tahmini toplamla karşılaştırarak ilerleme bildirir.
+
+    Yüzde, bayt ve dosya oranlarının ortalamasıdır (dosya sayısı sistem çağrısı
+    maliyetini, bayt ise büyük dosyaları temsil eder) ve hiç geri gitmez.
+    Bildirimler en fazla max_rate Hz ile gönderilir, böylece arayüzün olay
+    döngüsü her dosya için uyandırılmaz.
+    """
+
+    def __init__(self, callback, start=0, end=100, max_rate=20):
+        self.callback = callback
+        self.start = start
+        self.end = end
+        self.interval = 1.0 / max_rate
+        self.started_at = time.monotonic()
+        self.last_emit = 0.0
+        self.percent = start
+
+    def update(self, done_bytes, done_files, total_bytes, total_files, force=False):
+        """Yeni değerleri kaydet; son bildirimden bu yana yeterli süre geçtiyse bildir"""
+        now = time.monotonic()
+        if not force and now - self.last_emit < self.interval:
+            return
+        self.last_emit = now
+
+        fractions = []
+        if total_bytes:
+            fractions.append(min(1.0, done_bytes / total_bytes))
+        if total_files:
+            fractions.append(min(1.0, done_files / total_files))
+        fraction = sum(fractions) / len(fractions) if fractions else 0.0
+        self.percent = max(self.percent, self.start + int((self.end - self.start) * fraction))
+
+        elapsed = max(now - self.started_at, 1e-6)
+        files_per_s = done_files / elapsed
+        bytes_per_s = done_bytes / elapsed
+        if 0 < fraction < 1:
+            message = Message("Temizleniyor: {} / ~{} • {:.0f} dosya/s • {}/s • kalan ~{}",
+                              Bytes(done_bytes), Bytes(max(total_bytes, done_bytes)), files_per_s,
+                              Bytes(bytes_per_s), Duration(elapsed * (1 - fraction) / fraction))
+        else:
+            message = Message("Temizleniyor: {} / ~{} • {:.0f} dosya/s • {}/s",
+                              Bytes(done_bytes), Bytes(max(total_bytes, done_bytes)), files_per_s,
+                              Bytes(bytes_per_s))
+        self.callback(self.percent, message)
@@ -0,0 +1,151 @@
+"""Geri dönüşüm kutusu: klasörleri ve kabuk API'si.
+
+Windows her sabit sürücüde kullanıcı başına bir klasör tutar:
+X:\\$Recycle.Bin\\<SID>. Kutudaki her öğe bir $R dosyası/klasörü (içerik)
+ve bir $I dosyasından (özgün yol ve silinme zamanı) oluşur. Bu klasörler
+okunabiliyorsa kutu diğer hedefler gibi taranır ve paralel silme motoruyla
+boşaltılır; böylece boyut ve öğe sayısı sonuçlara yansır.
+
+Klasörlere erişilemediğinde (ör. farklı biçimli sürücüler) kutu kabuk
+API'siyle (SHQueryRecycleBinW / SHEmptyRecycleBinW) sorgulanıp boşaltılır.
+FolderRecycleBin aynı arayüzün dosya sistemi karşılığıdır; Windows
+dışındaki testlerde ve ölçümlerde kullanılır.
+"""
+import ctypes
+import os
+import string
+
+from .engine import delete_path
+
+# SHERB_NOCONFIRMATION | SHERB_NOPROGRESSUI | SHERB_NOSOUND
+_EMPTY_FLAGS = 0x0001 | 0x0002 | 0x0004
+_DRIVE_FIXED = 3
+_TOKEN_QUERY = 0x0008
+_TOKEN_USER = 1
+
+def current_user_sid():
+    """Geçerli kullanıcının SID'i ('S-1-5-21-...'); Windows dışında ya da hata olursa None"""
+    try:
+        from ctypes import wintypes
+
+        advapi32 = ctypes.windll.advapi32
+        kernel32 = ctypes.windll.kernel32
+    except (AttributeError, OSError):
+        return None
+
+    token = wintypes.HANDLE()
+    if not advapi32.OpenProcessToken(kernel32.GetCurrentProcess(), _TOKEN_QUERY, ctypes.byref(token)):
+        return None
+    try:
+        size = wintypes.DWORD()
+        advapi32.GetTokenInformation(token, _TOKEN_USER, None, 0, ctypes.byref(size))
+        buffer = ctypes.create_string_buffer(size.value)
+        if not advapi32.GetTokenInformation(token, _TOKEN_USER, buffer, size, ctypes.byref(size)):
+            return None
+        # TOKEN_USER yapısının ilk alanı SID işaretçisidir
+        sid = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_void_p))[0]
+        string_sid = wintypes.LPWSTR()
+        if not advapi32.ConvertSidToStringSidW(ctypes.c_void_p(sid), ctypes.byref(string_sid)):
+            return None
+        try:
+            return string_sid.value
+        finally:
+            kernel32.LocalFree(string_sid)
+    finally:
+        kernel32.CloseHandle(token)
+
+def fixed_drives():
+    """Sabit sürücülerin kökleri (C:\\, D:\\ ...); ağ ve çıkarılabilir sürücüler hariç"""
+    try:
+        kernel32 = ctypes.windll.kernel32
+    except AttributeError:
+        return []
+    mask = kernel32.GetLogicalDrives()
+    drives = []
+    for i, letter in enumerate(string.ascii_uppercase):
+        if mask >> i & 1:
+            drive = f"{letter}:\\"
+            if kernel32.GetDriveTypeW(drive) == _DRIVE_FIXED:
+                drives.append(drive)
+    return drives
+
+def recycle_bin_folders():
+    """Geçerli kullanıcının sürücü başına geri dönüşüm kutusu klasörleri (var olmayanlar dahil)"""
+    sid = current_user_sid()
+    if sid is None:
+        return []
+    return [os.path.join(drive, '$Recycle.Bin', sid) for drive in fixed_drives()]
+
+class _SHQUERYRBINFO(ctypes.Structure):
+    _fields_ = [('cbSize', ctypes.c_uint32), ('i64Size', ctypes.c_int64), ('i64NumItems', ctypes.c_int64)]
+
+class ShellRecycleBin:
+    """Kabuk API'si üzerinden tüm sürücülerdeki kutu (geçerli kullanıcı)"""
+
+    def query(self):
+        """(boyut, öğe sayısı); API kullanılamıyorsa None"""
+        try:
+            query = ctypes.windll.shell32.SHQueryRecycleBinW
+        except AttributeError:
+            return None
+        # 64 bit Windows'ta yapı 8 bayta hizalanır; cbSize buna göre hesaplanır
+        info = _SHQUERYRBINFO(ctypes.sizeof(_SHQUERYRBINFO))
+        if query(None, ctypes.byref(info)) != 0:
+            return None
+        return info.i64Size, info.i64NumItems
+
+    def empty(self):
+        """Kutuyu boşalt; boşaltmadan önce sorgulanan (boyut, öğe sayısı) döndür"""
+        before = self.query() or (0, 0)
+        if ctypes.windll.shell32.SHEmptyRecycleBinW(None, None, _EMPTY_FLAGS) != 0:
+            return 0, 0
+        return before
+
+    def refresh(self):
+        """Klasörler doğrudan silindikten sonra masaüstü simgesini güncelle"""
+        try:
+            ctypes.windll.shell32.SHUpdateRecycleBinIcon()
+        except AttributeError:
+            pass
+
+class FolderRecycleBin:
+    """Dosya sistemi karşılığı: verilen klasörlerin içeriği kutunun öğeleridir"""
+
+    def __init__(self, folders):
+        self.folders = folders
+
+    def entries(self):
+        for folder in self.folders:
+            try:
+                with os.scandir(folder) as entries:
+                    yield from [entry.path for entry in entries]
+            except OSError:
+                continue
+
+    def query(self):
+        size = 0
+        count = 0
+        for path in self.entries():
+            count += 1
+            if not os.path.isdir(path) or os.path.islink(path):
+                try:
+                    size += os.lstat(path).st_size
+                except OSError:
+                    pass
+                continue
+            for dirpath, _, filenames in os.walk(path):
+                for filename in filenames:
+                    try:
+                        size += os.lstat(os.path.join(dirpath, filename)).st_size
+                    except OSError:
+                        continue
+        return size, count
+
+    def empty(self):
+        before = self.query()
+        for path in list(self.entries()):
+            delete_path(path)
+        return before
+
+    def refresh(self):
+        pass
@@ -0,0 +1,73 @@
+"""Kategori bazında saklama (yaş / boyut / desen) kuralları.
+
+Kurallar taramada zaten alınmış DirEntry stat bilgisiyle değerlendirilir,
+bu yüzden filtreleme ek sistem çağrısı gerektirmez.
+"""
+import time
+from fnmatch import fnmatchcase
+
+DEFAULT_RULES = {
+    # Kurulum programlarının az önce oluşturduğu (ve çoğu zaman kilitli) dosyalara dokunma
+    'temp_files': {'min_age_hours': 24, 'min_size_kb': 0, 'include': [], 'exclude': []},
+}
+
+class RetentionRule:
+    """Bir dosyanın silinip silinmeyeceğine karar veren kural.
+
+    min_age_hours: bu süreden yeni değiştirilmiş dosyalar silinmez
+    min_size_kb:   bu boyuttan küçük dosyalar silinmez
+    include:       boş değilse sadece bu desenlere uyan dosyalar silinir
+    exclude:       bu desenlere uyan dosya ve klasörler hiç silinmez
+    Desenler dosya adına büyük/küçük harf duyarsız uygulanır.
+    """
+
+    def __init__(self, min_age_hours=0, min_size_kb=0, include=(), exclude=()):
+        self.min_age_hours = min_age_hours
+        self.min_size_kb = min_size_kb
+        self.include = [pattern.lower() for pattern in include]
+        self.exclude = [pattern.lower() for pattern in exclude]
+        # Yaş sınırı kural oluşturulurken bir kez hesaplanır
+        self.cutoff = time.time() - min_age_hours * 3600 if min_age_hours else None
+        self.min_size = min_size_kb * 1024
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('min_age_hours', 0), data.get('min_size_kb', 0),
+                   data.get('include', ()), data.get('exclude', ()))
+
+    def is_empty(self):
+        return not (self.cutoff or self.min_size or self.include or self.exclude)
+
+    def allows_dir(self, name):
+        """Klasöre girilsin mi? (sadece exclude desenleri klasörlere uygulanır)"""
+        if not self.exclude:
+            return True
+        name = name.lower()
+        return not any(fnmatchcase(name, pattern) for pattern in self.exclude)
+
+    def allows_file(self, name, stat_result):
+        """Dosya silinebilir mi? stat_result DirEntry.stat() sonucudur"""
+        if self.cutoff is not None and stat_result.st_mtime > self.cutoff:
+            return False
+        if stat_result.st_size < self.min_size:
+            return False
+        if self.include or self.exclude:
+            name = name.lower()
+            if self.include and not any(fnmatchcase(name, pattern) for pattern in self.include):
+                return False
+            if any(fnmatchcase(name, pattern) for pattern in self.exclude):
+                return False
+        return True
+
+def build_rules(config):
+    """{kategori: ayar sözlüğü} yapısından boş olmayan RetentionRule'ları üret"""
+    rules = {}
+    for category, data in (config or {}).items():
+        rule = RetentionRule.from_dict(data)
+        if not rule.is_empty():
+            rules[category] = rule
+    return rules
+
+def parse_patterns(text):
+    """'*.tmp; *.log' biçimindeki metni desen listesine çevir"""
+    return [pattern.strip() for pattern in text.replace(',', ';').split(';') if pattern.strip()]
@@ -0,0 +1,185 @@
+"""auto_clean / auto_clean_interval ayarları için otomatik temizlik zamanlayıcısı.
+
+Karar mantığı Qt'den bağımsızdır: arayüz tepsideyken bir QTimer ile
+AutoCleanScheduler.should_run() çağırır, arayüzsüz kipte (python -m
+fastertale schedule) aynı sınıfın loop() döngüsü çalışır.
+
+Son çalışma zamanı ayrı bir durum dosyasında saklanır, böylece uygulama
+kapatılıp açılsa da aralık korunur. Temizliğin silme iş parçacıkları düşük
+CPU ve G/Ç önceliğiyle çalışır; arayüzün önceliği değişmez. Başlamadan önce ve temizlik sürerken ön plandaki yük ölçülür:
+yük yüksekse başlangıç ertelenir (bekleme süresi her seferinde ikiye
+katlanır), süren temizlik ise yük düşene kadar duraklatılır.
+"""
+import json
+import os
+import threading
+import time
+
+# Otomatik temizlikte kullanıcıya sorulmadan silinmesi güvenli kategoriler
+AUTO_CLEAN_OPTIONS = {
+    'temp_files': True,
+    'prefetch': True,
+    'browser_cache': False,
+    'app_cache': False,
+    'recycle_bin': False,
+    'software_distribution': False,
+}
+
+# Ön plan yükü bu sınırları aşarsa otomatik temizlik başlamaz / duraklar
+CPU_BUSY_PERCENT = 50.0
+DISK_BUSY_BYTES = 20 * 1024 * 1024
+MIN_BACKOFF = 5 * 60
+MAX_BACKOFF = 2 * 60 * 60
+
+def default_state_path():
+    """Zamanlayıcı durum dosyasının varsayılan konumu (%LOCALAPPDATA%\\FasterTale)"""
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'FasterTale', 'schedule.json')
+
+class LoadProbe:
+    """Bu süreç dışındaki CPU ve disk yükü; iki sample() çağrısı arasındaki farktan hesaplanır.
+
+    Ölçüm beklemez (arayüz iş parçacığını kilitlemez); ilk çağrı None döndürür.
+    Kendi temizliğimizin CPU ve G/Ç kullanımı yükten düşülür, aksi halde
+    temizlik kendini duraklatırdı.
+    """
+
+    def __init__(self):
+        # psutil sadece ölçümde gerekir; sabitleri alan arayüzün açılışını yavaşlatmasın
+        import psutil
+        self.process = psutil.Process()
+        self.cpu_count = psutil.cpu_count() or 1
+        self.previous = None
+
+    def _counters(self):
+        import psutil
+        cpu = psutil.cpu_times()
+        own = self.process.cpu_times()
+        disk = psutil.disk_io_counters()
+        try:
+            own_io = self.process.io_counters()
+            own_bytes = own_io.read_bytes + own_io.write_bytes
+        except (AttributeError, psutil.Error):
+            own_bytes = 0
+        disk_bytes = disk.read_bytes + disk.write_bytes if disk is not None else 0
+        return (time.monotonic(), sum(cpu) - cpu.idle, own.user + own.system, disk_bytes, own_bytes)
+
+    def sample(self):
+        """(ön plan CPU yüzdesi, ön plan disk bayt/s); ilk çağrıda None"""
+        current = self._counters()
+        previous, self.previous = self.previous, current
+        if previous is None:
+            return None
+        elapsed = max(current[0] - previous[0], 1e-6)
+        busy_cpu = (current[1] - previous[1]) - (current[2] - previous[2])
+        cpu_percent = max(0.0, 100.0 * busy_cpu / (elapsed * self.cpu_count))
+        disk_rate = max(0.0, ((current[3] - previous[3]) - (current[4] - previous[4])) / elapsed)
+        return cpu_percent, disk_rate
+
+class AutoCleanScheduler:
+    """Aralık dolduğunda ve sistem boştayken otomatik temizlik yapar.
+
+    interval_days: iki otomatik temizlik arasındaki gün sayısı
+    state_path:    son çalışma zamanının saklandığı JSON dosyası
+    """
+
+    def __init__(self, interval_days, state_path=None, cpu_busy=CPU_BUSY_PERCENT, disk_busy=DISK_BUSY_BYTES,
+                 probe=None):
+        self.interval = interval_days * 86400
+        self.state_path = state_path or default_state_path()
+        self.cpu_busy = cpu_busy
+        self.disk_busy = disk_busy
+        self.probe = probe or LoadProbe()
+        self.backoff = 0
+        self.state = self.load_state()
+
+    def load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self):
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        with open(self.state_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=4)
+
+    def seconds_until_due(self, now=None):
+        now = time.time() if now is None else now
+        return max(0.0, self.state.get('last_run', 0) + self.interval - now)
+
+    def is_busy(self, load):
+        return load is not None and (load[0] >= self.cpu_busy or load[1] >= self.disk_busy)
+
+    def should_run(self, now=None):
+        """Aralık doldu ve son ölçümden beri sistem boş mu? Meşgulse bekleme süresini artır.
+
+        Yük iki çağrı arasındaki farktan ölçüldüğü için ilk çağrı her zaman
+        False döndürür; çağıran bir süre sonra yeniden sormalıdır.
+        """
+        if self.seconds_until_due(now) > 0:
+            return False
+        load = self.probe.sample()
+        if load is None:
+            return False
+        if self.is_busy(load):
+            self.backoff = min(MAX_BACKOFF, max(MIN_BACKOFF, self.backoff * 2))
+            self.state['last_backoff'] = time.time()
+            return False
+        self.backoff = 0
+        return True
+
+    def next_check(self, now=None, poll=60):
+        """Bir sonraki should_run() çağrısına kadar beklenecek saniye"""
+        if self.backoff:
+            return self.backoff
+        return min(max(self.seconds_until_due(now), poll), 3600)
+
+    def run(self, cleaner, check_interval=2.0):
+        """Temizliği düşük öncelikle çalıştır; ön plan yükü yükselince duraklat.
+
+        Sadece silme iş parçacıklarının önceliği düşürülür; temizliği başlatan
+        süreç (ör. tepsideki arayüz) normal öncelikte kalır.
+        """
+        stop = threading.Event()
+        watcher = threading.Thread(target=self._watch_load, args=(cleaner, stop, check_interval),
+                                   name='FasterTaleLoadWatch', daemon=True)
+        self.state['last_attempt'] = time.time()
+        cleaner.low_priority = True
+        watcher.start()
+        try:
+            results = cleaner.perform_cleaning()
+        finally:
+            stop.set()
+            watcher.join()
+        self.state['last_run'] = time.time()
+        self.state['last_freed'] = results['total']['freed']
+        self.state['last_count'] = results['total']['count']
+        self.save_state()
+        return results
+
+    def _watch_load(self, cleaner, stop, check_interval):
+        probe = LoadProbe()
+        probe.sample()
+        paused = False
+        while not stop.wait(check_interval):
+            busy = self.is_busy(probe.sample())
+            if busy and not paused:
+                cleaner.pause()
+            elif not busy and paused:
+                cleaner.resume()
+            paused = busy
+        if paused:
+            cleaner.resume()
+
+    def loop(self, make_cleaner, stop=None, poll=60, report=None):
+        """Arayüzsüz kip: stop (threading.Event) kurulana kadar zamanı gelen temizlikleri yap"""
+        stop = stop or threading.Event()
+        self.probe.sample()
+        while not stop.wait(self.next_check(poll=poll)):
+            if not self.should_run():
+                continue
+            results = self.run(make_cleaner())
+            if report is not None:
+                report(results)
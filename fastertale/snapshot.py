@@ -0,0 +1,334 @@
+"""Analiz ile temizlik arasında paylaşılan, sütunlu dosya envanteri.
+
+Milyonlarca dosyalık bir profil için dosya başına nesne ya da sözlük
+tutulmaz. Her dosya dört array sütununda bir satırdır: klasör indeksi,
+boyut, mtime (saniye) ve ad ofseti; adlar tek bir bayt dizisinde art arda
+durur. Klasörler (ebeveyn indeksi, ad bileşeni) çifti olarak saklanır;
+klasör adları ortak bir bileşen tablosunda bir kez tutulur. Klasörler ön
+sıralı (preorder) eklendiği için her klasörün dosyaları art arda durur ve
+bir ebeveynin indeksi her zaman çocuklarınınkinden küçüktür.
+
+Klasör toplamları, en büyük dosyalar ve yaş dağılımı NumPy varsa sütunlar
+kopyalanmadan vektörel hesaplanır; yoksa saf Python'a düşülür.
+
+Temizlik, anlık görüntüdeki klasörlerin mtime değerini kontrol eder:
+değişmemiş klasörlerdeki dosyalar yeniden listelenmeden silinir, değişen
+klasörler (ve altları) normal şekilde yeniden taranır.
+"""
+import heapq
+import os
+import time
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+
+from .engine import _is_real_dir
+
+# Bu süreden eski anlık görüntüler temizlikte kullanılmaz; dosya içerikleri
+# klasör mtime'ını değiştirmeden güncellenebilir (saklama kuralları için)
+SNAPSHOT_MAX_AGE = 15 * 60
+
+# Klasör bağlantıları (symlink / junction) bu mtime ile işaretlenir; içlerine girilmez
+LINK_MTIME = -1
+
+# Yaş dağılımının gün cinsinden üst sınırları; sonuncusundan eskiler ayrı bir gruptur
+AGE_BUCKETS = (1, 7, 30, 90, 365)
+
+# Saklama kuralları ve kök filtreleri için DirEntry / stat yerine geçen hafif kayıtlar
+SnapshotEntry = namedtuple('SnapshotEntry', 'name path')
+SnapshotStat = namedtuple('SnapshotStat', 'st_size st_mtime')
+
+_numpy_module = None
+
+def _numpy():
+    """NumPy varsa modülü, yoksa None (isteğe bağlı bağımlılık, ilk kullanımda yüklenir)"""
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy_module = numpy
+    return _numpy_module or None
+
+class ScanSnapshot:
+    """Bir ya da daha fazla kök klasörün sütunlu tarama sonucu"""
+
+    def __init__(self):
+        self.created = time.time()
+        self.roots = {}
+        # Bileşen tablosu: klasör adları (ve kök yolları) bir kez saklanır
+        self.components = bytearray()
+        self.component_offsets = array('I', [0])
+        self._component_ids = {}
+        self.dir_parent = array('i')
+        self.dir_name = array('I')
+        self.dir_mtime = array('q')
+        # dir_first_file[i]:dir_first_file[i + 1] klasörün dosyaları
+        self.dir_first_file = array('I', [0])
+        self.file_dir = array('I')
+        self.file_size = array('q')
+        self.file_mtime = array('I')
+        self.name_offsets = array('I', [0])
+        self.names = bytearray()
+
+    def __len__(self):
+        return len(self.file_size)
+
+    def dir_count(self):
+        return len(self.dir_parent)
+
+    def is_fresh(self, max_age=SNAPSHOT_MAX_AGE):
+        return time.time() - self.created <= max_age
+
+    def root_range(self, folder_path):
+        """Kökün klasör aralığı (ilk, son + 1); kök taranmamışsa None"""
+        return self.roots.get(os.path.normcase(os.path.abspath(folder_path)))
+
+    def add_root(self, folder_path):
+        """Klasörü tara ve ekle - (boyut, dosya sayısı) döndür"""
+        root = os.path.abspath(folder_path)
+        try:
+            root_mtime = os.stat(root).st_mtime_ns
+        except OSError:
+            return 0, 0
+
+        first_dir = self.dir_count()
+        first_file = len(self)
+        pending = [(root, -1, root_mtime)]
+        while pending:
+            path, parent, mtime_ns = pending.pop()
+            name = path if parent < 0 else os.path.basename(path)
+            index = self.add_dir(name, parent, mtime_ns)
+            if mtime_ns != LINK_MTIME:
+                self._scan_dir(path, index, pending)
+            self.end_dir()
+
+        self.roots[os.path.normcase(root)] = (first_dir, self.dir_count())
+        return sum(self.file_size[first_file:]), len(self) - first_file
+
+    def _scan_dir(self, path, index, pending):
+        """Klasörü listele; dosyaları sütunlara, alt klasörleri kuyruğa ekle"""
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if _is_real_dir(entry):
+                            pending.append((entry.path, index, entry.stat(follow_symlinks=False).st_mtime_ns))
+                        elif entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, index, LINK_MTIME))
+                        else:
+                            entry_stat = entry.stat(follow_symlinks=False)
+                            self.add_file(index, entry.name, entry_stat.st_size, entry_stat.st_mtime)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+
+    def component_id(self, name):
+        """Adı bileşen tablosuna ekle (zaten varsa var olanın numarası)"""
+        component = self._component_ids.get(name)
+        if component is None:
+            component = len(self.component_offsets) - 1
+            self._component_ids[name] = component
+            self.components += name.encode('utf-8', 'surrogatepass')
+            self.component_offsets.append(len(self.components))
+        return component
+
+    def add_dir(self, name, parent, mtime_ns):
+        """Klasör satırı ekle; ardından dosyaları add_file ile eklenir ve end_dir çağrılır.
+
+        Ön sıra korunmalıdır: bir klasörün tüm alt ağacı, kardeşinden önce eklenir.
+        """
+        self.dir_parent.append(parent)
+        self.dir_name.append(self.component_id(name))
+        self.dir_mtime.append(mtime_ns)
+        return len(self.dir_parent) - 1
+
+    def end_dir(self):
+        self.dir_first_file.append(len(self.file_size))
+
+    def add_file(self, dir_index, name, size, mtime):
+        self.file_dir.append(dir_index)
+        self.file_size.append(size)
+        # Saniye çözünürlüğü yaş kuralları için yeterli; 1970 öncesi tarihler 0 olur
+        self.file_mtime.append(min(max(int(mtime), 0), 0xFFFFFFFF))
+        self.names += name.encode('utf-8', 'surrogatepass')
+        self.name_offsets.append(len(self.names))
+
+    def component(self, component):
+        data = self.components[self.component_offsets[component]:self.component_offsets[component + 1]]
+        return data.decode('utf-8', 'surrogatepass')
+
+    def dir_path(self, dir_index):
+        parts = []
+        while dir_index >= 0:
+            parts.append(self.component(self.dir_name[dir_index]))
+            dir_index = self.dir_parent[dir_index]
+        return os.path.join(*reversed(parts))
+
+    def file_name(self, index):
+        name = self.names[self.name_offsets[index]:self.name_offsets[index + 1]]
+        return name.decode('utf-8', 'surrogatepass')
+
+    def file_path(self, index):
+        return os.path.join(self.dir_path(self.file_dir[index]), self.file_name(index))
+
+    def dir_files(self, dir_index):
+        """Klasörün doğrudan içindeki dosyaların indeks aralığı"""
+        return range(self.dir_first_file[dir_index], self.dir_first_file[dir_index + 1])
+
+    def dir_rows(self, folder_path):
+        """SizeIndex için (yol, ebeveyn, mtime_ns, boyut, dosya sayısı) satırları"""
+        first_dir, end_dir = self.root_range(folder_path)
+        rows = []
+        for index in range(first_dir, end_dir):
+            if self.dir_mtime[index] == LINK_MTIME:
+                continue
+            # Sadece kökün klasörleri; dosyaları art arda durduğu için dilim toplamı yeterli
+            first_file = self.dir_first_file[index]
+            end_file = self.dir_first_file[index + 1]
+            path = self.dir_path(index)
+            rows.append((path, os.path.dirname(path), self.dir_mtime[index],
+                         sum(self.file_size[first_file:end_file]), end_file - first_file))
+        return rows
+
+    def dir_totals(self, recursive=True):
+        """Klasör başına (boyut listesi, dosya sayısı listesi); recursive ise alt klasörler dahil"""
+        dirs = self.dir_count()
+        np = _numpy()
+        if np is not None:
+            file_dir = np.frombuffer(self.file_dir, dtype=self.file_dir.typecode)
+            file_size = np.frombuffer(self.file_size, dtype=self.file_size.typecode)
+            sizes = np.bincount(file_dir, weights=file_size, minlength=dirs).astype(np.int64).tolist()
+            counts = np.bincount(file_dir, minlength=dirs).tolist()
+        else:
+            sizes = [0] * dirs
+            counts = [0] * dirs
+            for dir_index in range(dirs):
+                files = self.dir_files(dir_index)
+                sizes[dir_index] = sum(self.file_size[files.start:files.stop])
+                counts[dir_index] = len(files)
+
+        if recursive:
+            # Ön sırada ebeveyn her zaman önce gelir; sondan başa toplamak yeterli
+            for dir_index in range(dirs - 1, -1, -1):
+                parent = self.dir_parent[dir_index]
+                if parent >= 0:
+                    sizes[parent] += sizes[dir_index]
+                    counts[parent] += counts[dir_index]
+        return sizes, counts
+
+    def largest_files(self, count=20):
+        """En büyük dosyalar: [(boyut, yol)], büyükten küçüğe"""
+        count = min(count, len(self))
+        if count <= 0:
+            return []
+        np = _numpy()
+        if np is not None:
+            file_size = np.frombuffer(self.file_size, dtype=self.file_size.typecode)
+            top = np.argpartition(file_size, -count)[-count:]
+            indexes = top[np.argsort(file_size[top])[::-1]].tolist()
+        else:
+            indexes = heapq.nlargest(count, range(len(self)), key=self.file_size.__getitem__)
+        return [(self.file_size[index], self.file_path(index)) for index in indexes]
+
+    def largest_dirs(self, count=20):
+        """Alt klasörleri dahil en büyük klasörler: [(boyut, yol)], büyükten küçüğe"""
+        sizes, _ = self.dir_totals()
+        indexes = heapq.nlargest(count, range(len(sizes)), key=sizes.__getitem__)
+        return [(sizes[index], self.dir_path(index)) for index in indexes]
+
+    def age_histogram(self, buckets=AGE_BUCKETS, now=None):
+        """Yaş dağılımı: [{'max_days', 'files', 'bytes'}]; son grubun max_days'i None"""
+        now = time.time() if now is None else now
+        edges = [now - days * 86400 for days in reversed(buckets)]
+        groups = len(buckets) + 1
+        np = _numpy()
+        if np is not None:
+            file_mtime = np.frombuffer(self.file_mtime, dtype=self.file_mtime.typecode)
+            file_size = np.frombuffer(self.file_size, dtype=self.file_size.typecode)
+            # edges artan sırada: en eski grup 0, en yeni grup len(buckets)
+            group = np.searchsorted(np.array(edges), file_mtime, side='right')
+            files = np.bincount(group, minlength=groups).tolist()
+            sizes = np.bincount(group, weights=file_size, minlength=groups).astype(np.int64).tolist()
+        else:
+            files = [0] * groups
+            sizes = [0] * groups
+            for mtime, size in zip(self.file_mtime, self.file_size):
+                group = bisect_right(edges, mtime)
+                files[group] += 1
+                sizes[group] += size
+        limits = [None] + list(reversed(buckets))
+        return [{'max_days': limits[group], 'files': files[group], 'bytes': sizes[group]}
+                for group in reversed(range(groups))]
+
+    def match_files(self, text):
+        """Yolunda text geçen dosyaların indeksleri (ASCII harflerde büyük/küçük duyarsız).
+
+        Adlar bayt dizisinin içinde C düzeyinde aranır; eşleşme bir adın
+        sınırını aşmamalıdır. Klasör yolu eşleşen dosyaların hepsi dahildir.
+        """
+        needle = text.encode('utf-8', 'surrogatepass').lower()
+        dir_match = bytearray(self.dir_count())
+        for dir_index in range(self.dir_count()):
+            if needle in self.dir_path(dir_index).encode('utf-8', 'surrogatepass').lower():
+                dir_match[dir_index] = 1
+
+        names = self.names.lower()
+        hits = []
+        position = names.find(needle)
+        while position >= 0:
+            hits.append(position)
+            position = names.find(needle, position + 1)
+
+        np = _numpy()
+        if np is not None:
+            offsets = np.frombuffer(self.name_offsets, dtype=self.name_offsets.typecode)
+            file_dir = np.frombuffer(self.file_dir, dtype=self.file_dir.typecode)
+            selected = np.frombuffer(bytes(dir_match), dtype=np.uint8)[file_dir].astype(bool)
+            if hits:
+                starts = np.array(hits, dtype=np.int64)
+                files = np.searchsorted(offsets, starts, side='right') - 1
+                inside = starts + len(needle) <= offsets[files + 1]
+                selected[files[inside]] = True
+            return array('I', np.nonzero(selected)[0].astype(np.uint32).tobytes())
+
+        selected = bytearray(dir_match[dir_index] for dir_index in self.file_dir)
+        for start in hits:
+            index = bisect_right(self.name_offsets, start) - 1
+            if start + len(needle) <= self.name_offsets[index + 1]:
+                selected[index] = 1
+        return array('I', (index for index, flag in enumerate(selected) if flag))
+
+    def select_files(self, text='', key='size', descending=True):
+        """Filtrelenmiş ve sıralanmış dosya indeksleri; key 'path', 'size' ya da 'mtime'"""
+        indexes = self.match_files(text) if text else array('I', range(len(self)))
+        if key == 'path':
+            # Önce klasörler yol sırasına konur; dosyalar (klasör sırası, ad) ile sıralanır
+            dir_rank = [0] * self.dir_count()
+            for rank, dir_index in enumerate(sorted(range(self.dir_count()), key=self.dir_path)):
+                dir_rank[dir_index] = rank
+            offsets = self.name_offsets
+            ordered = sorted(indexes, key=lambda index: (dir_rank[self.file_dir[index]],
+                                                         self.names[offsets[index]:offsets[index + 1]]),
+                             reverse=descending)
+            return array('I', ordered)
+
+        column = self.file_size if key == 'size' else self.file_mtime
+        np = _numpy()
+        if np is not None:
+            values = np.frombuffer(column, dtype=column.typecode)
+            selected = np.frombuffer(indexes, dtype=indexes.typecode)
+            order = selected[np.argsort(values[selected], kind='stable')]
+            if descending:
+                order = order[::-1]
+            return array('I', order.astype(np.uint32).tobytes())
+        return array('I', sorted(indexes, key=column.__getitem__, reverse=descending))
+
+    def nbytes(self):
+        """Sütunların ve tabloların yaklaşık bellek kullanımı"""
+        columns = (self.component_offsets, self.dir_parent, self.dir_name, self.dir_mtime,
+                   self.dir_first_file, self.file_dir, self.file_size, self.file_mtime, self.name_offsets)
+        return (sum(column.itemsize * len(column) for column in columns)
+                + len(self.names) + len(self.components))
@@ -0,0 +1,172 @@
+"""Temizlenen ve analiz edilen konumların kayıt defteri.
+
+Her hedef bir kök anahtarı (ör. 'local_appdata') ve bu köke göre yollardan
+oluşur; yollar '*' gibi joker karakterler içerebilir. Kökler default_roots()
+ile ortam değişkenlerinden çözülür (bir kök birden çok klasör olabilir, ör.
+sürücü başına geri dönüşüm kutusu) ama Cleaner ve DiskAnalyzer'a başka bir
+sözlük verilerek değiştirilebilir (ör. sahte köklerle test ve ölçüm).
+Yeni bir uygulama önbelleği eklemek için TARGETS'a bir satır eklemek yeter.
+Klasörleri sabit yollarla ifade edilemeyen hedefler (ör. tarayıcı profilleri,
+bkz. browsers.py) discover ile kendi bulma işlevini verir.
+"""
+import glob
+import os
+from fnmatch import fnmatchcase
+
+from .browsers import chromium_discovery, firefox_discovery
+from .recycle import recycle_bin_folders
+from .utils import windows_dir
+
+# (kategori, etiket) - temizlik bu sırayla kuyruğa eklenir
+CATEGORIES = [
+    ('temp_files', "Temp dosyaları"),
+    ('prefetch', "Prefetch dosyaları"),
+    ('browser_cache', "Tarayıcı önbellekleri"),
+    ('app_cache', "Uygulama önbellekleri"),
+    ('software_distribution', "Windows Update artıkları"),
+    ('recycle_bin', "Geri dönüşüm kutusu"),
+    # Hedefi yok: DiskAnalyzer.find_duplicates sonucu Cleaner'a verilir
+    ('duplicates', "Yinelenen dosyalar"),
+]
+
+# Temp köklerinde bu adları içeren girdilere dokunulmaz
+CRITICAL_NAMES = ('system32', 'drivers', 'winsxs', 'catroot', 'logs', 'system')
+
+def default_roots():
+    """Kök anahtarlarının bu sistemdeki karşılıkları"""
+    profile = os.environ.get('USERPROFILE', '')
+    return {
+        'temp': os.environ.get('TEMP', ''),
+        'tmp': os.environ.get('TMP', ''),
+        'windows': windows_dir(),
+        'profile': profile,
+        'local_appdata': os.path.join(profile, 'AppData', 'Local') if profile else '',
+        'appdata': os.path.join(profile, 'AppData', 'Roaming') if profile else '',
+        'recycle_bin': recycle_bin_folders(),
+    }
+
+class Target:
+    """Tek bir temizlik hedefi.
+
+    paths:    köke göre '/' ile ayrılmış yollar; joker karakter içerebilir
+    patterns: boş değilse kökün doğrudan içinde sadece bu desenlere uyan
+              girdiler silinir (büyük/küçük harf duyarsız)
+    protect:  kökün doğrudan içinde yolu bu adlardan birini içeren girdiler atlanır
+    recreate: True ise klasör yerinde (boş) kalır, False ise kendisi de silinir
+    discover: verilirse paths yerine discover(roots) klasör listesini döndürür
+    swap:     True ise klasör bir mezar taşına taşınıp boş olarak yeniden
+              açılır, içerik sonra silinir (bkz. tombstone.py); sadece
+              tamamen boşaltılan, recreate=True hedefler içindir
+    processes: klasörü kullanan uygulamanın süreç adları ('.exe' olmadan);
+              uygulama çalışırken hedef ertelenir (bkz. processes.py)
+    """
+
+    def __init__(self, name, category, root, paths=('',), patterns=(), protect=(), recreate=True, discover=None,
+                 swap=False, processes=()):
+        self.name = name
+        self.category = category
+        self.root = root
+        self.paths = paths
+        self.patterns = [pattern.lower() for pattern in patterns]
+        self.protect = protect
+        self.recreate = recreate
+        self.discover = discover
+        self.swap = swap
+        self.processes = processes
+
+    def resolve(self, roots):
+        """Var olan klasörlerin listesi"""
+        if self.discover is not None:
+            return [folder for folder in self.discover(roots) if os.path.isdir(folder)]
+        bases = roots.get(self.root)
+        if not bases:
+            return []
+        if isinstance(bases, str):
+            bases = [bases]
+        folders = []
+        for base in bases:
+            for path in self.paths:
+                parts = [part for part in path.split('/') if part]
+                if any(char in path for char in '*?['):
+                    folders.extend(sorted(glob.glob(os.path.join(glob.escape(base), *parts))))
+                else:
+                    folders.append(os.path.join(base, *parts))
+        return [folder for folder in folders if os.path.isdir(folder)]
+
+    def entry_filter(self):
+        """ParallelDeleter.add_tree için kök girdisi filtresi (gerekmiyorsa None)"""
+        if not self.patterns and not self.protect:
+            return None
+
+        def allowed(entry):
+            if self.protect:
+                path = entry.path.lower()
+                if any(name in path for name in self.protect):
+                    return False
+            if self.patterns:
+                name = entry.name.lower()
+                return any(fnmatchcase(name, pattern) for pattern in self.patterns)
+            return True
+
+        return allowed
+
+TARGETS = [
+    Target('User Temp', 'temp_files', 'temp', protect=CRITICAL_NAMES),
+    Target('User TMP', 'temp_files', 'tmp', protect=CRITICAL_NAMES),
+    Target('System Temp', 'temp_files', 'windows', ['Temp'], protect=CRITICAL_NAMES),
+    Target('Profile Temp', 'temp_files', 'local_appdata', ['Temp'], protect=CRITICAL_NAMES),
+    Target('Prefetch', 'prefetch', 'windows', ['Prefetch'], patterns=['*.pf']),
+    # Her profilin (Local State / profiles.ini) Cache, Code Cache, GPUCache ve
+    # Service Worker\CacheStorage klasörleri; her biri ayrı bir kök olarak silinir
+    Target('Chrome Cache', 'browser_cache', 'local_appdata',
+           discover=chromium_discovery('local_appdata', 'Google/Chrome/User Data'),
+           swap=True, processes=('chrome',)),
+    Target('Edge Cache', 'browser_cache', 'local_appdata',
+           discover=chromium_discovery('local_appdata', 'Microsoft/Edge/User Data'),
+           swap=True, processes=('msedge',)),
+    Target('Brave Cache', 'browser_cache', 'local_appdata',
+           discover=chromium_discovery('local_appdata', 'BraveSoftware/Brave-Browser/User Data'),
+           swap=True, processes=('brave',)),
+    Target('Vivaldi Cache', 'browser_cache', 'local_appdata',
+           discover=chromium_discovery('local_appdata', 'Vivaldi/User Data'),
+           swap=True, processes=('vivaldi',)),
+    # Opera'nın tek profili vardır; önbelleği Local altındaki profil klasöründedir
+    Target('Opera Cache', 'browser_cache', 'local_appdata',
+           discover=chromium_discovery('local_appdata', 'Opera Software/Opera Stable', single_profile=True),
+           swap=True, processes=('opera',)),
+    Target('Opera GX Cache', 'browser_cache', 'local_appdata',
+           discover=chromium_discovery('local_appdata', 'Opera Software/Opera GX Stable', single_profile=True),
+           swap=True, processes=('opera',)),
+    Target('Firefox Cache', 'browser_cache', 'local_appdata', discover=firefox_discovery,
+           swap=True, processes=('firefox',)),
+    Target('Teams Cache', 'app_cache', 'appdata',
+           ['Microsoft/Teams/Cache', 'Microsoft/Teams/Code Cache', 'Microsoft/Teams/GPUCache',
+            'Microsoft/Teams/Service Worker/CacheStorage'], processes=('teams', 'ms-teams')),
+    Target('Discord Cache', 'app_cache', 'appdata',
+           ['discord/Cache', 'discord/Code Cache', 'discord/GPUCache'], processes=('discord',)),
+    Target('VS Code Cache', 'app_cache', 'appdata',
+           ['Code/Cache', 'Code/CachedData', 'Code/Code Cache', 'Code/GPUCache', 'Code/CachedExtensionVSIXs'],
+           processes=('code',)),
+    # Paket yöneticileri eksik önbellek klasörünü kendileri yeniden oluşturur
+    Target('npm Cache', 'app_cache', 'local_appdata', ['npm-cache/_cacache'], recreate=False),
+    Target('pip Cache', 'app_cache', 'local_appdata', ['pip/cache'], recreate=False),
+    # Download değiştirilip silinir; DataStore veritabanı olduğu için içerik içerik silinir
+    Target('Windows Update', 'software_distribution', 'windows', ['SoftwareDistribution/Download'], swap=True),
+    Target('Windows Update DataStore', 'software_distribution', 'windows', ['SoftwareDistribution/DataStore']),
+    # Sürücü başına $Recycle.Bin\<SID>; desktop.ini kalır. Klasörlere erişilemezse
+    # Cleaner ve DiskAnalyzer kabuk API'sine (recycle.ShellRecycleBin) düşer.
+    Target('Recycle Bin', 'recycle_bin', 'recycle_bin', patterns=['$r*', '$i*']),
+]
+
+def resolve_targets(targets, roots, category=None):
+    """(hedef, klasör) çiftleri; aynı klasör (ör. TEMP ve TMP) bir kez döner"""
+    seen = set()
+    for target in targets:
+        if category is not None and target.category != category:
+            continue
+        for folder in target.resolve(roots):
+            key = os.path.normcase(os.path.abspath(folder))
+            if key in seen:
+                continue
+            seen.add(key)
+            yield target, folder
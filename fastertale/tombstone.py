@@ -0,0 +1,124 @@
+"""Yeniden oluşturulan önbellek klasörleri için "değiştir ve sil" temizliği.
+
+Klasör aynı üst klasörde bir mezar taşı adına (ör. 'Cache.fastertale-
+tombstone-1a2b3c4d') taşınır ve yerine hemen boş bir klasör açılır. Taşıma
+aynı birimde tek bir yeniden adlandırmadır; klasörü kullanan uygulama (ör.
+tarayıcı) silmenin bitmesini beklemez. Mezar taşı temizlik bittikten sonra
+düşük öncelikli bir arka plan iş parçacığında silinir (purge_later).
+
+Uygulama silme bitmeden kapanırsa mezar taşları yerinde kalır; bir sonraki
+başlangıçta find_tombstones() ile bulunup düşük öncelikli bir arka plan iş
+parçacığında silinir. Klasör kullanımdaysa taşıma başarısız olur ve hedef
+her zamanki gibi içerik içerik silinir.
+"""
+import os
+import threading
+import time
+import uuid
+
+from .engine import delete_path
+from .utils import background_thread
+
+TOMBSTONE_MARK = '.fastertale-tombstone-'
+
+def is_tombstone(name):
+    return TOMBSTONE_MARK in name
+
+def swap_out(folder):
+    """Klasörü mezar taşı adına taşı ve yerine boş klasör aç; mezar taşının yolunu döndür.
+
+    Taşınamazsa (kullanımda, izin yok) ya da yerine boş klasör açılamazsa
+    None döner ve klasör yerinde kalır.
+    """
+    folder = folder.rstrip('/\\') or folder
+    tombstone = f"{folder}{TOMBSTONE_MARK}{uuid.uuid4().hex[:8]}"
+    try:
+        os.rename(folder, tombstone)
+    except OSError:
+        return None
+    try:
+        os.mkdir(folder)
+    except FileExistsError:
+        # Sahibi uygulama klasörü bizden önce yeniden açtı
+        pass
+    except OSError:
+        # Klasör eksik kalmasın: taşımayı geri al, hedef içerik içerik silinsin
+        try:
+            os.rename(tombstone, folder)
+        except OSError:
+            pass
+        return None
+    return tombstone
+
+def find_tombstones(folders):
+    """Klasörlerin üst klasörlerinde kalmış mezar taşları"""
+    seen = set()
+    tombstones = []
+    for folder in folders:
+        parent = os.path.dirname(folder.rstrip('/\\'))
+        key = os.path.normcase(parent)
+        if not parent or key in seen:
+            continue
+        seen.add(key)
+        try:
+            with os.scandir(parent) as entries:
+                tombstones.extend(entry.path for entry in entries
+                                  if is_tombstone(entry.name) and entry.is_dir(follow_symlinks=False))
+        except OSError:
+            continue
+    return tombstones
+
+def purge_tombstones(tombstones):
+    """Mezar taşlarını sil - (boyut, dosya sayısı) döndür"""
+    freed = 0
+    count = 0
+    with background_thread():
+        for tombstone in tombstones:
+            tombstone_freed, tombstone_count = delete_path(tombstone)
+            freed += tombstone_freed
+            count += tombstone_count
+    return freed, count
+
+def purge_in_background(folders, done=None):
+    """Klasörlerin yanında kalmış mezar taşlarını ayrı bir iş parçacığında sil.
+
+    folders bir üreteç olabilir; hedefler de bu iş parçacığında çözülür.
+    done(boyut, sayı) verilirse silinecek mezar taşı bulunduğunda, silme
+    bitince çağrılır. Başlatılan iş parçacığını döndürür.
+    """
+    def run():
+        tombstones = find_tombstones(folders)
+        if tombstones:
+            result = purge_tombstones(tombstones)
+            if done is not None:
+                done(*result)
+
+    thread = threading.Thread(target=run, name='FasterTaleTombstones', daemon=True)
+    thread.start()
+    return thread
+
+def purge_later(tombstones, done=None):
+    """(anahtar, mezar taşı) çiftlerini ayrı, düşük öncelikli bir iş parçacığında sil.
+
+    done verilirse silme bitince {anahtar: (boyut, dosya sayısı, saniye)} ile
+    çağrılır; boyutu önceden bilinmeyen mezar taşlarının sonucu böyle öğrenilir.
+    Başlatılan iş parçacığını döndürür.
+    """
+    tombstones = list(tombstones)
+
+    def run():
+        totals = {}
+        with background_thread():
+            for key, tombstone in tombstones:
+                started = time.perf_counter()
+                freed, count = delete_path(tombstone)
+                data = totals.setdefault(key, [0, 0, 0.0])
+                data[0] += freed
+                data[1] += count
+                data[2] += time.perf_counter() - started
+        if done is not None:
+            done({key: tuple(data) for key, data in totals.items()})
+
+    thread = threading.Thread(target=run, name='FasterTaleTombstones', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,78 @@
+"""Qt'den bağımsız yardımcı işlevler"""
+import ctypes
+import os
+import sys
+import threading
+from contextlib import contextmanager
+
+# THREAD_MODE_BACKGROUND_BEGIN / END: iş parçacığının CPU ve G/Ç önceliğini düşürür
+_BACKGROUND_BEGIN = 0x00010000
+_BACKGROUND_END = 0x00020000
+
+def is_admin():
+    """Yönetici yetkisi kontrolü"""
+    try:
+        return ctypes.windll.shell32.IsUserAnAdmin()
+    except:
+        return False
+
+def enter_background():
+    """Sadece geçerli iş parçacığının CPU ve G/Ç önceliğini düşür.
+
+    Windows'ta THREAD_MODE_BACKGROUND_BEGIN, Linux'ta iş parçacığı kimliğine
+    nice 19 ve boşta G/Ç sınıfı (ikisi de Linux'ta iş parçacığı başınadır).
+    Linux'ta yetkisiz bir iş parçacığı önceliğini geri yükseltemez; bu yüzden
+    sadece işi bitince sonlanan iş parçacıklarında kullanılmalıdır. Öncelik
+    leave_background() ile geri alınabiliyorsa True döndürür.
+    """
+    kernel32 = getattr(ctypes, 'windll', None) and ctypes.windll.kernel32
+    if kernel32:
+        return bool(kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _BACKGROUND_BEGIN))
+    if not sys.platform.startswith('linux'):
+        # Diğer POSIX sistemlerde nice tüm süreci etkilerdi (arayüz dahil)
+        return False
+    thread_id = threading.get_native_id()
+    try:
+        os.setpriority(os.PRIO_PROCESS, thread_id, 19)
+    except OSError:
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return False
+    try:
+        # ioprio_set de bir iş parçacığı kimliğiyle sadece o iş parçacığını etkiler
+        psutil.Process(thread_id).ionice(psutil.IOPRIO_CLASS_IDLE)
+    except (psutil.Error, OSError):
+        pass
+    return False
+
+def leave_background():
+    """enter_background() True döndürdüyse önceliği geri al"""
+    kernel32 = ctypes.windll.kernel32
+    kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _BACKGROUND_END)
+
+@contextmanager
+def background_thread():
+    """Blok boyunca geçerli iş parçacığını arka plan önceliğine al"""
+    lowered = enter_background()
+    try:
+        yield
+    finally:
+        if lowered:
+            leave_background()
+
+def windows_dir():
+    """Windows klasörü (%SystemRoot%); sistem C: dışında kurulu olabilir"""
+    return os.environ.get('SystemRoot') or os.environ.get('WINDIR') or r'C:\Windows'
+
+def format_size(size_bytes):
+    """Byte'ları okunabilir formata çevir"""
+    if size_bytes == 0:
+        return "0 B"
+        
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.2f} {unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.2f} TB"
@@ -1,1057 +1,1626 @@
-import sys
-import os
-import shutil
-import psutil
-import winreg
-import ctypes
-from pathlib import Path
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QPushButton, QListWidget, QListWidgetItem,
-                             QLabel, QProgressBar, QTextEdit, QGroupBox, 
-                             QCheckBox, QMessageBox, QSplitter, QTabWidget,
-                             QSystemTrayIcon, QMenu, QAction, QStyle, QTreeWidget,
-                             QTreeWidgetItem, QHeaderView, QToolBar, QStatusBar,
-                             QFileDialog, QInputDialog, QLineEdit, QSpinBox,
-                             QFormLayout, QDialog, QDialogButtonBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize
-from PyQt5.QtGui import QFont, QIcon, QPalette, QColor, QPixmap
-import json
-from datetime import datetime, timedelta
-
-def is_admin():
-    """Yönetici yetkisi kontrolü"""
-    try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
-    except:
-        return False
-
-class CleanerWorker(QThread):
-    progress_signal = pyqtSignal(int, str)
-    finished_signal = pyqtSignal(dict)
-    error_signal = pyqtSignal(str)
-
-    def __init__(self, cleaning_options):
-        super().__init__()
-        self.cleaning_options = cleaning_options
-        self.total_freed = 0
-        self.deleted_files = 0
-
-    def run(self):
-        try:
-            results = self.perform_cleaning()
-            self.finished_signal.emit(results)
-        except Exception as e:
-            self.error_signal.emit(str(e))
-
-    def get_folder_size(self, folder_path):
-        """Klasör boyutunu ve dosya sayısını hesapla"""
-        total_size = 0
-        file_count = 0
-        try:
-            for dirpath, dirnames, filenames in os.walk(folder_path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        if os.path.isfile(filepath):
-                            total_size += os.path.getsize(filepath)
-                            file_count += 1
-                    except OSError:
-                        continue
-        except OSError:
-            pass
-        return total_size, file_count
-
-    def safe_delete(self, path):
-        """Güvenli silme işlemi - boyutu silmeden önce al"""
-        try:
-            if os.path.isfile(path):
-                # Boyutu silmeden önce al
-                file_size = os.path.getsize(path)
-                os.remove(path)
-                return file_size, 1  # 1 dosya silindi
-            elif os.path.isdir(path):
-                # Klasör boyutunu ve dosya sayısını silmeden önce al
-                folder_size, file_count = self.get_folder_size(path)
-                shutil.rmtree(path, ignore_errors=True)
-                return folder_size, file_count
-        except OSError as e:
-            print(f"Silme hatası {path}: {e}")
-            return 0, 0
-        return 0, 0
-
-    def clean_temp_files(self):
-        """Temp dosyalarını temizle"""
-        temp_folders = [
-            os.environ.get('TEMP', ''),
-            os.environ.get('TMP', ''),
-            r'C:\Windows\Temp',
-            os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Local', 'Temp')
-        ]
-        
-        freed_space = 0
-        deleted_count = 0
-        
-        for temp_folder in temp_folders:
-            if not os.path.exists(temp_folder):
-                continue
-                
-            self.progress_signal.emit(0, f"Taranıyor: {temp_folder}")
-            
-            try:
-                for item in os.listdir(temp_folder):
-                    item_path = os.path.join(temp_folder, item)
-                    
-                    # Kritik sistem dosyalarını atla
-                    critical_folders = ['system32', 'drivers', 'winsxs', 'catroot', 'logs', 'system']
-                    if any(critical in item_path.lower() for critical in critical_folders):
-                        continue
-                    
-                    try:
-                        # Boyutu ve sayıyı silmeden önce al
-                        size, count = self.safe_delete(item_path)
-                        freed_space += size
-                        deleted_count += count
-                    except OSError:
-                        continue
-                        
-            except OSError:
-                continue
-        
-        return freed_space, deleted_count
-
-    def clean_prefetch(self):
-        """Prefetch dosyalarını temizle"""
-        prefetch_path = r'C:\Windows\Prefetch'
-        freed_space = 0
-        deleted_count = 0
-        
-        if not os.path.exists(prefetch_path):
-            return freed_space, deleted_count
-            
-        try:
-            for item in os.listdir(prefetch_path):
-                if item.lower().endswith('.pf'):
-                    item_path = os.path.join(prefetch_path, item)
-                    try:
-                        size, count = self.safe_delete(item_path)
-                        freed_space += size
-                        deleted_count += count
-                    except OSError:
-                        continue
-        except OSError:
-            pass
-            
-        return freed_space, deleted_count
-
-    def clean_browser_cache(self):
-        """Tarayıcı önbelleklerini temizle"""
-        browsers = {
-            'Chrome': [
-                os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Local', 'Google', 'Chrome', 'User Data', 'Default', 'Cache'),
-                os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Local', 'Google', 'Chrome', 'User Data', 'Default', 'Code Cache'),
-            ],
-            'Edge': [
-                os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Local', 'Microsoft', 'Edge', 'User Data', 'Default', 'Cache'),
-                os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Local', 'Microsoft', 'Edge', 'User Data', 'Default', 'Code Cache'),
-            ],
-            'Firefox': [
-                os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Local', 'Mozilla', 'Firefox', 'Profiles'),
-            ]
-        }
-        
-        freed_space = 0
-        deleted_count = 0
-        
-        for browser, cache_paths in browsers.items():
-            self.progress_signal.emit(0, f"{browser} önbelleği temizleniyor...")
-            
-            for cache_path in cache_paths:
-                if not os.path.exists(cache_path):
-                    continue
-                    
-                try:
-                    if 'Firefox' in browser:
-                        # Firefox için özel işlem
-                        for profile in os.listdir(cache_path):
-                            profile_path = os.path.join(cache_path, profile)
-                            cache_folders = ['cache2', 'cache', 'thumbnails']
-                            for cache_folder in cache_folders:
-                                cache_folder_path = os.path.join(profile_path, cache_folder)
-                                if os.path.exists(cache_folder_path):
-                                    size, count = self.get_folder_size(cache_folder_path)
-                                    shutil.rmtree(cache_folder_path, ignore_errors=True)
-                                    freed_space += size
-                                    deleted_count += count
-                                    # Cache klasörünü yeniden oluştur
-                                    os.makedirs(cache_folder_path, exist_ok=True)
-                    else:
-                        # Chrome/Edge için
-                        size, count = self.get_folder_size(cache_path)
-                        shutil.rmtree(cache_path, ignore_errors=True)
-                        # Cache klasörünü yeniden oluştur
-                        os.makedirs(cache_path, exist_ok=True)
-                        freed_space += size
-                        deleted_count += count
-                        
-                except OSError as e:
-                    print(f"Tarayıcı cache temizleme hatası: {e}")
-                    continue
-        
-        return freed_space, deleted_count
-
-    def clean_recycle_bin(self):
-        """Geri dönüşüm kutusunu temizle"""
-        try:
-            # Windows API kullanarak geri dönüşüm kutusunu boşalt
-            SHEmptyRecycleBin = ctypes.windll.shell32.SHEmptyRecycleBinW
-            result = SHEmptyRecycleBin(None, None, 0x0001)  # SHERB_NOCONFIRMATION
-            
-            if result == 0:
-                # Başarılı, ama boyut bilgisi yok
-                return 0, 0
-            else:
-                return 0, 0
-                
-        except Exception as e:
-            print(f"Geri dönüşüm kutusu temizleme hatası: {e}")
-            return 0, 0
-
-    def clean_software_distribution(self):
-        """Windows Update artıklarını temizle"""
-        softwaredist_path = r'C:\Windows\SoftwareDistribution'
-        freed_space = 0
-        deleted_count = 0
-        
-        if not os.path.exists(softwaredist_path):
-            return freed_space, deleted_count
-            
-        # Sadece bu alt klasörleri temizle (güvenli)
-        safe_folders = ['Download', 'DataStore']
-        
-        for folder in safe_folders:
-            folder_path = os.path.join(softwaredist_path, folder)
-            if os.path.exists(folder_path):
-                try:
-                    size, count = self.get_folder_size(folder_path)
-                    shutil.rmtree(folder_path, ignore_errors=True)
-                    # Klasörü yeniden oluştur (Windows Update için gerekli)
-                    os.makedirs(folder_path, exist_ok=True)
-                    freed_space += size
-                    deleted_count += count
-                except OSError as e:
-                    print(f"SoftwareDistribution temizleme hatası: {e}")
-                    continue
-        
-        return freed_space, deleted_count
-
-    def perform_cleaning(self):
-        """Temizleme işlemini gerçekleştir"""
-        total_freed = 0
-        total_deleted = 0
-        results = {}
-
-        # Yönetici kontrolü
-        if not is_admin():
-            self.progress_signal.emit(0, "Yönetici yetkisi yok - bazı işlemler atlanacak...")
-
-        progress_values = {
-            'temp_files': 20,
-            'prefetch': 40,
-            'browser_cache': 60,
-            'software_distribution': 80,
-            'recycle_bin': 95
-        }
-
-        current_progress = 0
-
-        if self.cleaning_options.get('temp_files', False):
-            current_progress += 5
-            self.progress_signal.emit(current_progress, "Temp dosyaları temizleniyor...")
-            freed, count = self.clean_temp_files()
-            total_freed += freed
-            total_deleted += count
-            results['temp_files'] = {'freed': freed, 'count': count}
-            current_progress = progress_values['temp_files']
-            self.progress_signal.emit(current_progress, f"Temp temizlendi: {self.format_size(freed)}")
-
-        if self.cleaning_options.get('prefetch', False):
-            current_progress += 5
-            self.progress_signal.emit(current_progress, "Prefetch dosyaları temizleniyor...")
-            freed, count = self.clean_prefetch()
-            total_freed += freed
-            total_deleted += count
-            results['prefetch'] = {'freed': freed, 'count': count}
-            current_progress = progress_values['prefetch']
-            self.progress_signal.emit(current_progress, f"Prefetch temizlendi: {self.format_size(freed)}")
-
-        if self.cleaning_options.get('browser_cache', False):
-            current_progress += 5
-            self.progress_signal.emit(current_progress, "Tarayıcı önbellekleri temizleniyor...")
-            freed, count = self.clean_browser_cache()
-            total_freed += freed
-            total_deleted += count
-            results['browser_cache'] = {'freed': freed, 'count': count}
-            current_progress = progress_values['browser_cache']
-            self.progress_signal.emit(current_progress, f"Tarayıcı cache temizlendi: {self.format_size(freed)}")
-
-        if self.cleaning_options.get('software_distribution', False):
-            current_progress += 5
-            self.progress_signal.emit(current_progress, "Windows Update artıkları temizleniyor...")
-            freed, count = self.clean_software_distribution()
-            total_freed += freed
-            total_deleted += count
-            results['software_distribution'] = {'freed': freed, 'count': count}
-            current_progress = progress_values['software_distribution']
-            self.progress_signal.emit(current_progress, f"Windows Update temizlendi: {self.format_size(freed)}")
-
-        if self.cleaning_options.get('recycle_bin', False):
-            current_progress += 5
-            self.progress_signal.emit(current_progress, "Geri dönüşüm kutusu temizleniyor...")
-            freed, count = self.clean_recycle_bin()
-            total_freed += freed
-            total_deleted += count
-            results['recycle_bin'] = {'freed': freed, 'count': count}
-            current_progress = progress_values['recycle_bin']
-            self.progress_signal.emit(current_progress, "Geri dönüşüm kutusu temizlendi")
-
-        results['total'] = {'freed': total_freed, 'count': total_deleted}
-        return results
-
-    def format_size(self, size_bytes):
-        """Byte'ları okunabilir formata çevir"""
-        if size_bytes == 0:
-            return "0 B"
-            
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} TB"
-
-class DiskAnalyzerWorker(QThread):
-    analysis_complete = pyqtSignal(dict)
-    progress_signal = pyqtSignal(int, str)
-
-    def __init__(self):
-        super().__init__()
-
-    def run(self):
-        analysis_results = self.analyze_disk_space()
-        self.analysis_complete.emit(analysis_results)
-
-    def analyze_disk_space(self):
-        """Disk kullanımını analiz et"""
-        analysis = {}
-        
-        # Temp klasörleri analizi
-        temp_locations = [
-            ('User Temp', os.environ.get('TEMP', '')),
-            ('System Temp', r'C:\Windows\Temp'),
-            ('Prefetch', r'C:\Windows\Prefetch'),
-            ('Browser Cache', os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Local', 'Google', 'Chrome', 'User Data', 'Default', 'Cache'))
-        ]
-        
-        for i, (name, path) in enumerate(temp_locations):
-            if os.path.exists(path):
-                size, count = self.get_folder_size(path)
-                analysis[name] = {
-                    'size': size,
-                    'count': count,
-                    'size_str': self.format_size(size),
-                    'path': path
-                }
-                progress = 25 * (i + 1)
-                self.progress_signal.emit(progress, f"{name} analiz ediliyor...")
-        
-        # Disk bilgileri
-        disk_info = {}
-        for partition in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                disk_info[partition.device] = {
-                    'total': usage.total,
-                    'used': usage.used,
-                    'free': usage.free,
-                    'percent': usage.percent
-                }
-            except PermissionError:
-                continue
-        
-        analysis['disk_info'] = disk_info
-        return analysis
-
-    def get_folder_size(self, folder_path):
-        """Klasör boyutunu ve dosya sayısını hesapla"""
-        total_size = 0
-        file_count = 0
-        try:
-            for dirpath, dirnames, filenames in os.walk(folder_path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        if os.path.isfile(filepath):
-                            total_size += os.path.getsize(filepath)
-                            file_count += 1
-                    except OSError:
-                        continue
-        except OSError:
-            pass
-        return total_size, file_count
-
-    def format_size(self, size_bytes):
-        """Byte'ları okunabilir formata çevir"""
-        if size_bytes == 0:
-            return "0 B"
-            
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} TB"
-
-class WindowsCleanerApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.db_manager = None
-        self.cleaner_worker = None
-        self.analyzer_worker = None
-        self.init_ui()
-        self.load_settings()
-        
-        # Yönetici kontrolü
-        self.check_admin_status()
-        
-        # Sistem tepsisine icon ekle
-        self.setup_tray_icon()
-
-    def check_admin_status(self):
-        """Yönetici durumunu kontrol et ve kullanıcıyı bilgilendir"""
-        if not is_admin():
-            self.status_bar.showMessage("UYARI: Yönetici olarak çalıştırılmadı - bazı işlemler kısıtlı")
-            
-            # Kullanıcıya bilgi ver (sadece ilk açılışta)
-            if not hasattr(self, 'admin_warning_shown'):
-                QMessageBox.warning(self, "Yönetici Yetkisi", 
-                                  "Program yönetici yetkisi olmadan çalışıyor.\n\n"
-                                  "Bazı sistem dosyalarına erişim kısıtlı olabilir.\n"
-                                  "Tam erişim için programı 'Yönetici olarak çalıştırın'.")
-                self.admin_warning_shown = True
-
-    def init_ui(self):
-        self.setWindowTitle("Windows Temizleyici Pro - Güvenli Sistem Optimizasyonu")
-        self.setGeometry(100, 100, 900, 700)
-        self.setMinimumSize(800, 600)
-
-        # Merkezi widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        layout = QVBoxLayout(central_widget)
-
-        # Başlık
-        title_label = QLabel("Windows Temizleyici Pro")
-        title_label.setFont(QFont("Arial", 16, QFont.Bold))
-        title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("color: #2c3e50; margin: 10px;")
-        layout.addWidget(title_label)
-
-        # Admin durumu göstergesi
-        self.admin_label = QLabel()
-        self.admin_label.setAlignment(Qt.AlignCenter)
-        self.update_admin_display()
-        layout.addWidget(self.admin_label)
-
-        # Tab widget
-        self.tabs = QTabWidget()
-        layout.addWidget(self.tabs)
-
-        # Temizleme sekmesi
-        self.setup_cleaning_tab()
-        
-        # Analiz sekmesi
-        self.setup_analysis_tab()
-        
-        # Ayarlar sekmesi
-        self.setup_settings_tab()
-
-        # Durum çubuğu
-        self.status_bar = QStatusBar()
-        self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("Hazır")
-
-        # İlerleme çubuğu
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        layout.addWidget(self.progress_bar)
-
-    def update_admin_display(self):
-        """Yönetici durumunu ekranda göster"""
-        if is_admin():
-            self.admin_label.setText("✅ Yönetici modunda çalışıyor")
-            self.admin_label.setStyleSheet("color: #27ae60; font-weight: bold; background-color: #d5f4e6; padding: 5px; border-radius: 3px;")
-        else:
-            self.admin_label.setText("⚠️ Yönetici olarak çalıştırılmadı - bazı işlemler kısıtlı")
-            self.admin_label.setStyleSheet("color: #e67e22; font-weight: bold; background-color: #fdebd0; padding: 5px; border-radius: 3px;")
-
-    def setup_cleaning_tab(self):
-        cleaning_tab = QWidget()
-        layout = QVBoxLayout(cleaning_tab)
-
-        # Temizleme seçenekleri grubu
-        options_group = QGroupBox("Temizleme Seçenekleri")
-        options_layout = QVBoxLayout(options_group)
-
-        self.temp_check = QCheckBox("Geçici Dosyaları Temizle (Temp, %Temp%)")
-        self.temp_check.setChecked(True)
-        options_layout.addWidget(self.temp_check)
-
-        self.prefetch_check = QCheckBox("Prefetch Önbelleğini Temizle")
-        self.prefetch_check.setChecked(True)
-        options_layout.addWidget(self.prefetch_check)
-
-        self.browser_check = QCheckBox("Tarayıcı Önbelleklerini Temizle (Chrome, Edge, Firefox)")
-        self.browser_check.setChecked(True)
-        options_layout.addWidget(self.browser_check)
-
-        self.recycle_check = QCheckBox("Geri Dönüşüm Kutusunu Boşalt")
-        self.recycle_check.setChecked(True)
-        options_layout.addWidget(self.recycle_check)
-
-        self.update_check = QCheckBox("Windows Update Artıklarını Temizle (SoftwareDistribution)")
-        self.update_check.setChecked(True)
-        options_layout.addWidget(self.update_check)
-
-        layout.addWidget(options_group)
-
-        # Güvenlik uyarısı
-        warning_label = QLabel("⚠️ UYARI: Bu araç SADECE güvenli dosyaları siler. System32, Drivers, WinSxS gibi kritik sistem dosyalarına DOKUNULMAZ.")
-        warning_label.setStyleSheet("color: #e74c3c; background-color: #fdf2f2; padding: 10px; border: 1px solid #e74c3c; border-radius: 5px;")
-        warning_label.setWordWrap(True)
-        layout.addWidget(warning_label)
-
-        # Butonlar
-        button_layout = QHBoxLayout()
-
-        self.analyze_btn = QPushButton("Disk Alanını Analiz Et")
-        self.analyze_btn.clicked.connect(self.analyze_disk_space)
-        button_layout.addWidget(self.analyze_btn)
-
-        self.clean_btn = QPushButton("Seçilenleri Temizle")
-        self.clean_btn.clicked.connect(self.start_cleaning)
-        self.clean_btn.setStyleSheet("QPushButton { background-color: #27ae60; color: white; font-weight: bold; }")
-        button_layout.addWidget(self.clean_btn)
-
-        layout.addLayout(button_layout)
-
-        # Sonuçlar alanı
-        self.results_text = QTextEdit()
-        self.results_text.setReadOnly(True)
-        self.results_text.setPlaceholderText("Temizleme sonuçları burada görünecek...")
-        layout.addWidget(self.results_text)
-
-        self.tabs.addTab(cleaning_tab, "Temizlik")
-
-    def setup_analysis_tab(self):
-        analysis_tab = QWidget()
-        layout = QVBoxLayout(analysis_tab)
-
-        # Disk analizi
-        analysis_group = QGroupBox("Disk Kullanım Analizi")
-        analysis_layout = QVBoxLayout(analysis_group)
-
-        self.analysis_text = QTextEdit()
-        self.analysis_text.setReadOnly(True)
-        self.analysis_text.setPlaceholderText("Disk analiz sonuçları burada görünecek...")
-        analysis_layout.addWidget(self.analysis_text)
-
-        layout.addWidget(analysis_group)
-
-        self.tabs.addTab(analysis_tab, "Disk Analizi")
-
-    def setup_settings_tab(self):
-        settings_tab = QWidget()
-        layout = QVBoxLayout(settings_tab)
-
-        # Otomatik temizlik
-        auto_group = QGroupBox("Otomatik Temizlik Ayarları")
-        auto_layout = QFormLayout(auto_group)
-
-        self.auto_clean = QCheckBox("Her başlangıçta otomatik temizlik yap")
-        auto_layout.addRow(self.auto_clean)
-
-        self.auto_clean_interval = QSpinBox()
-        self.auto_clean_interval.setRange(1, 30)
-        self.auto_clean_interval.setSuffix(" gün")
-        auto_layout.addRow("Otomatik temizlik aralığı:", self.auto_clean_interval)
-
-        layout.addWidget(auto_group)
-
-        # Yedekleme
-        backup_group = QGroupBox("Yedekleme Ayarları")
-        backup_layout = QVBoxLayout(backup_group)
-
-        self.backup_check = QCheckBox("Temizlemeden önce yedek oluştur")
-        backup_layout.addWidget(self.backup_check)
-
-        backup_btn = QPushButton("Yedekleme Klasörünü Seç")
-        backup_btn.clicked.connect(self.select_backup_folder)
-        backup_layout.addWidget(backup_btn)
-
-        layout.addWidget(backup_group)
-
-        # Sistem ayarları
-        system_group = QGroupBox("Sistem Ayarları")
-        system_layout = QVBoxLayout(system_group)
-
-        restore_btn = QPushButton("Sistem Geri Yükleme Noktası Oluştur")
-        restore_btn.clicked.connect(self.create_restore_point)
-        system_layout.addWidget(restore_btn)
-
-        admin_btn = QPushButton("Yönetici Olarak Yeniden Başlat")
-        admin_btn.clicked.connect(self.restart_as_admin)
-        admin_btn.setStyleSheet("QPushButton { background-color: #e74c3c; color: white; }")
-        system_layout.addWidget(admin_btn)
-
-        layout.addWidget(system_group)
-
-        layout.addStretch()
-
-        self.tabs.addTab(settings_tab, "Ayarlar")
-
-    def setup_tray_icon(self):
-        """Sistem tepsi ikonunu ayarla"""
-        self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(self.style().standardIcon(QStyle.SP_ComputerIcon))
-        
-        tray_menu = QMenu()
-        
-        show_action = QAction("Göster", self)
-        show_action.triggered.connect(self.show)
-        tray_menu.addAction(show_action)
-        
-        quick_clean_action = QAction("Hızlı Temizlik", self)
-        quick_clean_action.triggered.connect(self.quick_clean)
-        tray_menu.addAction(quick_clean_action)
-        
-        tray_menu.addSeparator()
-        
-        quit_action = QAction("Çıkış", self)
-        quit_action.triggered.connect(self.quit_application)
-        tray_menu.addAction(quit_action)
-        
-        self.tray_icon.setContextMenu(tray_menu)
-        self.tray_icon.activated.connect(self.tray_icon_activated)
-        self.tray_icon.show()
-
-    def tray_icon_activated(self, reason):
-        if reason == QSystemTrayIcon.DoubleClick:
-            self.show()
-
-    def quick_clean(self):
-        """Hızlı temizlik işlemi"""
-        options = {
-            'temp_files': True,
-            'prefetch': True,
-            'browser_cache': False,
-            'recycle_bin': True,
-            'software_distribution': False
-        }
-        self.start_cleaning_with_options(options)
-
-    def analyze_disk_space(self):
-        """Disk alanını analiz et"""
-        self.analyzer_worker = DiskAnalyzerWorker()
-        self.analyzer_worker.progress_signal.connect(self.update_progress)
-        self.analyzer_worker.analysis_complete.connect(self.display_analysis_results)
-        self.analyzer_worker.start()
-        
-        self.progress_bar.setVisible(True)
-        self.status_bar.showMessage("Disk analizi yapılıyor...")
-
-    def display_analysis_results(self, results):
-        """Analiz sonuçlarını göster"""
-        self.progress_bar.setVisible(False)
-        
-        analysis_text = "=== DİSK KULLANIM ANALİZİ ===\n\n"
-        
-        # Klasör boyutları
-        for name, data in results.items():
-            if name != 'disk_info':
-                analysis_text += f"{name}:\n"
-                analysis_text += f"  Boyut: {data['size_str']}\n"
-                analysis_text += f"  Dosya Sayısı: {data['count']}\n"
-                analysis_text += f"  Yol: {data['path']}\n\n"
-        
-        # Disk bilgileri
-        if 'disk_info' in results:
-            analysis_text += "=== DİSK BİLGİLERİ ===\n\n"
-            for disk, info in results['disk_info'].items():
-                analysis_text += f"{disk}:\n"
-                analysis_text += f"  Toplam: {self.format_size(info['total'])}\n"
-                analysis_text += f"  Kullanılan: {self.format_size(info['used'])}\n"
-                analysis_text += f"  Boş: {self.format_size(info['free'])}\n"
-                analysis_text += f"  Doluluk: {info['percent']}%\n\n"
-        
-        self.analysis_text.setText(analysis_text)
-        self.status_bar.showMessage("Disk analizi tamamlandı")
-
-    def start_cleaning(self):
-        """Temizleme işlemini başlat"""
-        options = {
-            'temp_files': self.temp_check.isChecked(),
-            'prefetch': self.prefetch_check.isChecked(),
-            'browser_cache': self.browser_check.isChecked(),
-            'recycle_bin': self.recycle_check.isChecked(),
-            'software_distribution': self.update_check.isChecked()
-        }
-        
-        self.start_cleaning_with_options(options)
-
-    def start_cleaning_with_options(self, options):
-        """Seçeneklerle temizleme başlat"""
-        if not any(options.values()):
-            QMessageBox.warning(self, "Uyarı", "Lütfen en az bir temizleme seçeneği seçin!")
-            return
-        
-        reply = QMessageBox.question(self, "Onay", 
-                                   "Temizleme işlemini başlatmak istediğinizden emin misiniz?\n\n"
-                                   "Bu işlem geri alınamaz!",
-                                   QMessageBox.Yes | QMessageBox.No)
-        
-        if reply == QMessageBox.Yes:
-            self.cleaner_worker = CleanerWorker(options)
-            self.cleaner_worker.progress_signal.connect(self.update_progress)
-            self.cleaner_worker.finished_signal.connect(self.cleaning_finished)
-            self.cleaner_worker.error_signal.connect(self.cleaning_error)
-            self.cleaner_worker.start()
-            
-            self.progress_bar.setVisible(True)
-            self.clean_btn.setEnabled(False)
-            self.analyze_btn.setEnabled(False)
-            self.status_bar.showMessage("Temizleme işlemi başlatıldı...")
-
-    def update_progress(self, value, message):
-        """İlerlemeyi güncelle"""
-        self.progress_bar.setValue(value)
-        self.status_bar.showMessage(message)
-
-    def cleaning_finished(self, results):
-        """Temizleme tamamlandığında"""
-        self.progress_bar.setVisible(False)
-        self.clean_btn.setEnabled(True)
-        self.analyze_btn.setEnabled(True)
-        
-        total_freed = results['total']['freed']
-        total_count = results['total']['count']
-        
-        result_text = "=== TEMİZLEME TAMAMLANDI ===\n\n"
-        result_text += f"Toplam Kazanılan Alan: {self.format_size(total_freed)}\n"
-        result_text += f"Silinen Öğe Sayısı: {total_count}\n\n"
-        result_text += "Detaylar:\n"
-        
-        for category, data in results.items():
-            if category != 'total':
-                category_name = category.replace('_', ' ').title()
-                result_text += f"  {category_name}: {self.format_size(data['freed'])} ({data['count']} öğe)\n"
-        
-        self.results_text.setText(result_text)
-        self.status_bar.showMessage(f"Temizlik tamamlandı! {self.format_size(total_freed)} alan kazanıldı.")
-        
-        # Başarılı mesajı göster
-        QMessageBox.information(self, "Başarılı", 
-                              f"Temizleme işlemi başarıyla tamamlandı!\n\n"
-                              f"Kazanılan alan: {self.format_size(total_freed)}\n"
-                              f"Silinen öğe: {total_count}")
-
-    def cleaning_error(self, error_message):
-        """Temizleme hatası"""
-        self.progress_bar.setVisible(False)
-        self.clean_btn.setEnabled(True)
-        self.analyze_btn.setEnabled(True)
-        QMessageBox.critical(self, "Hata", f"Temizleme sırasında hata oluştu:\n{error_message}")
-
-    def format_size(self, size_bytes):
-        """Byte'ları okunabilir formata çevir"""
-        if size_bytes == 0:
-            return "0 B"
-            
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} TB"
-
-    def select_backup_folder(self):
-        """Yedekleme klasörü seç"""
-        folder = QFileDialog.getExistingDirectory(self, "Yedekleme Klasörünü Seç")
-        if folder:
-            self.settings['backup_folder'] = folder
-            self.save_settings()
-
-    def create_restore_point(self):
-        """Sistem geri yükleme noktası oluştur"""
-        try:
-            QMessageBox.information(self, "Bilgi", 
-                                  "Sistem geri yükleme noktası oluşturmak için yönetici olarak çalıştırmanız gerekebilir.")
-        except Exception as e:
-            QMessageBox.warning(self, "Uyarı", f"Geri yükleme noktası oluşturulamadı: {str(e)}")
-
-    def restart_as_admin(self):
-        """Yönetici olarak yeniden başlat"""
-        reply = QMessageBox.question(self, "Yönetici Yeniden Başlat", 
-                                   "Programı yönetici yetkileriyle yeniden başlatmak istiyor musunuz?",
-                                   QMessageBox.Yes | QMessageBox.No)
-        
-        if reply == QMessageBox.Yes:
-            try:
-                # Mevcut uygulamayı kapat ve yönetici olarak yeniden başlat
-                ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, " ".join(sys.argv), None, 1)
-                QApplication.quit()
-            except Exception as e:
-                QMessageBox.critical(self, "Hata", f"Yönetici olarak başlatılamadı: {str(e)}")
-
-    def load_settings(self):
-        """Ayarları yükle"""
-        self.settings = {
-            'auto_clean': False,
-            'auto_clean_interval': 7,
-            'backup_folder': '',
-            'backup_enabled': False,
-            'minimize_to_tray': True
-        }
-        
-        # Ayarları dosyadan yükleme
-        try:
-            if os.path.exists('cleaner_settings.json'):
-                with open('cleaner_settings.json', 'r', encoding='utf-8') as f:
-                    saved_settings = json.load(f)
-                    self.settings.update(saved_settings)
-                    
-                # UI'ı ayarlara göre güncelle
-                self.auto_clean.setChecked(self.settings.get('auto_clean', False))
-                self.auto_clean_interval.setValue(self.settings.get('auto_clean_interval', 7))
-                self.backup_check.setChecked(self.settings.get('backup_enabled', False))
-        except Exception as e:
-            print(f"Ayarlar yüklenirken hata: {e}")
-
-    def save_settings(self):
-        """Ayarları kaydet"""
-        try:
-            # UI'dan ayarları al
-            self.settings['auto_clean'] = self.auto_clean.isChecked()
-            self.settings['auto_clean_interval'] = self.auto_clean_interval.value()
-            self.settings['backup_enabled'] = self.backup_check.isChecked()
-            
-            # Ayarları dosyaya kaydet
-            with open('cleaner_settings.json', 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=4, ensure_ascii=False)
-                
-        except Exception as e:
-            print(f"Ayarlar kaydedilirken hata: {e}")
-
-    def quit_application(self):
-        """Uygulamadan çık"""
-        reply = QMessageBox.question(self, "Çıkış", 
-                                   "Uygulamadan çıkmak istediğinizden emin misiniz?",
-                                   QMessageBox.Yes | QMessageBox.No)
-        if reply == QMessageBox.Yes:
-            self.save_settings()  # Çıkışta ayarları kaydet
-            QApplication.quit()
-
-    def closeEvent(self, event):
-        """Pencere kapatma olayı"""
-        self.save_settings()  # Kapatırken ayarları kaydet
-        
-        # Sistem tepsisine gizleme seçeneği
-        if self.settings.get('minimize_to_tray', True):
-            event.ignore()
-            self.hide()
-            self.tray_icon.showMessage(
-                "Windows Temizleyici",
-                "Uygulama sistem tepsisinde çalışmaya devam ediyor",
-                QSystemTrayIcon.Information,
-                2000
-            )
-        else:
-            self.quit_application()
-
-class ModernCleanerApp(QMainWindow):
-    """Daha modern ve gelişmiş bir arayüz"""
-    
-    def __init__(self):
-        super().__init__()
-        self.cleaner_app = WindowsCleanerApp()
-        self.init_ui()
-        
-    def init_ui(self):
-        self.setWindowTitle("Windows Temizleyici Pro - Modern Arayüz")
-        self.setGeometry(100, 100, 1000, 750)
-        
-        # Modern stil
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2c3e50;
-            }
-            QTabWidget::pane {
-                border: 1px solid #34495e;
-                background-color: #ecf0f1;
-            }
-            QTabBar::tab {
-                background-color: #34495e;
-                color: white;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #3498db;
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-            QCheckBox {
-                color: #2c3e50;
-                font-weight: bold;
-            }
-            QGroupBox {
-                font-weight: bold;
-                color: #2c3e50;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-
-def check_dependencies():
-    """Gerekli kütüphaneleri kontrol et"""
-    required = ['psutil', 'PyQt5']
-    missing = []
-    
-    for package in required:
-        try:
-            if package == 'PyQt5':
-                import PyQt5
-            elif package == 'psutil':
-                import psutil
-        except ImportError:
-            missing.append(package)
-    
-    return missing
-
-def install_dependencies(missing_packages):
-    """Eksik kütüphaneleri yükle"""
-    import subprocess
-    import sys
-    
-    for package in missing_packages:
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-            print(f"[+] {package} başarıyla yüklendi")
-        except subprocess.CalledProcessError:
-            print(f"[-] {package} yüklenirken hata oluştu")
-            return False
-    return True
-
-def main():
-    # Eksik kütüphaneleri kontrol et
-    missing = check_dependencies()
-    if missing:
-        print("Eksik kütüphaneler bulundu:")
-        for package in missing:
-            print(f"  - {package}")
-        
-        response = input("Otomatik olarak yüklemek ister misiniz? (e/h): ")
-        if response.lower() in ['e', 'evet', 'y', 'yes']:
-            if not install_dependencies(missing):
-                print("Kütüphane yükleme başarısız. Lütfen manuel olarak yükleyin:")
-                for package in missing:
-                    print(f"pip install {package}")
-                return
-        else:
-            print("Lütfen eksik kütüphaneleri manuel olarak yükleyin:")
-            for package in missing:
-                print(f"pip install {package}")
-            return
-    
-    app = QApplication(sys.argv)
-    
-    # Uygulama stilini ayarla
-    app.setStyle('Fusion')
-    
-    # Modern koyu tema
-    palette = QPalette()
-    palette.setColor(QPalette.Window, QColor(44, 62, 80))
-    palette.setColor(QPalette.WindowText, Qt.white)
-    palette.setColor(QPalette.Base, QColor(25, 35, 45))
-    palette.setColor(QPalette.AlternateBase, QColor(44, 62, 80))
-    palette.setColor(QPalette.ToolTipBase, Qt.white)
-    palette.setColor(QPalette.ToolTipText, Qt.white)
-    palette.setColor(QPalette.Text, Qt.white)
-    palette.setColor(QPalette.Button, QColor(52, 73, 94))
-    palette.setColor(QPalette.ButtonText, Qt.white)
-    palette.setColor(QPalette.BrightText, Qt.red)
-    palette.setColor(QPalette.Link, QColor(52, 152, 219))
-    palette.setColor(QPalette.Highlight, QColor(52, 152, 219))
-    palette.setColor(QPalette.HighlightedText, Qt.black)
-    palette.setColor(QPalette.Disabled, QPalette.Button, QColor(44, 62, 80))
-    palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(127, 140, 141))
-    app.setPalette(palette)
-    
-    # Uygulama fontu
-    app.setFont(QFont("Segoe UI", 10))
-    
-    # Başlangıç mesajı
-    print("Windows Temizleyici Pro başlatılıyor...")
-    print("[+] Tüm bağımlılıklar yüklendi")
-    print("[+] Yönetici kontrolü yapıldı")
-    print("[+] GUI hazırlandı")
-    
-    window = WindowsCleanerApp()
-    window.show()
-    
-    # İlk açılışta disk analizi öner
-    if not hasattr(window, 'first_run_done'):
-        reply = QMessageBox.question(window, "Hoş Geldiniz", 
-                                   "Windows Temizleyici Pro'ya hoş geldiniz!\n\n"
-                                   "İlk olarak disk alanınızı analiz etmek ister misiniz?",
-                                   QMessageBox.Yes | QMessageBox.No)
-        if reply == QMessageBox.Yes:
-            window.analyze_disk_space()
-        window.first_run_done = True
-    
-    sys.exit(app.exec_())
-
-if __name__ == '__main__':
-    # Yönetici yetkisi kontrolü
-    if not is_admin():
-        print("UYARI: Program yönetici yetkisi olmadan başlatıldı. Bazı işlemler kısıtlı olabilir.")
-        print("Tam özellikler için programı 'Yönetici olarak çalıştırın'.")
-    
-    try:
-        main()
-    except Exception as e:
-        print(f"Uygulama hatası: {e}")
-        print("Lütfen aşağıdaki kütüphanelerin yüklü olduğundan emin olun:")
-        print("pip install pyqt5 psutil")
-        
-        # Hata durumunda kullanıcıya bilgi ver
-        app = QApplication(sys.argv)
-        QMessageBox.critical(None, "Başlatma Hatası", 
-                           f"Uygulama başlatılırken hata oluştu:\n\n{str(e)}\n\n"
-                           "Lütfen gerekli kütüphaneleri yükleyin:\n"
+import sys
+import os
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                             QHBoxLayout, QPushButton, QListWidget, QListWidgetItem,
+                             QLabel, QProgressBar, QTextEdit, QGroupBox, 
+                             QCheckBox, QMessageBox, QSplitter, QTabWidget,
+                             QSystemTrayIcon, QMenu, QAction, QStyle, QTreeWidget,
+                             QTreeWidgetItem, QHeaderView, QToolBar, QStatusBar,
+                             QFileDialog, QInputDialog, QLineEdit, QSpinBox,
+                             QFormLayout, QDialog, QDialogButtonBox, QComboBox, QTreeView)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize, QAbstractItemModel, QModelIndex
+from PyQt5.QtGui import QFont, QIcon, QPalette, QColor, QPixmap
+import copy
+import functools
+import json
+import threading
+from datetime import datetime
+from fastertale import (CATEGORIES, DEFAULT_DELETE_WORKERS, TARGETS, Cleaner, DiskAnalyzer, MetricsRecorder,
+                        SizeIndex, default_metrics_path, default_roots, format_size, is_admin)
+from fastertale.rules import DEFAULT_RULES, parse_patterns
+from fastertale.events import EventBus
+from fastertale.targets import resolve_targets
+from fastertale.tombstone import purge_in_background
+
+class CleanerWorker(QThread):
+    """fastertale.Cleaner için Qt sarmalayıcısı.
+
+    İlerleme ve ölçüm kayıtları bus'a (EventBus) bırakılır; arayüz onları
+    zamanlayıcıyla toplu alır. Sadece bitiş ve hata sinyal olarak gelir.
+    """
+    finished_signal = pyqtSignal(dict)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, cleaning_options, max_workers=None, size_index=None, retention_rules=None,
+                 snapshot=None, duplicates=None, metrics_log=None, scheduler=None, bus=None, low_priority=False):
+        super().__init__()
+        # scheduler verilirse temizlik düşük öncelikle ve yük izlenerek çalışır
+        self.scheduler = scheduler
+        progress = bus.progress if bus is not None else None
+        callbacks = [functools.partial(bus.push, 'metrics')] if bus is not None else []
+        try:
+            metrics = MetricsRecorder(metrics_log, callbacks)
+        except OSError:
+            metrics = MetricsRecorder(callbacks=callbacks)
+        self.cleaner = Cleaner(cleaning_options, max_workers, progress, size_index,
+                               retention_rules, snapshot=snapshot, duplicates=duplicates, metrics=metrics)
+        # Sadece silme iş parçacıklarının önceliği düşer
+        self.cleaner.low_priority = low_priority
+        # Mezar taşlarının 'purge' ölçümleri silme bitince yazılır; günlük ondan sonra kapanır
+        self.cleaner.purge_callback = lambda purged: metrics.close()
+
+    def run(self):
+        try:
+            # Süreç anlık görüntüsü (ve psutil'in yüklenmesi) arayüz iş parçacığını bekletmesin
+            from fastertale.processes import ProcessInspector
+            self.cleaner.inspector = ProcessInspector()
+            if self.scheduler is not None:
+                results = self.scheduler.run(self.cleaner)
+            else:
+                results = self.cleaner.perform_cleaning()
+            self.finished_signal.emit(results)
+        except Exception as e:
+            self.error_signal.emit(str(e))
+        finally:
+            if self.cleaner.purge_thread is None:
+                self.cleaner.metrics.close()
+
+    def cancel(self):
+        self.cleaner.cancel()
+
+    def pause(self):
+        self.cleaner.pause()
+
+    def resume(self):
+        self.cleaner.resume()
+
+class PressurePlanWorker(QThread):
+    """PressureWatcher.plan için Qt sarmalayıcısı; boş alan, günlük ve hedefler arayüzü bekletmez"""
+    finished_signal = pyqtSignal(dict)
+
+    def __init__(self, watcher):
+        super().__init__()
+        self.watcher = watcher
+
+    def run(self):
+        options = {}
+        try:
+            for mountpoint, categories in self.watcher.plan():
+                options.update((category, True) for category in categories)
+        except Exception:
+            # Sonraki yoklamada yeniden denenir
+            pass
+        self.finished_signal.emit(options)
+
+class DiskAnalyzerWorker(QThread):
+    """fastertale.DiskAnalyzer için Qt sarmalayıcısı; ilerleme bus'a (EventBus) gider"""
+    analysis_complete = pyqtSignal(dict)
+
+    def __init__(self, size_index=None, bus=None):
+        super().__init__()
+        # Boyutlar boyut dizininden (sadece değişen klasörler taranır); dosya listesi SnapshotWorker'da
+        self.analyzer = DiskAnalyzer(bus.progress if bus is not None else None, size_index)
+
+    def run(self):
+        analysis_results = self.analyzer.analyze_disk_space()
+        self.analysis_complete.emit(analysis_results)
+
+class SnapshotWorker(QThread):
+    """Analiz konumlarını tam tarayıp ScanSnapshot çıkarır (Dosyalar sekmesi açılınca).
+
+    Anlık görüntü ardından yapılan temizlikte de kullanılır; ağaçlar yeniden listelenmez.
+    """
+    finished_signal = pyqtSignal(object)
+
+    def __init__(self, size_index=None, bus=None):
+        super().__init__()
+        self.analyzer = DiskAnalyzer(bus.progress if bus is not None else None, size_index, keep_snapshot=True)
+
+    def run(self):
+        self.finished_signal.emit(self.analyzer.build_snapshot())
+
+class LargestFilesWorker(QThread):
+    """DiskAnalyzer.find_largest için Qt sarmalayıcısı"""
+    finished_signal = pyqtSignal(dict)
+
+    def __init__(self, size_index=None, count=50, bus=None):
+        super().__init__()
+        self.count = count
+        self.analyzer = DiskAnalyzer(bus.progress if bus is not None else None, size_index)
+
+    def run(self):
+        self.finished_signal.emit(self.analyzer.find_largest(count=self.count))
+
+class FolderChildrenWorker(QThread):
+    """Ağaçta açılan klasörün içeriğini arka planda hesaplar"""
+    children_loaded = pyqtSignal(str, list)
+
+    def __init__(self, folder_path, size_index=None):
+        super().__init__()
+        self.folder_path = folder_path
+        self.analyzer = DiskAnalyzer(size_index=size_index)
+
+    def run(self):
+        self.children_loaded.emit(self.folder_path, self.analyzer.folder_children(self.folder_path))
+
+class DuplicatesWorker(QThread):
+    """DiskAnalyzer.find_duplicates için Qt sarmalayıcısı"""
+    finished_signal = pyqtSignal(list)
+
+    def __init__(self, bus=None):
+        super().__init__()
+        self.analyzer = DiskAnalyzer(bus.progress if bus is not None else None)
+
+    def run(self):
+        self.finished_signal.emit(self.analyzer.find_duplicates())
+
+class SizeTreeItem(QTreeWidgetItem):
+    """Boyut ve dosya sayısı sütunlarını sayısal sıralayan ağaç öğesi"""
+
+    def __lt__(self, other):
+        tree = self.treeWidget()
+        column = tree.sortColumn() if tree is not None else 0
+        if column in (1, 2):
+            return (self.data(column, Qt.UserRole) or 0) < (other.data(column, Qt.UserRole) or 0)
+        return super().__lt__(other)
+
+class ListRows:
+    """Küçük tablolar için satır kaynağı: ham değerli satırlar ve sütun biçimlendiricileri.
+
+    Sıralama ham değerlere göre yapılır (ör. boyut bayt olarak); ekranda
+    biçimlendirilmiş hali görünür.
+    """
+
+    def __init__(self, rows, formatters=None):
+        self.rows = rows
+        self.formatters = formatters or {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def display(self, row, column):
+        value = self.rows[row][column]
+        return self.formatters.get(column, str)(value)
+
+    def select(self, text, column, descending):
+        text = text.lower()
+        indexes = [row for row in range(len(self.rows))
+                   if not text or any(text in str(value).lower() for value in self.rows[row])]
+        indexes.sort(key=lambda row: self.rows[row][column], reverse=descending)
+        return indexes
+
+class SnapshotRows:
+    """ScanSnapshot dosyaları için satır kaynağı; satırlar sütunlardan istendikçe okunur.
+
+    Klasör yolları sadece görünen satırlar için hesaplanır ve önbelleklenir.
+    """
+
+    KEYS = ('path', 'size', 'mtime')
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.dir_paths = {}
+
+    def __len__(self):
+        return len(self.snapshot)
+
+    def display(self, row, column):
+        snapshot = self.snapshot
+        if column == 0:
+            dir_index = snapshot.file_dir[row]
+            folder = self.dir_paths.get(dir_index)
+            if folder is None:
+                folder = self.dir_paths[dir_index] = snapshot.dir_path(dir_index)
+            return os.path.join(folder, snapshot.file_name(row))
+        if column == 1:
+            return format_size(snapshot.file_size[row])
+        return datetime.fromtimestamp(snapshot.file_mtime[row]).strftime('%Y-%m-%d %H:%M')
+
+    def select(self, text, column, descending):
+        return self.snapshot.select_files(text, self.KEYS[column], descending)
+
+class RowQueryWorker(QThread):
+    """Satır kaynağında filtreleme ve sıralamayı GUI iş parçacığı dışında yapar"""
+    finished_signal = pyqtSignal(int, object)
+
+    def __init__(self, source, generation, text, column, descending):
+        super().__init__()
+        self.source = source
+        self.generation = generation
+        self.text = text
+        self.column = column
+        self.descending = descending
+
+    def run(self):
+        order = self.source.select(self.text, self.column, self.descending)
+        self.finished_signal.emit(self.generation, order)
+
+class LazyTableModel(QAbstractItemModel):
+    """Satır kaynağını parça parça yükleyen düz tablo modeli.
+
+    Görünüm kaydırıldıkça fetchMore ile BATCH_SIZE satır eklenir; hücre
+    metni sadece görünen satırlar için üretilir. Filtreleme ve sıralama
+    RowQueryWorker'da yapılır, sonuç gelince model sıfırlanır. Her sorgu
+    bir nesil numarası alır; eskimiş sorguların sonuçları yok sayılır.
+    """
+    query_finished = pyqtSignal(int)
+
+    BATCH_SIZE = 500
+
+    def __init__(self, headers, numeric_columns=(), sort_column=0, descending=False, parent=None):
+        super().__init__(parent)
+        self.headers = headers
+        self.numeric_columns = set(numeric_columns)
+        self.source = None
+        # order: görünüm satırı -> kaynak satırı; None ise kaynak sırası
+        self.order = None
+        self.loaded = 0
+        self.filter_text = ''
+        self.sort_column = sort_column
+        self.descending = descending
+        self.generation = 0
+        self.workers = set()
+
+    def set_source(self, source):
+        """Yeni kaynağı hemen kaynak sırasıyla göster; sıralamayı arka planda uygula"""
+        self.beginResetModel()
+        self.source = source
+        self.order = None
+        self.loaded = min(self.BATCH_SIZE, len(source))
+        self.endResetModel()
+        self.run_query()
+
+    def clear(self):
+        self.generation += 1
+        self.beginResetModel()
+        self.source = None
+        self.order = None
+        self.loaded = 0
+        self.endResetModel()
+
+    def set_filter(self, text):
+        self.filter_text = text
+        self.run_query()
+
+    def run_query(self):
+        self.generation += 1
+        if self.source is None:
+            return
+        worker = RowQueryWorker(self.source, self.generation, self.filter_text,
+                                self.sort_column, self.descending)
+        worker.finished_signal.connect(self.apply_query)
+        # Çalışan iş parçacığına referans tutulur; bitince bırakılır
+        self.workers.add(worker)
+        worker.finished.connect(lambda: self.workers.discard(worker))
+        worker.start()
+
+    def apply_query(self, generation, order):
+        if generation != self.generation:
+            return
+        self.beginResetModel()
+        self.order = order
+        self.loaded = min(self.BATCH_SIZE, len(order))
+        self.endResetModel()
+        self.query_finished.emit(len(order))
+
+    def total_rows(self):
+        if self.source is None:
+            return 0
+        return len(self.source) if self.order is None else len(self.order)
+
+    def source_row(self, row):
+        return row if self.order is None else self.order[row]
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.headers)
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self.loaded < self.total_rows()
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        count = min(self.BATCH_SIZE, self.total_rows() - self.loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.source.display(self.source_row(index.row()), index.column())
+        if role == Qt.TextAlignmentRole and index.column() in self.numeric_columns:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sort_column = column
+        self.descending = order == Qt.DescendingOrder
+        self.run_query()
+
+def make_table_view(model):
+    """LazyTableModel için sıralanabilir, düz QTreeView"""
+    view = QTreeView()
+    view.setModel(model)
+    view.setRootIsDecorated(False)
+    view.setUniformRowHeights(True)
+    # Gösterge önce ayarlanır; setSortingEnabled modelin varsayılan sıralamasını ezmesin
+    view.header().setSortIndicator(model.sort_column,
+                                   Qt.DescendingOrder if model.descending else Qt.AscendingOrder)
+    view.setSortingEnabled(True)
+    view.header().setSectionResizeMode(0, QHeaderView.Stretch)
+    return view
+
+class WindowsCleanerApp(QMainWindow):
+    # Ertelenen hedeflerin uygulamaları kapandı (bekleme iş parçacığından gelir)
+    deferred_ready = pyqtSignal(dict)
+
+    def __init__(self):
+        super().__init__()
+        self.db_manager = None
+        # Boyut dizini ilk analiz ya da temizlikte açılır (get_size_index)
+        self.size_index = None
+        self.size_index_opened = False
+        self.cleaner_worker = None
+        # Son temizliğin sonucu; arka planda silinen mezar taşları sonradan katılır
+        self.last_results = None
+        self.last_run_id = None
+        self.early_purges = []
+        self.analyzer_worker = None
+        self.snapshot_worker = None
+        self.largest_worker = None
+        self.children_workers = {}
+        self.duplicates_worker = None
+        self.duplicate_groups = []
+        self.scan_snapshot = None
+        # Son temizliğin kategori ölçümleri (fastertale.metrics 'category' kayıtları)
+        self.category_metrics = {}
+        self.auto_cleaning = False
+        self.scheduler = None
+        self.exit_wait_stop = None
+        self.deferred_ready.connect(self.clean_deferred)
+        # İşçilerin ilerleme ve ölçüm olayları; iş sürerken 20 Hz ile toplu alınır
+        self.event_bus = EventBus()
+        self.event_timer = QTimer(self)
+        self.event_timer.setInterval(50)
+        self.event_timer.timeout.connect(self.drain_events)
+        self.load_settings()
+
+        # Tepsi ikonu önce; pencerenin geri kalanı ondan sonra kurulur
+        self.setup_tray_icon()
+        self.init_ui()
+        self.setup_auto_clean()
+        self.purge_tombstones()
+        
+        # Yönetici kontrolü
+        self.check_admin_status()
+
+    def get_size_index(self):
+        """Artımlı analiz için boyut dizini; ilk çağrıda açılır (açılamazsa tam tarama yapılır)"""
+        if not self.size_index_opened:
+            self.size_index_opened = True
+            import sqlite3
+            try:
+                self.size_index = SizeIndex()
+            except (OSError, sqlite3.Error) as e:
+                self.status_bar.showMessage(f"Boyut dizini açılamadı, tam tarama yapılacak: {e}")
+        return self.size_index
+
+    def check_admin_status(self):
+        """Yönetici durumunu kontrol et ve kullanıcıyı bilgilendir"""
+        if not is_admin():
+            self.status_bar.showMessage("UYARI: Yönetici olarak çalıştırılmadı - bazı işlemler kısıtlı")
+            
+            # Kullanıcıya bilgi ver (sadece ilk açılışta)
+            if not hasattr(self, 'admin_warning_shown'):
+                QMessageBox.warning(self, "Yönetici Yetkisi", 
+                                  "Program yönetici yetkisi olmadan çalışıyor.\n\n"
+                                  "Bazı sistem dosyalarına erişim kısıtlı olabilir.\n"
+                                  "Tam erişim için programı 'Yönetici olarak çalıştırın'.")
+                self.admin_warning_shown = True
+
+    def init_ui(self):
+        self.setWindowTitle("Windows Temizleyici Pro - Güvenli Sistem Optimizasyonu")
+        self.setGeometry(100, 100, 900, 700)
+        self.setMinimumSize(800, 600)
+
+        # Merkezi widget
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+
+        # Başlık
+        title_label = QLabel("Windows Temizleyici Pro")
+        title_label.setFont(QFont("Arial", 16, QFont.Bold))
+        title_label.setAlignment(Qt.AlignCenter)
+        title_label.setStyleSheet("color: #2c3e50; margin: 10px;")
+        layout.addWidget(title_label)
+
+        # Admin durumu göstergesi
+        self.admin_label = QLabel()
+        self.admin_label.setAlignment(Qt.AlignCenter)
+        self.update_admin_display()
+        layout.addWidget(self.admin_label)
+
+        # Tab widget
+        self.tabs = QTabWidget()
+        layout.addWidget(self.tabs)
+
+        # Temizleme sekmesi
+        self.setup_cleaning_tab()
+        
+        # Analiz ve Ayarlar sekmeleri ilk görüntülendiklerinde kurulur
+        self.lazy_tabs = {}
+        self.analysis_tab_index = self.add_lazy_tab("Disk Analizi", self.setup_analysis_tab)
+        self.settings_tab_index = self.add_lazy_tab("Ayarlar", self.setup_settings_tab)
+        self.tabs.currentChanged.connect(self.build_tab)
+
+        # Durum çubuğu
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+        self.status_bar.showMessage("Hazır")
+
+        # İlerleme çubuğu
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+
+    def update_admin_display(self):
+        """Yönetici durumunu ekranda göster"""
+        if is_admin():
+            self.admin_label.setText("✅ Yönetici modunda çalışıyor")
+            self.admin_label.setStyleSheet("color: #27ae60; font-weight: bold; background-color: #d5f4e6; padding: 5px; border-radius: 3px;")
+        else:
+            self.admin_label.setText("⚠️ Yönetici olarak çalıştırılmadı - bazı işlemler kısıtlı")
+            self.admin_label.setStyleSheet("color: #e67e22; font-weight: bold; background-color: #fdebd0; padding: 5px; border-radius: 3px;")
+
+    def setup_cleaning_tab(self):
+        cleaning_tab = QWidget()
+        layout = QVBoxLayout(cleaning_tab)
+
+        # Temizleme seçenekleri grubu
+        options_group = QGroupBox("Temizleme Seçenekleri")
+        options_layout = QVBoxLayout(options_group)
+
+        self.temp_check = QCheckBox("Geçici Dosyaları Temizle (Temp, %Temp%)")
+        self.temp_check.setChecked(True)
+        options_layout.addWidget(self.temp_check)
+
+        self.prefetch_check = QCheckBox("Prefetch Önbelleğini Temizle")
+        self.prefetch_check.setChecked(True)
+        options_layout.addWidget(self.prefetch_check)
+
+        self.browser_check = QCheckBox("Tarayıcı Önbelleklerini Temizle (Chrome, Edge, Brave, Vivaldi, Opera, Firefox)")
+        self.browser_check.setChecked(True)
+        options_layout.addWidget(self.browser_check)
+
+        self.app_cache_check = QCheckBox("Uygulama Önbelleklerini Temizle (Teams, Discord, VS Code, npm, pip)")
+        self.app_cache_check.setChecked(False)
+        options_layout.addWidget(self.app_cache_check)
+
+        self.duplicates_check = QCheckBox("Yinelenen Dosyaların Kopyalarını Sil (önce Disk Analizi'nde bulun)")
+        self.duplicates_check.setChecked(False)
+        self.duplicates_check.setEnabled(False)
+        options_layout.addWidget(self.duplicates_check)
+
+        self.recycle_check = QCheckBox("Geri Dönüşüm Kutusunu Boşalt")
+        self.recycle_check.setChecked(True)
+        options_layout.addWidget(self.recycle_check)
+
+        self.update_check = QCheckBox("Windows Update Artıklarını Temizle (SoftwareDistribution)")
+        self.update_check.setChecked(True)
+        options_layout.addWidget(self.update_check)
+
+        layout.addWidget(options_group)
+
+        # Güvenlik uyarısı
+        warning_label = QLabel("⚠️ UYARI: Bu araç SADECE güvenli dosyaları siler. System32, Drivers, WinSxS gibi kritik sistem dosyalarına DOKUNULMAZ.")
+        warning_label.setStyleSheet("color: #e74c3c; background-color: #fdf2f2; padding: 10px; border: 1px solid #e74c3c; border-radius: 5px;")
+        warning_label.setWordWrap(True)
+        layout.addWidget(warning_label)
+
+        # Butonlar
+        button_layout = QHBoxLayout()
+
+        self.analyze_btn = QPushButton("Disk Alanını Analiz Et")
+        self.analyze_btn.clicked.connect(self.analyze_disk_space)
+        button_layout.addWidget(self.analyze_btn)
+
+        self.clean_btn = QPushButton("Seçilenleri Temizle")
+        self.clean_btn.clicked.connect(self.start_cleaning)
+        self.clean_btn.setStyleSheet("QPushButton { background-color: #27ae60; color: white; font-weight: bold; }")
+        button_layout.addWidget(self.clean_btn)
+
+        self.pause_btn = QPushButton("Duraklat")
+        self.pause_btn.clicked.connect(self.toggle_pause)
+        self.pause_btn.setEnabled(False)
+        button_layout.addWidget(self.pause_btn)
+
+        self.cancel_btn = QPushButton("İptal")
+        self.cancel_btn.clicked.connect(self.cancel_cleaning)
+        self.cancel_btn.setEnabled(False)
+        button_layout.addWidget(self.cancel_btn)
+
+        layout.addLayout(button_layout)
+
+        # Sonuçlar alanı
+        self.results_label = QLabel("Temizleme sonuçları burada görünecek...")
+        layout.addWidget(self.results_label)
+
+        self.results_model = LazyTableModel(["Kategori", "Kazanılan", "Silinen Öğe", "Atlanan", "Atlanan Boyut",
+                                             "Süre"],
+                                            numeric_columns=(1, 2, 3, 4, 5), sort_column=1, descending=True)
+        layout.addWidget(make_table_view(self.results_model))
+
+        self.tabs.addTab(cleaning_tab, "Temizlik")
+
+    def add_lazy_tab(self, title, builder):
+        """Boş bir sekme ekle; builder(sayfa) sekme ilk gösterildiğinde çağrılır"""
+        page = QWidget()
+        index = self.tabs.addTab(page, title)
+        self.lazy_tabs[index] = (page, builder)
+        return index
+
+    def build_tab(self, index):
+        """Sekme henüz kurulmadıysa kur (sonuç gelen sekmeler için de çağrılır)"""
+        entry = self.lazy_tabs.pop(index, None)
+        if entry is not None:
+            page, builder = entry
+            builder(page)
+
+    def setup_analysis_tab(self, analysis_tab):
+        layout = QVBoxLayout(analysis_tab)
+
+        # Bölümler alt sekmelerde; büyük tablolar görünür oldukça yüklenir
+        sections = QTabWidget()
+        layout.addWidget(sections)
+
+        # Disk analizi özeti: hedefler ve disk bölümleri
+        summary_tab = QWidget()
+        summary_layout = QVBoxLayout(summary_tab)
+
+        self.analysis_label = QLabel("Disk analiz sonuçları burada görünecek...")
+        summary_layout.addWidget(self.analysis_label)
+
+        self.analysis_model = LazyTableModel(["Konum", "Boyut", "Dosya Sayısı", "Yol"],
+                                             numeric_columns=(1, 2), sort_column=1, descending=True)
+        summary_layout.addWidget(make_table_view(self.analysis_model))
+
+        self.disks_model = LazyTableModel(["Disk", "Toplam", "Kullanılan", "Boş", "Doluluk"],
+                                          numeric_columns=(1, 2, 3, 4))
+        summary_layout.addWidget(make_table_view(self.disks_model))
+
+        sections.addTab(summary_tab, "Özet")
+
+        # Analiz taramasındaki tüm dosyalar (ScanSnapshot üzerinden, tembel)
+        files_tab = QWidget()
+        files_layout = QVBoxLayout(files_tab)
+
+        filter_layout = QHBoxLayout()
+        self.files_filter = QLineEdit()
+        self.files_filter.setPlaceholderText("Yolda ara...")
+        filter_layout.addWidget(self.files_filter)
+        self.files_count_label = QLabel()
+        filter_layout.addWidget(self.files_count_label)
+        files_layout.addLayout(filter_layout)
+
+        # Her tuşta değil, yazma durunca filtrele
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(300)
+        self.filter_timer.timeout.connect(self.apply_files_filter)
+        self.files_filter.textChanged.connect(self.filter_timer.start)
+
+        self.files_model = LazyTableModel(["Yol", "Boyut", "Değiştirilme"],
+                                          numeric_columns=(1,), sort_column=1, descending=True)
+        self.files_model.query_finished.connect(self.update_files_count)
+        files_layout.addWidget(make_table_view(self.files_model))
+
+        self.files_section = sections.addTab(files_tab, "Dosyalar")
+        # Tam tarama (anlık görüntü) sadece dosya listesi istenince yapılır
+        sections.currentChanged.connect(self.analysis_section_changed)
+
+        # En büyük dosya ve klasörler (profil ve tüm disk bölümleri)
+        largest_tab = QWidget()
+        largest_layout = QVBoxLayout(largest_tab)
+
+        self.largest_btn = QPushButton("En Büyükleri Bul")
+        self.largest_btn.clicked.connect(self.find_largest)
+        largest_layout.addWidget(self.largest_btn)
+
+        self.largest_tree = QTreeWidget()
+        self.largest_tree.setHeaderLabels(["Ad", "Boyut", "Dosya Sayısı"])
+        self.largest_tree.setSortingEnabled(True)
+        self.largest_tree.sortByColumn(1, Qt.DescendingOrder)
+        self.largest_tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.largest_tree.itemExpanded.connect(self.expand_largest_item)
+        largest_layout.addWidget(self.largest_tree)
+
+        sections.addTab(largest_tab, "En Büyükler")
+
+        # Yinelenen dosyalar (kullanıcı profili)
+        duplicates_tab = QWidget()
+        duplicates_layout = QVBoxLayout(duplicates_tab)
+
+        self.duplicates_btn = QPushButton("Yinelenenleri Bul")
+        self.duplicates_btn.clicked.connect(self.find_duplicates)
+        duplicates_layout.addWidget(self.duplicates_btn)
+
+        self.duplicates_tree = QTreeWidget()
+        self.duplicates_tree.setHeaderLabels(["Dosya", "Boyut", "Boşa Giden"])
+        self.duplicates_tree.setSortingEnabled(True)
+        self.duplicates_tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        duplicates_layout.addWidget(self.duplicates_tree)
+
+        sections.addTab(duplicates_tab, "Yinelenenler")
+
+    def setup_settings_tab(self, settings_tab):
+        layout = QVBoxLayout(settings_tab)
+
+        # Otomatik temizlik
+        auto_group = QGroupBox("Otomatik Temizlik Ayarları")
+        auto_layout = QFormLayout(auto_group)
+
+        self.auto_clean = QCheckBox("Otomatik temizlik yap (sistem boştayken, tepsideyken de)")
+        auto_layout.addRow(self.auto_clean)
+
+        self.auto_clean_interval = QSpinBox()
+        self.auto_clean_interval.setRange(1, 30)
+        self.auto_clean_interval.setSuffix(" gün")
+        auto_layout.addRow("Otomatik temizlik aralığı:", self.auto_clean_interval)
+
+        # Boş alan azalınca sadece gerektiği kadar kategori temizlenir
+        self.pressure_check = QCheckBox("Disk dolunca gerektiği kadar temizle")
+        auto_layout.addRow(self.pressure_check)
+
+        self.pressure_low = QSpinBox()
+        self.pressure_low.setRange(1, 50)
+        self.pressure_low.setSuffix(" %")
+        auto_layout.addRow("Boş alan bunun altına inince:", self.pressure_low)
+
+        self.pressure_high = QSpinBox()
+        self.pressure_high.setRange(2, 60)
+        self.pressure_high.setSuffix(" %")
+        auto_layout.addRow("Hedef boş alan:", self.pressure_high)
+
+        layout.addWidget(auto_group)
+
+        # Performans
+        performance_group = QGroupBox("Performans Ayarları")
+        performance_layout = QFormLayout(performance_group)
+
+        self.delete_workers = QSpinBox()
+        self.delete_workers.setRange(1, 64)
+        self.delete_workers.setValue(DEFAULT_DELETE_WORKERS)
+        performance_layout.addRow("Paralel silme iş parçacığı sayısı:", self.delete_workers)
+
+        layout.addWidget(performance_group)
+
+        # Saklama kuralları (kategori bazında)
+        rules_group = QGroupBox("Saklama Kuralları")
+        rules_layout = QFormLayout(rules_group)
+
+        self.rule_category = QComboBox()
+        for label, category in [("Geçici Dosyalar", 'temp_files'), ("Prefetch", 'prefetch'),
+                                ("Tarayıcı Önbellekleri", 'browser_cache'),
+                                ("Uygulama Önbellekleri", 'app_cache'),
+                                ("Windows Update Artıkları", 'software_distribution')]:
+            self.rule_category.addItem(label, category)
+        self.rule_category_key = self.rule_category.currentData()
+        self.rule_category.currentIndexChanged.connect(self.rule_category_changed)
+        rules_layout.addRow("Kategori:", self.rule_category)
+
+        self.rule_min_age = QSpinBox()
+        self.rule_min_age.setRange(0, 24 * 365)
+        self.rule_min_age.setSuffix(" saat")
+        rules_layout.addRow("Bundan yeni dosyaları silme:", self.rule_min_age)
+
+        self.rule_min_size = QSpinBox()
+        self.rule_min_size.setRange(0, 10 * 1024 * 1024)
+        self.rule_min_size.setSuffix(" KB")
+        rules_layout.addRow("Bundan küçük dosyaları silme:", self.rule_min_size)
+
+        self.rule_include = QLineEdit()
+        self.rule_include.setPlaceholderText("Boş = tümü, örn. *.tmp; *.log")
+        rules_layout.addRow("Sadece bu desenler:", self.rule_include)
+
+        self.rule_exclude = QLineEdit()
+        self.rule_exclude.setPlaceholderText("örn. *.lock; setup*")
+        rules_layout.addRow("Hariç tutulan desenler:", self.rule_exclude)
+
+        layout.addWidget(rules_group)
+
+        # Yedekleme
+        backup_group = QGroupBox("Yedekleme Ayarları")
+        backup_layout = QVBoxLayout(backup_group)
+
+        self.backup_check = QCheckBox("Temizlemeden önce yedek oluştur")
+        backup_layout.addWidget(self.backup_check)
+
+        backup_btn = QPushButton("Yedekleme Klasörünü Seç")
+        backup_btn.clicked.connect(self.select_backup_folder)
+        backup_layout.addWidget(backup_btn)
+
+        layout.addWidget(backup_group)
+
+        # Sistem ayarları
+        system_group = QGroupBox("Sistem Ayarları")
+        system_layout = QVBoxLayout(system_group)
+
+        restore_btn = QPushButton("Sistem Geri Yükleme Noktası Oluştur")
+        restore_btn.clicked.connect(self.create_restore_point)
+        system_layout.addWidget(restore_btn)
+
+        admin_btn = QPushButton("Yönetici Olarak Yeniden Başlat")
+        admin_btn.clicked.connect(self.restart_as_admin)
+        admin_btn.setStyleSheet("QPushButton { background-color: #e74c3c; color: white; }")
+        system_layout.addWidget(admin_btn)
+
+        layout.addWidget(system_group)
+
+        layout.addStretch()
+
+        self.apply_settings_to_ui()
+
+    def setup_tray_icon(self):
+        """Sistem tepsi ikonunu ayarla"""
+        self.tray_icon = QSystemTrayIcon(self)
+        self.tray_icon.setIcon(self.style().standardIcon(QStyle.SP_ComputerIcon))
+        
+        tray_menu = QMenu()
+        
+        show_action = QAction("Göster", self)
+        show_action.triggered.connect(self.show)
+        tray_menu.addAction(show_action)
+        
+        quick_clean_action = QAction("Hızlı Temizlik", self)
+        quick_clean_action.triggered.connect(self.quick_clean)
+        tray_menu.addAction(quick_clean_action)
+        
+        tray_menu.addSeparator()
+        
+        quit_action = QAction("Çıkış", self)
+        quit_action.triggered.connect(self.quit_application)
+        tray_menu.addAction(quit_action)
+        
+        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_icon.activated.connect(self.tray_icon_activated)
+        self.tray_icon.show()
+
+    def setup_auto_clean(self):
+        """auto_clean açıksa aralık dolduğunda tepsideyken de temizlik yap"""
+        # Zamanlayıcı (ve psutil) açılıştan sonra kurulur; ilk yük ölçümü de o an alınır
+        QTimer.singleShot(5 * 1000, self.auto_scheduler)
+        self.auto_clean_timer = QTimer(self)
+        self.auto_clean_timer.setSingleShot(True)
+        self.auto_clean_timer.timeout.connect(self.check_auto_clean)
+        # Açılışın hemen ardından değil, sistem yerleştikten sonra kontrol et
+        self.auto_clean_timer.start(60 * 1000)
+
+        # Boş alan yoklaması ucuzdur (bölüm başına tek sistem çağrısı)
+        self.pressure_watcher = None
+        self.pressure_worker = None
+        self.pressure_timer = QTimer(self)
+        self.pressure_timer.timeout.connect(self.check_disk_pressure)
+        self.pressure_timer.start(60 * 1000)
+
+    def auto_scheduler(self):
+        """Otomatik temizlik zamanlayıcısı; ilk çağrıda oluşturulur"""
+        if self.scheduler is None:
+            # psutil zamanlayıcıyla birlikte, açılıştan sonra yüklenir
+            from fastertale.scheduler import AutoCleanScheduler
+            self.scheduler = AutoCleanScheduler(self.settings.get('auto_clean_interval', 7))
+            # İlk yük ölçümü; sonraki kontrol bu andan beri geçen sürenin yükünü görür
+            self.scheduler.probe.sample()
+        return self.scheduler
+
+    def purge_tombstones(self):
+        """Yarıda kalmış bir temizliğin mezar taşlarını arka planda, düşük öncelikle sil"""
+        def folders():
+            # Hedefler de arka plan iş parçacığında çözülür
+            for target, folder in resolve_targets(TARGETS, default_roots()):
+                if target.swap:
+                    yield folder
+
+        purge_in_background(folders())
+
+    def check_disk_pressure(self):
+        """Boş alanı düşük eşiğin altındaki bölüm varsa gerektiği kadar kategori temizle"""
+        if not self.settings.get('pressure_clean'):
+            return
+        if self.cleaner_worker and self.cleaner_worker.isRunning():
+            return
+        if self.pressure_worker and self.pressure_worker.isRunning():
+            return
+        if self.pressure_watcher is None:
+            from fastertale.pressure import PressureWatcher
+            self.pressure_watcher = PressureWatcher(size_index=self.get_size_index())
+        self.pressure_watcher.low_percent, self.pressure_watcher.high_percent = self.pressure_thresholds()
+        # Doluluk sorgusu, ölçüm geçmişi ve hedef çözümü arka planda
+        self.pressure_worker = PressurePlanWorker(self.pressure_watcher)
+        self.pressure_worker.finished_signal.connect(self.pressure_planned)
+        self.pressure_worker.start()
+
+    def pressure_planned(self, options):
+        """Doluluk planı hazır: seçilen kategorileri sormadan, düşük öncelikle temizle"""
+        if not options or not self.settings.get('pressure_clean'):
+            return
+        if self.cleaner_worker and self.cleaner_worker.isRunning():
+            return
+        self.start_cleaning_with_options(options, auto=True)
+
+    def check_auto_clean(self):
+        """Zamanlayıcı tetiklendi: zamanı geldiyse ve sistem boştaysa temizle"""
+        delay = 10 * 60
+        if self.cleaner_worker and self.cleaner_worker.isRunning():
+            delay = 5 * 60
+        elif self.settings.get('auto_clean'):
+            scheduler = self.auto_scheduler()
+            if scheduler.should_run():
+                from fastertale.scheduler import AUTO_CLEAN_OPTIONS
+                self.start_cleaning_with_options(dict(AUTO_CLEAN_OPTIONS), auto=True, scheduled=True)
+            delay = scheduler.next_check()
+        else:
+            # Kapalıyken de yük ölçümü güncel kalsın
+            self.auto_scheduler().probe.sample()
+        self.auto_clean_timer.start(int(delay * 1000))
+
+    def tray_icon_activated(self, reason):
+        if reason == QSystemTrayIcon.DoubleClick:
+            self.show()
+
+    def quick_clean(self):
+        """Hızlı temizlik işlemi"""
+        options = {
+            'temp_files': True,
+            'prefetch': True,
+            'browser_cache': False,
+            'app_cache': False,
+            'recycle_bin': True,
+            'software_distribution': False
+        }
+        self.start_cleaning_with_options(options)
+
+    def analyze_disk_space(self):
+        """Disk alanını analiz et"""
+        self.analyzer_worker = DiskAnalyzerWorker(self.get_size_index(), self.event_bus)
+        self.analyzer_worker.analysis_complete.connect(self.display_analysis_results)
+        self.analyzer_worker.start()
+        self.event_timer.start()
+        
+        self.progress_bar.setVisible(True)
+        self.status_bar.showMessage("Disk analizi yapılıyor...")
+
+    def display_analysis_results(self, results):
+        """Analiz sonuçlarını göster"""
+        self.drain_events()
+        self.build_tab(self.analysis_tab_index)
+        self.progress_bar.setVisible(False)
+        
+        locations = [(name, data['size'], data['count'], data['path'])
+                     for name, data in results.items() if name != 'disk_info']
+        self.analysis_model.set_source(ListRows(locations, {1: self.format_size}))
+        total = sum(size for _, size, _, _ in locations)
+        self.analysis_label.setText(f"Temizlenebilir toplam: {self.format_size(total)}")
+
+        disks = [(disk, info['total'], info['used'], info['free'], info['percent'])
+                 for disk, info in results.get('disk_info', {}).items()]
+        self.disks_model.set_source(ListRows(disks, {1: self.format_size, 2: self.format_size,
+                                                     3: self.format_size, 4: lambda value: f"{value}%"}))
+
+        self.status_bar.showMessage("Disk analizi tamamlandı")
+
+    def analysis_section_changed(self, index):
+        if index == self.files_section:
+            self.load_files_snapshot()
+
+    def load_files_snapshot(self):
+        """Dosyalar sekmesi için analiz konumlarının anlık görüntüsünü arka planda çıkar"""
+        if self.scan_snapshot is not None and self.scan_snapshot.is_fresh():
+            return
+        if self.snapshot_worker is not None and self.snapshot_worker.isRunning():
+            return
+        self.snapshot_worker = SnapshotWorker(self.get_size_index(), self.event_bus)
+        self.snapshot_worker.finished_signal.connect(self.display_files_snapshot)
+        self.snapshot_worker.start()
+        self.event_timer.start()
+
+        self.progress_bar.setVisible(True)
+        self.status_bar.showMessage("Dosyalar listeleniyor...")
+
+    def display_files_snapshot(self, snapshot):
+        self.drain_events()
+        self.progress_bar.setVisible(False)
+        self.scan_snapshot = snapshot
+        self.files_model.set_source(SnapshotRows(snapshot))
+        self.status_bar.showMessage(f"{len(snapshot)} dosya listelendi")
+
+    def apply_files_filter(self):
+        self.files_model.set_filter(self.files_filter.text().strip())
+
+    def update_files_count(self, count):
+        self.files_count_label.setText(f"{count} dosya")
+
+    def find_largest(self):
+        """Profil ve disk bölümlerindeki en büyük dosya ve klasörleri bul"""
+        if self.largest_worker is not None and self.largest_worker.isRunning():
+            return
+        self.largest_btn.setEnabled(False)
+        self.largest_worker = LargestFilesWorker(self.get_size_index(), bus=self.event_bus)
+        self.largest_worker.finished_signal.connect(self.display_largest)
+        self.largest_worker.start()
+        self.event_timer.start()
+
+        self.progress_bar.setVisible(True)
+        self.status_bar.showMessage("En büyük dosya ve klasörler aranıyor...")
+
+    def find_duplicates(self):
+        """Kullanıcı profilindeki yinelenen dosyaları bul"""
+        if self.duplicates_worker is not None and self.duplicates_worker.isRunning():
+            return
+        self.duplicates_btn.setEnabled(False)
+        self.duplicates_worker = DuplicatesWorker(self.event_bus)
+        self.duplicates_worker.finished_signal.connect(self.duplicates_found)
+        self.duplicates_worker.start()
+        self.event_timer.start()
+
+        self.progress_bar.setVisible(True)
+        self.status_bar.showMessage("Yinelenen dosyalar aranıyor...")
+
+    def duplicates_found(self, groups):
+        self.drain_events()
+        self.progress_bar.setVisible(False)
+        self.duplicates_btn.setEnabled(True)
+        self.set_duplicate_groups(groups)
+
+        wasted = sum(group.wasted for group in groups)
+        self.status_bar.showMessage(f"{len(groups)} yinelenen dosya grubu, boşa giden alan: {self.format_size(wasted)}")
+
+    def set_duplicate_groups(self, groups):
+        """Yinelenen dosya gruplarını göster; temizlik seçeneği sadece sonuç varken açılır"""
+        self.build_tab(self.analysis_tab_index)
+        self.duplicate_groups = groups
+        self.duplicates_check.setEnabled(bool(groups))
+        if not groups:
+            self.duplicates_check.setChecked(False)
+
+        self.duplicates_tree.clear()
+        self.duplicates_tree.setSortingEnabled(False)
+        for group in groups:
+            group_item = SizeTreeItem(self.duplicates_tree, [f"{len(group.files)} kopya: {os.path.basename(group.keep)}",
+                                                             self.format_size(group.size),
+                                                             self.format_size(group.wasted)])
+            group_item.setData(1, Qt.UserRole, group.size)
+            group_item.setData(2, Qt.UserRole, group.wasted)
+            QTreeWidgetItem(group_item, [f"{group.keep} (korunur)"])
+            for path, _ in group.removable:
+                QTreeWidgetItem(group_item, [path])
+        self.duplicates_tree.setSortingEnabled(True)
+        self.duplicates_tree.sortByColumn(2, Qt.DescendingOrder)
+
+    def make_size_item(self, parent, name, path, size, count, is_dir):
+        """Ağaca boyut öğesi ekle; klasörler açıldığında içerikleri yüklenir"""
+        item = SizeTreeItem(parent, [name, self.format_size(size), str(count) if is_dir else ""])
+        item.setToolTip(0, path)
+        item.setData(0, Qt.UserRole, path)
+        item.setData(1, Qt.UserRole, size)
+        item.setData(2, Qt.UserRole, count if is_dir else 0)
+        if is_dir:
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        return item
+
+    def display_largest(self, results):
+        """En büyükler taramasının sonucunu ağaçta göster"""
+        self.drain_events()
+        self.progress_bar.setVisible(False)
+        self.largest_btn.setEnabled(True)
+        self.largest_tree.clear()
+        self.largest_tree.setSortingEnabled(False)
+
+        dirs_item = QTreeWidgetItem(self.largest_tree, ["En Büyük Klasörler"])
+        for size, count, path in results['dirs']:
+            self.make_size_item(dirs_item, path, path, size, count, True)
+        files_item = QTreeWidgetItem(self.largest_tree, ["En Büyük Dosyalar"])
+        for size, path in results['files']:
+            self.make_size_item(files_item, path, path, size, 1, False)
+
+        self.largest_tree.setSortingEnabled(True)
+        dirs_item.setExpanded(True)
+        files_item.setExpanded(True)
+        self.status_bar.showMessage("En büyük dosya ve klasörler bulundu")
+
+    def expand_largest_item(self, item):
+        """Klasör ilk açıldığında içeriğini arka planda yükle"""
+        path = item.data(0, Qt.UserRole)
+        if not path or item.childCount():
+            return
+        QTreeWidgetItem(item, ["Yükleniyor..."])
+        if path in self.children_workers:
+            # Aynı klasör ağaçta birden fazla yerde olabilir; tek tarama yeterli
+            self.children_workers[path][1].append(item)
+            return
+        worker = FolderChildrenWorker(path, self.get_size_index())
+        worker.children_loaded.connect(self.display_children)
+        self.children_workers[path] = (worker, [item])
+        worker.start()
+
+    def display_children(self, path, children):
+        worker, items = self.children_workers.pop(path)
+        worker.wait()
+        self.largest_tree.setSortingEnabled(False)
+        for item in items:
+            item.takeChildren()
+            for child in children:
+                self.make_size_item(item, child['name'], child['path'], child['size'], child['count'],
+                                    child['is_dir'])
+            if not children:
+                item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicator)
+        self.largest_tree.setSortingEnabled(True)
+
+    def start_cleaning(self):
+        """Temizleme işlemini başlat"""
+        options = {
+            'temp_files': self.temp_check.isChecked(),
+            'prefetch': self.prefetch_check.isChecked(),
+            'browser_cache': self.browser_check.isChecked(),
+            'app_cache': self.app_cache_check.isChecked(),
+            'duplicates': self.duplicates_check.isChecked(),
+            'recycle_bin': self.recycle_check.isChecked(),
+            'software_distribution': self.update_check.isChecked()
+        }
+        
+        self.start_cleaning_with_options(options)
+
+    def start_cleaning_with_options(self, options, auto=False, scheduled=False):
+        """Seçeneklerle temizleme başlat.
+
+        auto=True ise (zamanlayıcı, disk doluluğu, ertelenen hedefler) onay
+        sorulmaz ve silme düşük öncelikle çalışır. scheduled=True ise temizlik
+        AutoCleanScheduler üzerinden yapılır: ön plan yükünde duraklar ve son
+        çalışma zamanı kaydedilir.
+        """
+        if not any(options.values()):
+            QMessageBox.warning(self, "Uyarı", "Lütfen en az bir temizleme seçeneği seçin!")
+            return
+        
+        if auto:
+            reply = QMessageBox.Yes
+        else:
+            reply = QMessageBox.question(self, "Onay", 
+                                       "Temizleme işlemini başlatmak istediğinizden emin misiniz?\n\n"
+                                       "Bu işlem geri alınamaz!",
+                                       QMessageBox.Yes | QMessageBox.No)
+        
+        if reply == QMessageBox.Yes:
+            # Ayarlar sekmesindeki güncel değerler bu temizlikte geçerli olsun
+            self.save_settings()
+            self.cleaner_worker = CleanerWorker(options, self.settings.get('delete_workers'), self.get_size_index(),
+                                                self.settings.get('retention_rules'), self.scan_snapshot,
+                                                self.duplicate_groups if options.get('duplicates') else None,
+                                                default_metrics_path(), self.auto_scheduler() if scheduled else None,
+                                                self.event_bus, low_priority=auto)
+            self.auto_cleaning = auto
+            # Temizlikten sonra anlık görüntü ve silinen kopyaların listesi geçersizdir
+            self.scan_snapshot = None
+            if options.get('duplicates'):
+                self.set_duplicate_groups([])
+            self.category_metrics = {}
+            self.cleaner_worker.finished_signal.connect(self.cleaning_finished)
+            self.cleaner_worker.error_signal.connect(self.cleaning_error)
+            self.cleaner_worker.start()
+            self.event_timer.start()
+            
+            self.progress_bar.setVisible(True)
+            self.set_cleaning_controls(True)
+            self.status_bar.showMessage("Temizleme işlemi başlatıldı...")
+
+    def set_cleaning_controls(self, running):
+        """Temizlik sürerken başlatma düğmelerini kapat, iptal/duraklat düğmelerini aç"""
+        self.clean_btn.setEnabled(not running)
+        self.analyze_btn.setEnabled(not running)
+        self.pause_btn.setEnabled(running)
+        self.pause_btn.setText("Duraklat")
+        self.cancel_btn.setEnabled(running)
+
+    def toggle_pause(self):
+        """Temizliği duraklat / devam ettir"""
+        if not self.cleaner_worker:
+            return
+        if self.pause_btn.text() == "Duraklat":
+            self.cleaner_worker.pause()
+            self.pause_btn.setText("Devam Et")
+            self.status_bar.showMessage("Temizlik duraklatıldı")
+        else:
+            self.cleaner_worker.resume()
+            self.pause_btn.setText("Duraklat")
+            self.status_bar.showMessage("Temizlik devam ediyor...")
+
+    def cancel_cleaning(self):
+        """Temizliği durdur; o ana kadar silinenler raporlanır"""
+        if self.cleaner_worker:
+            self.cleaner_worker.cancel()
+            self.pause_btn.setEnabled(False)
+            self.cancel_btn.setEnabled(False)
+            self.status_bar.showMessage("Temizlik iptal ediliyor...")
+
+    def drain_events(self):
+        """İşçilerin biriken olaylarını işle; ara ilerleme mesajları hiç metne çevrilmez"""
+        progress, events = self.event_bus.drain()
+        for kind, payload in events:
+            if kind == 'metrics':
+                self.record_metrics(payload)
+        if progress is not None:
+            self.update_progress(*progress)
+        elif not events and not self.workers_running():
+            self.event_timer.stop()
+
+    def workers_running(self):
+        workers = (self.cleaner_worker, self.analyzer_worker, self.snapshot_worker, self.largest_worker,
+                   self.duplicates_worker)
+        if any(worker is not None and worker.isRunning() for worker in workers):
+            return True
+        # Arka planda silinen mezar taşlarının ölçümleri de beklenir
+        purge_thread = self.cleaner_worker.cleaner.purge_thread if self.cleaner_worker else None
+        return purge_thread is not None and purge_thread.is_alive()
+
+    def update_progress(self, value, message):
+        """İlerlemeyi güncelle; message str ya da fastertale.progress.Message olabilir"""
+        self.progress_bar.setValue(value)
+        self.status_bar.showMessage(str(message))
+
+    def record_metrics(self, record):
+        if record.get('event') == 'category':
+            self.category_metrics[record['category']] = record
+        elif record.get('event') == 'purge':
+            self.record_purge(record)
+
+    def record_purge(self, record):
+        """Arka planda silinen mezar taşını son temizliğin sonucuna kat"""
+        results = self.last_results
+        if record.get('run') != self.last_run_id:
+            # Silme, bitiş sinyali işlenmeden bitti; cleaning_finished katar
+            self.early_purges.append(record)
+            return
+        if record['category'] not in results:
+            return
+        self.cleaner_worker.cleaner.merge_purged(results, {record['category']: (record['freed'], record['count'])})
+        self.show_result_rows(results)
+        self.results_label.setText(f"Arka plan silmesi bitti. Kazanılan alan: "
+                                   f"{self.format_size(results['total']['freed'])}, "
+                                   f"silinen öğe: {results['total']['count']}")
+
+    def cleaning_finished(self, results):
+        """Temizleme tamamlandığında"""
+        # Son ilerleme ve kategori ölçümleri sonuçlardan önce işlenmeli
+        self.drain_events()
+        self.progress_bar.setVisible(False)
+        self.set_cleaning_controls(False)
+        self.last_results = results
+        self.last_run_id = self.cleaner_worker.cleaner.metrics.run_id
+        early_purges, self.early_purges = self.early_purges, []
+        for record in early_purges:
+            self.record_purge(record)
+        
+        total_freed = results['total']['freed']
+        total_count = results['total']['count']
+        cancelled = results['total'].get('cancelled', False)
+        
+        if cancelled:
+            summary = "Temizleme iptal edildi (kısmi sonuç)."
+        else:
+            summary = "Temizleme tamamlandı."
+        if results['total'].get('pending'):
+            summary += f" Arka planda silinecek: {self.format_size(results['total']['pending'])}."
+        deferred = results['total'].get('deferred')
+        if deferred:
+            summary += f" Uygulaması açık olduğu için ertelendi: {', '.join(deferred)}."
+        self.results_label.setText(f"{summary} Kazanılan alan: {self.format_size(total_freed)}, "
+                                   f"silinen öğe: {total_count}")
+
+        self.show_result_rows(results)
+        if cancelled:
+            self.status_bar.showMessage(f"Temizlik iptal edildi. {self.format_size(total_freed)} alan kazanıldı.")
+            return
+        if deferred:
+            self.wait_for_deferred(self.cleaner_worker.cleaner)
+
+        self.status_bar.showMessage(f"Temizlik tamamlandı! {self.format_size(total_freed)} alan kazanıldı.")
+        if self.auto_cleaning:
+            # Otomatik temizlik tepside sessizce biter; pencere açılmaz
+            self.tray_icon.showMessage("Windows Temizleyici",
+                                       f"Otomatik temizlik: {self.format_size(total_freed)} alan kazanıldı",
+                                       QSystemTrayIcon.Information, 3000)
+            return
+        
+        # Başarılı mesajı göster
+        QMessageBox.information(self, "Başarılı", 
+                              f"Temizleme işlemi başarıyla tamamlandı!\n\n"
+                              f"Kazanılan alan: {self.format_size(total_freed)}\n"
+                              f"Silinen öğe: {total_count}")
+
+    def show_result_rows(self, results):
+        labels = dict(CATEGORIES)
+        rows = [(labels.get(category, category), data['freed'], data['count'],
+                 data.get('skipped', 0), data.get('skipped_bytes', 0),
+                 self.category_metrics.get(category, {}).get('seconds', 0.0))
+                for category, data in results.items() if category != 'total']
+        self.results_model.set_source(ListRows(rows, {1: self.format_size, 4: self.format_size,
+                                                      5: lambda seconds: f"{seconds:.1f} sn"}))
+
+    def wait_for_deferred(self, cleaner):
+        """Ertelenen hedefleri uygulamaları kapanınca kendiliğinden temizle"""
+        from fastertale.processes import wait_for_exit
+        if self.exit_wait_stop is not None:
+            self.exit_wait_stop.set()
+        self.exit_wait_stop = threading.Event()
+        options = cleaner.deferred_options()
+        wait_for_exit(cleaner.deferred_processes(), lambda: self.deferred_ready.emit(options), self.exit_wait_stop)
+
+    def clean_deferred(self, options):
+        """Uygulamalar kapandı; ertelenen kategorileri sormadan temizle"""
+        if self.cleaner_worker and self.cleaner_worker.isRunning():
+            # Süren temizlik bitince yeniden dene
+            QTimer.singleShot(60 * 1000, lambda: self.clean_deferred(options))
+            return
+        self.start_cleaning_with_options(options, auto=True)
+
+    def cleaning_error(self, error_message):
+        """Temizleme hatası"""
+        self.drain_events()
+        self.progress_bar.setVisible(False)
+        self.set_cleaning_controls(False)
+        QMessageBox.critical(self, "Hata", f"Temizleme sırasında hata oluştu:\n{error_message}")
+
+    def format_size(self, size_bytes):
+        """Byte'ları okunabilir formata çevir"""
+        if size_bytes == 0:
+            return "0 B"
+            
+        for unit in ['B', 'KB', 'MB', 'GB']:
+            if size_bytes < 1024.0:
+                return f"{size_bytes:.2f} {unit}"
+            size_bytes /= 1024.0
+        return f"{size_bytes:.2f} TB"
+
+    def select_backup_folder(self):
+        """Yedekleme klasörü seç"""
+        folder = QFileDialog.getExistingDirectory(self, "Yedekleme Klasörünü Seç")
+        if folder:
+            self.settings['backup_folder'] = folder
+            self.save_settings()
+
+    def create_restore_point(self):
+        """Sistem geri yükleme noktası oluştur"""
+        try:
+            QMessageBox.information(self, "Bilgi", 
+                                  "Sistem geri yükleme noktası oluşturmak için yönetici olarak çalıştırmanız gerekebilir.")
+        except Exception as e:
+            QMessageBox.warning(self, "Uyarı", f"Geri yükleme noktası oluşturulamadı: {str(e)}")
+
+    def restart_as_admin(self):
+        """Yönetici olarak yeniden başlat"""
+        reply = QMessageBox.question(self, "Yönetici Yeniden Başlat", 
+                                   "Programı yönetici yetkileriyle yeniden başlatmak istiyor musunuz?",
+                                   QMessageBox.Yes | QMessageBox.No)
+        
+        if reply == QMessageBox.Yes:
+            try:
+                import ctypes
+                # Mevcut uygulamayı kapat ve yönetici olarak yeniden başlat
+                ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, " ".join(sys.argv), None, 1)
+                QApplication.quit()
+            except Exception as e:
+                QMessageBox.critical(self, "Hata", f"Yönetici olarak başlatılamadı: {str(e)}")
+
+    def load_settings(self):
+        """Ayarları yükle"""
+        self.settings = {
+            'auto_clean': False,
+            'auto_clean_interval': 7,
+            'pressure_clean': False,
+            'backup_folder': '',
+            'backup_enabled': False,
+            'minimize_to_tray': True,
+            'delete_workers': DEFAULT_DELETE_WORKERS,
+            'retention_rules': copy.deepcopy(DEFAULT_RULES)
+        }
+        
+        # Ayarları dosyadan yükleme
+        try:
+            if os.path.exists('cleaner_settings.json'):
+                with open('cleaner_settings.json', 'r', encoding='utf-8') as f:
+                    saved_settings = json.load(f)
+                    self.settings.update(saved_settings)
+        except Exception as e:
+            print(f"Ayarlar yüklenirken hata: {e}")
+
+    def apply_settings_to_ui(self):
+        """Ayarları Ayarlar sekmesinin alanlarına yaz (sekme kurulurken çağrılır)"""
+        self.auto_clean.setChecked(self.settings.get('auto_clean', False))
+        self.auto_clean_interval.setValue(self.settings.get('auto_clean_interval', 7))
+        self.pressure_check.setChecked(self.settings.get('pressure_clean', False))
+        low_percent, high_percent = self.pressure_thresholds()
+        self.pressure_low.setValue(int(low_percent))
+        self.pressure_high.setValue(int(high_percent))
+        self.backup_check.setChecked(self.settings.get('backup_enabled', False))
+        self.delete_workers.setValue(self.settings.get('delete_workers', DEFAULT_DELETE_WORKERS))
+        self.load_rule_fields()
+
+    def pressure_thresholds(self):
+        """(düşük, hedef) boş alan yüzdeleri; kaydedilmemişse fastertale.pressure varsayılanları"""
+        from fastertale.pressure import DEFAULT_HIGH_PERCENT, DEFAULT_LOW_PERCENT
+        return (self.settings.get('pressure_low_percent', DEFAULT_LOW_PERCENT),
+                self.settings.get('pressure_high_percent', DEFAULT_HIGH_PERCENT))
+
+    def load_rule_fields(self):
+        """Seçili kategorinin saklama kuralını alanlara yaz"""
+        rule = self.settings['retention_rules'].get(self.rule_category_key, {})
+        self.rule_min_age.setValue(rule.get('min_age_hours', 0))
+        self.rule_min_size.setValue(rule.get('min_size_kb', 0))
+        self.rule_include.setText("; ".join(rule.get('include', [])))
+        self.rule_exclude.setText("; ".join(rule.get('exclude', [])))
+
+    def store_rule_fields(self):
+        """Alanlardaki saklama kuralını seçili kategori için ayarlara yaz"""
+        self.settings['retention_rules'][self.rule_category_key] = {
+            'min_age_hours': self.rule_min_age.value(),
+            'min_size_kb': self.rule_min_size.value(),
+            'include': parse_patterns(self.rule_include.text()),
+            'exclude': parse_patterns(self.rule_exclude.text())
+        }
+
+    def rule_category_changed(self, index):
+        """Kural kategorisi değişti: öncekini kaydet, yenisini göster"""
+        self.store_rule_fields()
+        self.rule_category_key = self.rule_category.itemData(index)
+        self.load_rule_fields()
+
+    def save_settings(self):
+        """Ayarları kaydet"""
+        try:
+            # UI'dan ayarları al (Ayarlar sekmesi hiç açılmadıysa ayarlar değişmemiştir)
+            if self.settings_tab_index not in self.lazy_tabs:
+                self.settings['auto_clean'] = self.auto_clean.isChecked()
+                self.settings['auto_clean_interval'] = self.auto_clean_interval.value()
+                self.settings['pressure_clean'] = self.pressure_check.isChecked()
+                self.settings['pressure_low_percent'] = self.pressure_low.value()
+                self.settings['pressure_high_percent'] = max(self.pressure_high.value(), self.pressure_low.value())
+                self.settings['backup_enabled'] = self.backup_check.isChecked()
+                self.settings['delete_workers'] = self.delete_workers.value()
+                self.store_rule_fields()
+            if self.scheduler is not None:
+                self.scheduler.interval = self.settings['auto_clean_interval'] * 86400
+            
+            # Ayarları dosyaya kaydet
+            with open('cleaner_settings.json', 'w', encoding='utf-8') as f:
+                json.dump(self.settings, f, indent=4, ensure_ascii=False)
+                
+        except Exception as e:
+            print(f"Ayarlar kaydedilirken hata: {e}")
+
+    def quit_application(self):
+        """Uygulamadan çık"""
+        reply = QMessageBox.question(self, "Çıkış", 
+                                   "Uygulamadan çıkmak istediğinizden emin misiniz?",
+                                   QMessageBox.Yes | QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            self.save_settings()  # Çıkışta ayarları kaydet
+            # Süren temizliği yarım bırakmadan durdur
+            if self.cleaner_worker and self.cleaner_worker.isRunning():
+                self.cleaner_worker.cancel()
+                self.cleaner_worker.wait()
+            QApplication.quit()
+
+    def closeEvent(self, event):
+        """Pencere kapatma olayı"""
+        self.save_settings()  # Kapatırken ayarları kaydet
+        
+        # Sistem tepsisine gizleme seçeneği
+        if self.settings.get('minimize_to_tray', True):
+            event.ignore()
+            self.hide()
+            self.tray_icon.showMessage(
+                "Windows Temizleyici",
+                "Uygulama sistem tepsisinde çalışmaya devam ediyor",
+                QSystemTrayIcon.Information,
+                2000
+            )
+        else:
+            self.quit_application()
+
+class ModernCleanerApp(QMainWindow):
+    """Daha modern ve gelişmiş bir arayüz"""
+    
+    def __init__(self):
+        super().__init__()
+        self.cleaner_app = WindowsCleanerApp()
+        self.init_ui()
+        
+    def init_ui(self):
+        self.setWindowTitle("Windows Temizleyici Pro - Modern Arayüz")
+        self.setGeometry(100, 100, 1000, 750)
+        
+        # Modern stil
+        self.setStyleSheet("""
+            QMainWindow {
+                background-color: #2c3e50;
+            }
+            QTabWidget::pane {
+                border: 1px solid #34495e;
+                background-color: #ecf0f1;
+            }
+            QTabBar::tab {
+                background-color: #34495e;
+                color: white;
+                padding: 8px 16px;
+                margin-right: 2px;
+            }
+            QTabBar::tab:selected {
+                background-color: #3498db;
+            }
+            QPushButton {
+                background-color: #3498db;
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                border-radius: 4px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #2980b9;
+            }
+            QPushButton:pressed {
+                background-color: #21618c;
+            }
+            QCheckBox {
+                color: #2c3e50;
+                font-weight: bold;
+            }
+            QGroupBox {
+                font-weight: bold;
+                color: #2c3e50;
+                border: 2px solid #bdc3c7;
+                border-radius: 5px;
+                margin-top: 10px;
+                padding-top: 10px;
+            }
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                left: 10px;
+                padding: 0 5px 0 5px;
+            }
+        """)
+
+def check_dependencies():
+    """Gerekli kütüphaneleri kontrol et"""
+    import importlib.util
+
+    required = ['psutil', 'PyQt5']
+    # Modülleri yüklemeden sadece bulunabildiklerine bak; psutil ilk gerektiğinde yüklenir
+    return [package for package in required if importlib.util.find_spec(package) is None]
+
+def install_dependencies(missing_packages):
+    """Eksik kütüphaneleri yükle"""
+    import subprocess
+    import sys
+    
+    for package in missing_packages:
+        try:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+            print(f"[+] {package} başarıyla yüklendi")
+        except subprocess.CalledProcessError:
+            print(f"[-] {package} yüklenirken hata oluştu")
+            return False
+    return True
+
+def main():
+    # Eksik kütüphaneleri kontrol et
+    missing = check_dependencies()
+    if missing:
+        print("Eksik kütüphaneler bulundu:")
+        for package in missing:
+            print(f"  - {package}")
+        
+        response = input("Otomatik olarak yüklemek ister misiniz? (e/h): ")
+        if response.lower() in ['e', 'evet', 'y', 'yes']:
+            if not install_dependencies(missing):
+                print("Kütüphane yükleme başarısız. Lütfen manuel olarak yükleyin:")
+                for package in missing:
+                    print(f"pip install {package}")
+                return
+        else:
+            print("Lütfen eksik kütüphaneleri manuel olarak yükleyin:")
+            for package in missing:
+                print(f"pip install {package}")
+            return
+    
+    app = QApplication(sys.argv)
+    
+    # Uygulama stilini ayarla
+    app.setStyle('Fusion')
+    
+    # Modern koyu tema
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(44, 62, 80))
+    palette.setColor(QPalette.WindowText, Qt.white)
+    palette.setColor(QPalette.Base, QColor(25, 35, 45))
+    palette.setColor(QPalette.AlternateBase, QColor(44, 62, 80))
+    palette.setColor(QPalette.ToolTipBase, Qt.white)
+    palette.setColor(QPalette.ToolTipText, Qt.white)
+    palette.setColor(QPalette.Text, Qt.white)
+    palette.setColor(QPalette.Button, QColor(52, 73, 94))
+    palette.setColor(QPalette.ButtonText, Qt.white)
+    palette.setColor(QPalette.BrightText, Qt.red)
+    palette.setColor(QPalette.Link, QColor(52, 152, 219))
+    palette.setColor(QPalette.Highlight, QColor(52, 152, 219))
+    palette.setColor(QPalette.HighlightedText, Qt.black)
+    palette.setColor(QPalette.Disabled, QPalette.Button, QColor(44, 62, 80))
+    palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(127, 140, 141))
+    app.setPalette(palette)
+    
+    # Uygulama fontu
+    app.setFont(QFont("Segoe UI", 10))
+    
+    # Başlangıç mesajı
+    print("Windows Temizleyici Pro başlatılıyor...")
+    print("[+] Tüm bağımlılıklar yüklendi")
+    print("[+] Yönetici kontrolü yapıldı")
+    print("[+] GUI hazırlandı")
+    
+    window = WindowsCleanerApp()
+    window.show()
+    
+    # İlk açılışta disk analizi öner
+    if not hasattr(window, 'first_run_done'):
+        reply = QMessageBox.question(window, "Hoş Geldiniz", 
+                                   "Windows Temizleyici Pro'ya hoş geldiniz!\n\n"
+                                   "İlk olarak disk alanınızı analiz etmek ister misiniz?",
+                                   QMessageBox.Yes | QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            window.analyze_disk_space()
+        window.first_run_done = True
+    
+    sys.exit(app.exec_())
+
+if __name__ == '__main__':
+    # Paketlenmiş (PyInstaller) sürümde süreç havuzu çocuklarının arayüzü yeniden açmasını önle
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+    # Yönetici yetkisi kontrolü
+    if not is_admin():
+        print("UYARI: Program yönetici yetkisi olmadan başlatıldı. Bazı işlemler kısıtlı olabilir.")
+        print("Tam özellikler için programı 'Yönetici olarak çalıştırın'.")
+    
+    try:
+        main()
+    except Exception as e:
+        print(f"Uygulama hatası: {e}")
+        print("Lütfen aşağıdaki kütüphanelerin yüklü olduğundan emin olun:")
+        print("pip install pyqt5 psutil")
+        
+        # Hata durumunda kullanıcıya bilgi ver
+        app = QApplication(sys.argv)
+        QMessageBox.critical(None, "Başlatma Hatası", 
+                           f"Uygulama başlatılırken hata oluştu:\n\n{str(e)}\n\n"
+                           "Lütfen gerekli kütüphaneleri yükleyin:\n"
                            "pip install pyqt5 psutil")
\ No newline at end of file